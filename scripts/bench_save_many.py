@@ -0,0 +1,76 @@
+# scripts/bench_save_many.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Benchmarks per-row SQLiteSessionRepository.save against the batched save_many path.
+# Role: Infrastructure/UI/Tests/Config
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from infrastructure.persistence.sqlite.database import open_db
+from infrastructure.persistence.sqlite.session_repo import SQLiteSessionRepository
+
+
+@dataclass
+class Session:
+    session_id: str
+    item_id: str
+    session_date: date
+    hours_spent: float
+    difficulty: str = "beginner"
+    status: str = "completed"
+    points_awarded: float = 0.0
+    progress_pct: float = 0.0
+
+
+def make_sessions(n: int) -> list[Session]:
+    item_id = str(uuid4())
+    start = date(2020, 1, 1)
+    return [
+        Session(str(uuid4()), item_id, start + timedelta(days=i % 2000), 1.0)
+        for i in range(n)
+    ]
+
+
+async def bench(rows: int, chunk_size: int) -> None:
+    data = make_sessions(rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = await open_db(Path(tmp) / "per_row.db")
+        repo = SQLiteSessionRepository(db)
+        t0 = time.perf_counter()
+        for s in data:
+            await repo.save(s)
+        per_row = time.perf_counter() - t0
+        await db.close()
+
+        db = await open_db(Path(tmp) / "batched.db")
+        repo = SQLiteSessionRepository(db, chunk_size=chunk_size)
+        t0 = time.perf_counter()
+        await repo.save_many(data)
+        batched = time.perf_counter() - t0
+        await db.close()
+
+    print(f"rows={rows} chunk_size={chunk_size}")
+    print(f"  save      : {per_row:8.3f}s  ({rows / per_row:10.0f} rows/s)")
+    print(f"  save_many : {batched:8.3f}s  ({rows / batched:10.0f} rows/s)")
+    print(f"  speedup   : {per_row / batched:8.1f}x")
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="save vs save_many benchmark")
+    p.add_argument("--rows", type=int, default=10_000)
+    p.add_argument("--chunk-size", type=int, default=500)
+    args = p.parse_args()
+    asyncio.run(bench(args.rows, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# scripts/bench_session_dto.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Benchmarks SessionDTO copies in LogSessionUseCase: model_dump/re-validate round trips against model_copy.
+# Role: Infrastructure/UI/Tests/Config
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Any, Callable, Iterator
+from uuid import UUID, uuid4
+
+import core.usecases.log_session as log_session
+from core.types.dtos import SessionDTO
+from core.types.enums import Difficulty, SessionStatus
+from core.usecases.log_session import LogSessionUseCase
+from infrastructure.persistence.memory.session_repo import InMemorySessionRepository
+
+
+def make_sessions(n: int) -> list[SessionDTO]:
+    item_id = uuid4()
+    start = date(2020, 1, 1)
+    return [
+        SessionDTO(
+            item_id=item_id,
+            language_code="py",
+            session_date=start + timedelta(days=i % 2000),
+            hours_spent=1.0,
+            difficulty=Difficulty.intermediate,
+            status=SessionStatus.completed,
+            tags=["bench"],
+        )
+        for i in range(n)
+    ]
+
+
+# The copies LogSessionUseCase made before switching to model_copy
+def _legacy_with_points(session: Any, pts: float) -> Any:
+    data = session.model_dump()
+    data["points_awarded"] = pts
+    return SessionDTO(**data)
+
+
+def _legacy_with_results(
+    saved: Any, progress_pct: float, pts: float, streak_current: int
+) -> Any:
+    data = saved.model_dump()
+    data.update(
+        progress_pct=progress_pct, points_awarded=pts, streak_current=streak_current
+    )
+    return type(saved)(**data)
+
+
+@contextmanager
+def legacy_copies() -> Iterator[None]:
+    saved = log_session._with_points, log_session._with_results
+    log_session._with_points = _legacy_with_points
+    log_session._with_results = _legacy_with_results
+    try:
+        yield
+    finally:
+        log_session._with_points, log_session._with_results = saved
+
+
+class Items:
+    def __init__(self, item_id: UUID):
+        # carry every rollup field so execute stays on the O(1) path
+        self.row = {
+            "item_id": str(item_id),
+            "target_hours": 1e6,
+            "total_hours": 0.0,
+            "progress_pct": 0.0,
+            "streak_current": 0,
+            "streak_longest": 0,
+            "last_session_date": None,
+            "streak_state": None,
+        }
+
+    async def get_by_id(self, item_id: Any) -> dict:
+        return self.row
+
+    async def save(self, item: dict) -> dict:
+        self.row = item
+        return item
+
+
+class Config:
+    async def get(self, key: str) -> dict:
+        return {}
+
+
+def per_session(fn: Callable[[], Any], n: int) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def execute_all(data: list[SessionDTO]) -> None:
+    use = LogSessionUseCase(
+        InMemorySessionRepository(), Items(data[0].item_id), Config()
+    )
+
+    async def run() -> None:
+        for s in data:
+            await use.execute(s)
+
+    asyncio.run(run())
+
+
+def bench(rows: int) -> None:
+    data = make_sessions(rows)
+    update = {"points_awarded": 1.3, "progress_pct": 5.0, "streak_current": 3}
+
+    dump = per_session(lambda: [_legacy_with_points(s, 1.3) for s in data], rows)
+    copy = per_session(lambda: [s.model_copy(update=update) for s in data], rows)
+    with legacy_copies():
+        before = per_session(lambda: execute_all(data), rows)
+    after = per_session(lambda: execute_all(data), rows)
+
+    print(f"rows={rows}  (microseconds per session)")
+    print(f"  model_dump + SessionDTO(**d) : {dump:8.2f}")
+    print(f"  model_copy(update=...)       : {copy:8.2f}")
+    print(f"  execute, re-validating copies: {before:8.2f}")
+    print(f"  execute, model_copy          : {after:8.2f}")
+    print(f"  saved per execute            : {before - after:8.2f}")
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="SessionDTO copy overhead benchmark")
+    p.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000])
+    args = p.parse_args()
+    for rows in args.rows:
+        bench(rows)
+
+
+if __name__ == "__main__":
+    main()
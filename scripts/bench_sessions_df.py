@@ -0,0 +1,78 @@
+# scripts/bench_sessions_df.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Benchmarks the row-by-row append_session fold against the bulk sessions_df_from_dtos builder.
+# Role: Infrastructure/UI/Tests/Config
+
+from __future__ import annotations
+
+import argparse
+import time
+import warnings
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from core.dataframes.schemas import (
+    append_session,
+    empty_sessions_df,
+    sessions_df_from_dtos,
+)
+from core.types.dtos import SessionDTO
+from core.types.enums import Difficulty, SessionStatus
+
+
+def make_sessions(n: int) -> list[SessionDTO]:
+    item_id = uuid4()
+    start = date(2020, 1, 1)
+    now = datetime.now(timezone.utc)
+    return [
+        SessionDTO(
+            item_id=item_id,
+            language_code="py",
+            session_date=start + timedelta(days=i % 2000),
+            hour_spent=1.0,
+            difficulty=Difficulty.beginner,
+            status=SessionStatus.completed,
+            tags=["bench"] if i % 2 else [],
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+def bench(rows: int, legacy_max: int) -> None:
+    data = make_sessions(rows)
+    t0 = time.perf_counter()
+    df = sessions_df_from_dtos(data)
+    bulk = time.perf_counter() - t0
+    assert len(df) == rows
+
+    print(f"rows={rows}")
+    print(f"  sessions_df_from_dtos : {bulk:8.3f}s  ({rows / bulk:10.0f} rows/s)")
+    if rows > legacy_max:
+        print("  append_session fold   : skipped (O(n^2); rows > --legacy-max)")
+        return
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        t0 = time.perf_counter()
+        legacy = empty_sessions_df()
+        for s in data:
+            legacy = append_session(legacy, s)
+        folded = time.perf_counter() - t0
+    print(f"  append_session fold   : {folded:8.3f}s  ({rows / folded:10.0f} rows/s)")
+    print(f"  speedup               : {folded / bulk:8.1f}x")
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="append_session vs bulk builder benchmark")
+    p.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    p.add_argument("--legacy-max", type=int, default=2_000)
+    args = p.parse_args()
+    for rows in args.rows:
+        bench(rows, args.legacy_max)
+
+
+if __name__ == "__main__":
+    main()
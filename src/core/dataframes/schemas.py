@@ -7,14 +7,25 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timezone
-from typing import Dict, Iterable
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 from uuid import UUID
 
 import numpy as np
 import pandas as pd
-from pandas import DatetimeTZDtype
+from pandas import CategoricalDtype, DatetimeTZDtype
 
 from core.types.dtos import ItemDTO, LanguageDTO, SessionDTO
+from core.types.enums import Difficulty, SessionStatus
+
+try:  # optional: Arrow-backed storage for id strings and tag lists
+    import pyarrow as pa
+
+    _ID_STRING: object = pd.StringDtype("pyarrow")
+    TAGS_DTYPE: object = pd.ArrowDtype(pa.list_(pa.string()))
+except ImportError:  # pyarrow not installed; see test_tags
+    _ID_STRING = "string"
+    TAGS_DTYPE = np.dtype(object)  # Python lists
 
 # ---------- Canonical schemas (column -> dtype) ----------
 
@@ -29,7 +40,7 @@ SESSIONS_SCHEMA: Dict[str, object] = {
     "difficulty": "string",
     "status": "string",
     "topic": "string",
-    "tags": "string",  # JSON-ish serialized list; simple start
+    "tags": TAGS_DTYPE,  # list of tag strings; [] when untagged
     "notes": "string",
     "points_awarded": "Float64",
     "progress_pct": "Float64",
@@ -62,13 +73,25 @@ LANGUAGES_SCHEMA: Dict[str, object] = {
     "updated_at": UTC,
 }
 
+# Compact variant of SESSIONS_SCHEMA for large frames: enum columns become
+# categoricals seeded from core.types.enums, repeating ids/codes become
+# dictionary-encoded categoricals, and unique ids use Arrow strings when
+# pyarrow is installed. Converts losslessly to and from SESSIONS_SCHEMA; a
+# difficulty/status outside its enum raises ValueError instead of becoming NA.
+SESSIONS_COMPACT_SCHEMA: Dict[str, object] = {
+    **SESSIONS_SCHEMA,
+    "session_id": _ID_STRING,
+    "item_id": "category",
+    "language_code": "category",
+    "difficulty": CategoricalDtype([d.value for d in Difficulty]),
+    "status": CategoricalDtype([s.value for s in SessionStatus]),
+}
+
 # ---------- Factory helpers ----------
 
 
 def _empty_df(schema: Dict[str, object]) -> pd.DataFrame:
-    df = pd.DataFrame(
-        {col: pd.Series(dtype=str(dtype)) for col, dtype in schema.items()}
-    )
+    df = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in schema.items()})
     # Ensure timezone dtypes are applied even when empty
     for col, dtype in schema.items():
         if isinstance(dtype, DatetimeTZDtype):
@@ -88,9 +111,11 @@ def empty_languages_df() -> pd.DataFrame:
     return _empty_df(LANGUAGES_SCHEMA)
 
 
-# ---------- Coercion helpers ----------
+def empty_compact_sessions_df() -> pd.DataFrame:
+    return to_compact_sessions_df(empty_sessions_df(), inplace=True)
 
-from typing import Any
+
+# ---------- Coercion helpers ----------
 
 
 def _to_utc_dt(value: Any) -> pd.Timestamp | type(pd.NaT):
@@ -106,57 +131,183 @@ def _to_utc_dt(value: Any) -> pd.Timestamp | type(pd.NaT):
     ts = pd.to_datetime(value, errors="coerce", utc=True)
 
 
+def _to_utc(s: pd.Series) -> pd.Series:
+    if isinstance(s.dtype, DatetimeTZDtype):
+        return s.dt.tz_convert("UTC").dt.as_unit("ns")
+    return pd.to_datetime(s, errors="coerce", utc=True).dt.as_unit("ns")
+
+
+def _tag_list(value: Any) -> List[str]:
+    if (
+        value is None
+        or value is pd.NA
+        or (isinstance(value, float) and np.isnan(value))
+    ):
+        return []
+    if isinstance(value, str):
+        # legacy comma-joined form
+        return [t.strip() for t in value.split(",") if t.strip()]
+    return [str(t) for t in value]
+
+
+def _to_tags(s: pd.Series) -> pd.Series:
+    values = [_tag_list(v) for v in s]
+    if isinstance(TAGS_DTYPE, np.dtype):
+        out = pd.Series(np.empty(len(values), dtype=object), index=s.index)
+        out[:] = values
+        return out
+    return pd.Series(pd.array(values, dtype=TAGS_DTYPE), index=s.index)
+
+
+def _to_nullable_numeric(dtype: object) -> Callable[[pd.Series], pd.Series]:
+    def convert(s: pd.Series) -> pd.Series:
+        try:
+            return s.astype(dtype)
+        except TypeError:
+            # Some mixed objects → try to_numeric
+            return pd.to_numeric(s, errors="coerce").astype(dtype)
+
+    return convert
+
+
+def _to_categories(dtype: CategoricalDtype) -> Callable[[pd.Series], pd.Series]:
+    def convert(s: pd.Series) -> pd.Series:
+        out = s.astype(dtype)
+        # astype maps values outside the categories to NA without a word
+        lost = out.isna() & s.notna()
+        if lost.any():
+            unknown = sorted({str(v) for v in s[lost].unique()})
+            raise ValueError(f"{s.name}: {unknown} not in {list(dtype.categories)}")
+        return out
+
+    return convert
+
+
+def _to_dtype(dtype: object) -> Callable[[pd.Series], pd.Series]:
+    def convert(s: pd.Series) -> pd.Series:
+        try:
+            return s.astype(dtype)
+        except TypeError:
+            return s.astype("string").astype(dtype)
+
+    return convert
+
+
+class CoercionPlan:
+    """Schema coercion compiled once: one (column, dtype, converter) step per
+    column. `apply` leaves columns whose dtype already matches untouched, so
+    a conforming frame costs a dtype comparison per column and nothing else.
+    """
+
+    def __init__(self, schema: Dict[str, object]):
+        self.columns: List[str] = list(schema)
+        self.steps: List[Tuple[str, object, Callable[[pd.Series], pd.Series]]] = []
+        for col, dtype in schema.items():
+            if dtype is TAGS_DTYPE:
+                convert = _to_tags
+            elif isinstance(dtype, DatetimeTZDtype):
+                convert = _to_utc
+            elif dtype == "string":
+                convert = lambda s, _d=dtype: s.astype(_d)
+            elif dtype in ("Int64", "Float64"):
+                convert = _to_nullable_numeric(dtype)
+            elif isinstance(dtype, CategoricalDtype) and dtype.categories is not None:
+                convert = _to_categories(dtype)
+            else:
+                convert = _to_dtype(dtype)
+            self.steps.append((col, pd.api.types.pandas_dtype(dtype), convert))
+
+    def apply(
+        self, df: pd.DataFrame, allow_extra: bool = False, inplace: bool = False
+    ) -> pd.DataFrame:
+        """Coerce `df` to the schema.
+
+        By default `df` is copied first. With `inplace=True` the caller's frame
+        is modified and no defensive copy is made; always use the returned
+        frame, since selecting/reordering columns yields a new one.
+        """
+        if not inplace:
+            df = df.copy()
+        # Add missing cols
+        for col, dtype, convert in self.steps:
+            if col in df.columns:
+                continue
+            if convert is _to_tags:
+                # untagged is [], not NA
+                df[col] = _to_tags(pd.Series(None, index=df.index, dtype=object))
+            else:
+                df[col] = pd.Series(pd.NA, index=df.index, dtype=dtype)
+
+        # Drop extras if not allowed (no-op when already in schema order)
+        if not allow_extra and list(df.columns) != self.columns:
+            df = df[self.columns]
+
+        for col, dtype, convert in self.steps:
+            # an object dtype says nothing about the values, so always convert
+            if df[col].dtype != dtype or dtype == np.dtype(object):
+                df[col] = convert(df[col])
+        return df
+
+
+@lru_cache(maxsize=None)
+def _compile(items: Tuple[Tuple[str, object], ...]) -> CoercionPlan:
+    return CoercionPlan(dict(items))
+
+
+def coercion_plan(schema: Dict[str, object]) -> CoercionPlan:
+    """Compiled plan for `schema`, cached by the schema's (column, dtype) pairs."""
+    return _compile(tuple(schema.items()))
+
+
 def _coerce_df(
     df: pd.DataFrame, schema: Dict[str, object], allow_extra: bool = False
 ) -> pd.DataFrame:
-    # Add missing cols
-    for col, dtype in schema.items():
-        if col not in df.columns:
-            df[col] = pd.Series(
-                [pd.NA] * len(df),
-                dtype=dtype if not isinstance(dtype, DatetimeTZDtype) else dtype,
-            )
+    return coercion_plan(schema).apply(df, allow_extra=allow_extra, inplace=True)
 
-    # Drop extras if not allowed
-    if not allow_extra:
-        df = df[[*schema.keys()]]
 
-    # Coerce types
-    for col, dtype in schema.items():
-        if isinstance(dtype, DatetimeTZDtype):
-            # Handle timezone conversion properly
-            df[col] = pd.to_datetime(df[col], errors="coerce", utc=True)
-            if df[col].dt.tz is None:
-                df[col] = df[col].dt.tz_localize("UTC")
-            else:
-                df[col] = df[col].dt.tz_convert("UTC")
-        else:
-            # Special-case string columns: ensure pandas string dtype
-            if dtype == "string":
-                df[col] = df[col].astype("string")
-            else:
-                # Int64/Float64 nullable handling
-                try:
-                    df[col] = df[col].astype(dtype)
-                except TypeError:
-                    # Some mixed objects → try to_numeric where applicable
-                    if dtype in ("Int64", "Float64"):
-                        df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
-                    else:
-                        df[col] = df[col].astype("string").astype(dtype)
-    return df
+def coerce_sessions_df(
+    df: pd.DataFrame, allow_extra: bool = False, inplace: bool = False
+) -> pd.DataFrame:
+    return coercion_plan(SESSIONS_SCHEMA).apply(df, allow_extra, inplace)
 
 
-def coerce_sessions_df(df: pd.DataFrame, allow_extra: bool = False) -> pd.DataFrame:
-    return _coerce_df(df.copy(), SESSIONS_SCHEMA, allow_extra=allow_extra)
+def coerce_items_df(
+    df: pd.DataFrame, allow_extra: bool = False, inplace: bool = False
+) -> pd.DataFrame:
+    return coercion_plan(ITEMS_SCHEMA).apply(df, allow_extra, inplace)
+
 
+def coerce_languages_df(
+    df: pd.DataFrame, allow_extra: bool = False, inplace: bool = False
+) -> pd.DataFrame:
+    return coercion_plan(LANGUAGES_SCHEMA).apply(df, allow_extra, inplace)
 
-def coerce_items_df(df: pd.DataFrame, allow_extra: bool = False) -> pd.DataFrame:
-    return _coerce_df(df.copy(), ITEMS_SCHEMA, allow_extra=allow_extra)
 
+def to_compact_sessions_df(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+    """Convert a sessions frame to `SESSIONS_COMPACT_SCHEMA`."""
+    return coercion_plan(SESSIONS_COMPACT_SCHEMA).apply(df, inplace=inplace)
 
-def coerce_languages_df(df: pd.DataFrame, allow_extra: bool = False) -> pd.DataFrame:
-    return _coerce_df(df.copy(), LANGUAGES_SCHEMA, allow_extra=allow_extra)
+
+def from_compact_sessions_df(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+    """Convert a compact sessions frame back to `SESSIONS_SCHEMA`."""
+    return coerce_sessions_df(df, inplace=inplace)
+
+
+def sessions_memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """Deep memory usage per column of `df` in both sessions layouts.
+
+    Returns one row per column plus a `total` row, with `standard_bytes`,
+    `compact_bytes` and `saved_pct`.
+    """
+    standard = coerce_sessions_df(df).memory_usage(index=False, deep=True)
+    compact = to_compact_sessions_df(df).memory_usage(index=False, deep=True)
+    report = pd.DataFrame({"standard_bytes": standard, "compact_bytes": compact})
+    report.loc["total"] = report.sum()
+    saved = 1 - report["compact_bytes"] / report["standard_bytes"].where(
+        report["standard_bytes"] > 0
+    )
+    report["saved_pct"] = (saved * 100).round(1)
+    return report
 
 
 # ---------- Append helpers from DTOs ----------
@@ -178,7 +329,7 @@ def append_session(df: pd.DataFrame, dto: SessionDTO) -> pd.DataFrame:
         "difficulty": dto.difficulty.value,
         "status": dto.status.value,
         "topic": dto.topic,
-        "tags": ",".join(dto.tags) if dto.tags else None,
+        "tags": list(dto.tags),
         "notes": dto.notes,
         "points_awarded": dto.points_awarded,
         "progress_pct": dto.progress_pct,
@@ -194,7 +345,7 @@ def append_session(df: pd.DataFrame, dto: SessionDTO) -> pd.DataFrame:
         df = new_row_df
     else:
         df = pd.concat([df, new_row_df], ignore_index=True)
-    return coerce_sessions_df(df)
+    return coerce_sessions_df(df, inplace=True)
 
 
 def append_item(df: pd.DataFrame, dto: ItemDTO) -> pd.DataFrame:
@@ -211,7 +362,7 @@ def append_item(df: pd.DataFrame, dto: ItemDTO) -> pd.DataFrame:
         "version": dto.version,
     }
     df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
-    return coerce_items_df(df)
+    return coerce_items_df(df, inplace=True)
 
 
 def append_language(df: pd.DataFrame, dto: LanguageDTO) -> pd.DataFrame:
@@ -227,12 +378,80 @@ def append_language(df: pd.DataFrame, dto: LanguageDTO) -> pd.DataFrame:
         "updated_at": dto.updated_at,
     }
     df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
-    return coerce_languages_df(df)
+    return coerce_languages_df(df, inplace=True)
+
+
+# ---------- Bulk builders ----------
+
+# Columns filled from float DTO fields go straight into float64 buffers; the
+# rest are object buffers that the sessions plan converts once per build.
+_FLOAT_SESSION_COLUMNS = ("hour_spent", "points_awarded", "progress_pct")
+
+
+def sessions_df_from_dtos(sessions: Iterable[SessionDTO]) -> pd.DataFrame:
+    """Build a `SESSIONS_SCHEMA` frame from many sessions in O(n).
+
+    Rows are written column by column into buffers sized up front, and the
+    frame is coerced exactly once. Produces the same values and dtypes as
+    folding `append_session` over `sessions`.
+    """
+    rows = sessions if isinstance(sessions, (list, tuple)) else list(sessions)
+    n = len(rows)
+    if n == 0:
+        return empty_sessions_df()
+
+    cols: Dict[str, np.ndarray] = {
+        col: np.empty(n, dtype=np.float64 if col in _FLOAT_SESSION_COLUMNS else object)
+        for col in SESSIONS_SCHEMA
+    }
+    session_id, item_id = cols["session_id"], cols["item_id"]
+    language_code, session_date = cols["language_code"], cols["session_date"]
+    hour_spent, difficulty, status = (
+        cols["hour_spent"],
+        cols["difficulty"],
+        cols["status"],
+    )
+    topic, tags, notes = cols["topic"], cols["tags"], cols["notes"]
+    points_awarded, progress_pct = cols["points_awarded"], cols["progress_pct"]
+    session_number, version = cols["session_number"], cols["version"]
+    started_at, ended_at = cols["started_at"], cols["ended_at"]
+    created_at, updated_at = cols["created_at"], cols["updated_at"]
+
+    for i, dto in enumerate(rows):
+        session_id[i] = str(dto.session_id)
+        item_id[i] = str(dto.item_id)
+        language_code[i] = dto.language_code
+        session_date[i] = _iso_date(dto.session_date)
+        hour_spent[i] = dto.hours_spent
+        difficulty[i] = dto.difficulty.value
+        status[i] = dto.status.value
+        topic[i] = dto.topic
+        tags[i] = list(dto.tags)
+        notes[i] = dto.notes
+        points_awarded[i] = dto.points_awarded
+        progress_pct[i] = dto.progress_pct
+        session_number[i] = dto.session_number
+        started_at[i] = dto.started_at
+        ended_at[i] = dto.ended_at
+        created_at[i] = dto.created_at
+        updated_at[i] = dto.updated_at
+        version[i] = dto.version
+
+    # the frame is ours, so coerce it without the defensive copy
+    return coerce_sessions_df(pd.DataFrame(cols, copy=False), inplace=True)
+
+
+def append_sessions(df: pd.DataFrame, sessions: Iterable[SessionDTO]) -> pd.DataFrame:
+    """Append a batch of sessions with one concat instead of one per row."""
+    batch = sessions_df_from_dtos(sessions)
+    if df.empty:
+        return batch
+    if batch.empty:
+        return coerce_sessions_df(df)
+    return coerce_sessions_df(pd.concat([df, batch], ignore_index=True), inplace=True)
 
 
 def append_sessions_from_iterable(
     df: pd.DataFrame, sessions: Iterable[SessionDTO]
 ) -> pd.DataFrame:
-    for session in sessions:
-        df = append_session(df, session)
-    return df
+    return append_sessions(df, sessions)
@@ -0,0 +1,156 @@
+# src/core/dataframes/tags.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Exploded (session position, tag) index over the list-typed `tags` column for lookup-based tag queries.
+# Role: Core logic
+
+from __future__ import annotations
+
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["TagIndex", "tag_index"]
+
+# (owner, data address) of a column's storage; see `_storage`
+_Storage = Tuple[Any, int]
+
+
+def _storage(df: pd.DataFrame, col: str) -> Optional[_Storage]:
+    if col not in df.columns:
+        return None
+    arr = df[col].array
+    if isinstance(arr, pd.arrays.NumpyExtensionArray):
+        # numpy-backed columns get a fresh wrapper (and view) on every access,
+        # so key on the buffer behind it; holding its owner keeps the address
+        # from being reused by a replacement column
+        values = arr.to_numpy()
+        owner = values.base if values.base is not None else values
+        return owner, values.__array_interface__["data"][0]
+    return arr, 0
+
+
+def _same(a: Optional[_Storage], b: Optional[_Storage]) -> bool:
+    if a is None or b is None:
+        return a is b
+    return a[0] is b[0] and a[1] == b[1]
+
+
+class TagIndex:
+    """Sessions grouped by tag, built once from a sessions frame.
+
+    The `tags` column is exploded a single time into `(session_idx, tag)`
+    pairs, where `session_idx` is the row position in the frame. Pairs are
+    sorted by tag so each tag maps to one contiguous slice of positions.
+    """
+
+    def __init__(
+        self, df: pd.DataFrame, hours_column: str = "hour_spent", *, weak: bool = False
+    ):
+        # `weak=True` (used by `tag_index`) keeps the cache from pinning frames
+        self._frame: Callable[[], pd.DataFrame | None] = (
+            weakref.ref(df) if weak else (lambda: df)
+        )
+        exploded = df["tags"].reset_index(drop=True).explode().dropna()
+        codes, uniques = pd.factorize(exploded, sort=True)
+        order = np.argsort(codes, kind="stable")
+        self._positions = exploded.index.to_numpy(dtype=np.int64)[order]
+        self._tags: List[str] = [str(t) for t in uniques]
+        bounds = np.concatenate(
+            ([0], np.cumsum(np.bincount(codes, minlength=len(uniques))))
+        )
+        self._slices: Dict[str, slice] = {
+            tag: slice(int(bounds[i]), int(bounds[i + 1]))
+            for i, tag in enumerate(self._tags)
+        }
+        self._codes = codes[order]
+        self._hours_column = hours_column
+        self._hours: pd.Series | None = None
+        # storage of the columns the index was built from, for staleness checks
+        self._rows = len(df)
+        self._tags_storage = _storage(df, "tags")
+        self._hours_storage = _storage(df, hours_column)
+
+    @property
+    def _df(self) -> pd.DataFrame:
+        df = self._frame()
+        if df is None:
+            raise ReferenceError("the indexed DataFrame no longer exists")
+        return df
+
+    @property
+    def tags(self) -> List[str]:
+        """Distinct tags, sorted."""
+        return list(self._tags)
+
+    @property
+    def exploded(self) -> pd.DataFrame:
+        """The `(session_idx, tag)` pairs, grouped by tag."""
+        return pd.DataFrame(
+            {
+                "session_idx": self._positions,
+                "tag": np.asarray(self._tags, dtype=object)[self._codes],
+            }
+        )
+
+    def positions(self, tag: str) -> np.ndarray:
+        """Row positions of sessions carrying `tag` (empty when unknown)."""
+        s = self._slices.get(tag)
+        return self._positions[s] if s is not None else self._positions[:0]
+
+    def sessions_with(self, tag: str) -> pd.DataFrame:
+        """Sessions carrying `tag`, in frame order."""
+        return self._df.iloc[np.sort(self.positions(tag))]
+
+    def count(self, tag: str) -> int:
+        s = self._slices.get(tag)
+        return s.stop - s.start if s is not None else 0
+
+    def hours_per_tag(self) -> pd.Series:
+        """Total hours per tag; a session with several tags counts for each."""
+        if self._hours is None:
+            if self._hours_column in self._df.columns:
+                hours = self._df[self._hours_column].to_numpy(
+                    dtype=np.float64, na_value=0.0
+                )
+            else:
+                hours = np.zeros(len(self._df))
+            totals = np.bincount(
+                self._codes, weights=hours[self._positions], minlength=len(self._tags)
+            )
+            self._hours = pd.Series(
+                totals, index=pd.Index(self._tags, name="tag"), name="hours"
+            )
+        return self._hours
+
+    def is_current_for(self, df: pd.DataFrame) -> bool:
+        return (
+            df is self._frame()
+            and len(df) == self._rows
+            and _same(_storage(df, "tags"), self._tags_storage)
+            and _same(_storage(df, self._hours_column), self._hours_storage)
+        )
+
+
+# id(frame) -> index; entries are dropped when the frame is collected
+_CACHE: Dict[int, TagIndex] = {}
+
+
+def tag_index(df: pd.DataFrame) -> TagIndex:
+    """Cached `TagIndex` for `df`.
+
+    The index is rebuilt when the frame's `tags` or hours column has been
+    replaced or its length changed; in-place edits of individual cells are
+    not tracked, so build a fresh `TagIndex` after those.
+    """
+    key = id(df)
+    cached = _CACHE.get(key)
+    if cached is not None and cached.is_current_for(df):
+        return cached
+    if cached is None:
+        weakref.finalize(df, _CACHE.pop, key, None)
+    index = TagIndex(df, weak=True)
+    _CACHE[key] = index
+    return index
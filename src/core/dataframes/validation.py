@@ -0,0 +1,83 @@
+# src/core/dataframes/validation.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Vectorized checks of a sessions DataFrame against the SessionDTO rules, reporting offending rows.
+# Role: Core logic
+
+from __future__ import annotations
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from core.types.enums import SessionStatus
+
+__all__ = [
+    "HOURS_OUT_OF_RANGE",
+    "HOURS_NOT_QUARTER",
+    "NEGATIVE_POINTS",
+    "NEGATIVE_PROGRESS",
+    "CANCELLED_NOT_ZEROED",
+    "session_violations",
+    "invalid_session_rows",
+]
+
+# Rule names, one per SessionDTO validator
+HOURS_OUT_OF_RANGE = "hours_out_of_range"  # validate_bounds: (0, 24]
+HOURS_NOT_QUARTER = "hours_not_quarter"  # validate_bounds rounds to 0.25
+NEGATIVE_POINTS = "negative_points"  # non_negative
+NEGATIVE_PROGRESS = "negative_progress"  # non_negative
+CANCELLED_NOT_ZEROED = "cancelled_not_zeroed"  # enforce_cancelled_zeroes
+
+
+def _floats(df: pd.DataFrame, col: str, missing: float) -> np.ndarray:
+    if col not in df.columns:
+        return np.full(len(df), missing)
+    return df[col].to_numpy(dtype=np.float64, na_value=missing)
+
+
+def _masks(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    hours_col = "hour_spent" if "hour_spent" in df.columns else "hours_spent"
+    hours = _floats(df, hours_col, np.nan)
+    points = _floats(df, "points_awarded", 0.0)
+    progress = _floats(df, "progress_pct", 0.0)
+    if "status" in df.columns:
+        status = df["status"].to_numpy(dtype=object, na_value=None)
+        cancelled = status == SessionStatus.cancelled.value
+    else:
+        cancelled = np.zeros(len(df), dtype=bool)
+
+    in_range = (hours > 0) & (hours <= 24)
+    return {
+        HOURS_OUT_OF_RANGE: np.isnan(hours) | (~cancelled & ~in_range),
+        # quarter hours are exact in binary, so the comparison needs no slack
+        HOURS_NOT_QUARTER: ~cancelled & in_range & (hours * 4 != np.round(hours * 4)),
+        NEGATIVE_POINTS: points < 0,
+        NEGATIVE_PROGRESS: progress < 0,
+        CANCELLED_NOT_ZEROED: cancelled
+        & (((hours != 0) & ~np.isnan(hours)) | (points != 0) | (progress != 0)),
+    }
+
+
+def session_violations(df: pd.DataFrame) -> Dict[str, pd.Index]:
+    """Check every row against the `SessionDTO` rules at once.
+
+    Accepts `SESSIONS_SCHEMA` frames (`hour_spent`) as well as SQLite-shaped
+    ones (`hours_spent`). Returns rule name -> index labels of the rows
+    breaking it, omitting rules every row passes, so an empty dict means the
+    frame is valid. Rows are judged as a validated DTO would hold them:
+    cancelled sessions must have zero hours, points and progress, while the
+    others need hours in (0, 24] on a quarter hour (a DTO given under 0.125
+    hours rounds them to 0, which is flagged). Missing points/progress count
+    as 0 (the DTO default); missing hours are out of range.
+    """
+    return {rule: df.index[m] for rule, m in _masks(df).items() if m.any()}
+
+
+def invalid_session_rows(df: pd.DataFrame) -> pd.Index:
+    """Index labels of rows breaking any `SessionDTO` rule, in frame order."""
+    bad = np.zeros(len(df), dtype=bool)
+    for mask in _masks(df).values():
+        bad |= mask
+    return df.index[bad]
@@ -0,0 +1,161 @@
+# src/core/services/gamification.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Computes GamificationStateDTO rollups in one vectorized pass over sessions, with an incremental per-session path.
+# Role: Core logic
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any, Dict, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.services.streaks import _to_date, _to_day_array, streak_runs
+from core.types.dtos import GamificationStateDTO
+
+__all__ = ["WEEK_DAYS", "gamification_from_df", "GamificationRollup"]
+
+# "weekly" = the rolling window of WEEK_DAYS days ending at `today`
+WEEK_DAYS = 7
+
+
+def _numeric(df: pd.DataFrame, *cols: str) -> np.ndarray:
+    for col in cols:
+        if col in df.columns:
+            return df[col].to_numpy(dtype=np.float64, na_value=0.0)
+    return np.zeros(len(df))
+
+
+def _nunique(df: pd.DataFrame, col: str) -> int:
+    return int(df[col].nunique(dropna=True)) if col in df.columns else 0
+
+
+def gamification_from_df(
+    df: pd.DataFrame, *, today: Any | None = None
+) -> GamificationStateDTO:
+    """Fill every `GamificationStateDTO` field from a sessions DataFrame.
+
+    Works on `SESSIONS_SCHEMA` frames (`hour_spent`) as well as SQLite-shaped
+    ones (`hours_spent`). Session dates are converted once and reused for the
+    weekly window, the streak and `last_session_date`.
+    """
+    anchor = _to_date(today) if today is not None else date.today()
+    if df.empty:
+        return GamificationStateDTO()
+
+    days = _to_day_array(df["session_date"])
+    hours = _numeric(df, "hour_spent", "hours_spent")
+    points = _numeric(df, "points_awarded")
+
+    end = np.datetime64(anchor, "D")
+    in_week = (days <= end) & (days > end - np.timedelta64(WEEK_DAYS, "D"))
+    valid = days[~np.isnat(days)]
+
+    return GamificationStateDTO(
+        total_points=round(float(points.sum()), 2),
+        weekly_hours=float(hours[in_week].sum()),
+        weekly_sessions=int(in_week.sum()),
+        streak_days=streak_runs(valid, today=anchor).current,
+        total_sessions=len(df),
+        total_hours=float(hours.sum()),
+        total_items=_nunique(df, "item_id"),
+        total_languages=_nunique(df, "language_code"),
+        last_session_date=valid.max().item() if valid.size else None,
+    )
+
+
+def _field(obj: Any, name: str, default: Any = None) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+class GamificationRollup:
+    """Incremental counterpart of `gamification_from_df`.
+
+    `add` folds one session in O(1) (amortized); `snapshot` renders the DTO
+    for any `today`. Per-day hours/counts are kept so the weekly window and
+    the streak can be re-anchored without revisiting sessions.
+    """
+
+    def __init__(self) -> None:
+        self.total_points = 0.0
+        self.total_hours = 0.0
+        self.total_sessions = 0
+        self._items: Set[str] = set()
+        self._languages: Set[str] = set()
+        self._per_day: Dict[date, Tuple[float, int]] = {}
+        self._last: Optional[date] = None
+
+    def add(self, session: Any) -> None:
+        hours = _field(session, "hours_spent", _field(session, "hour_spent", 0.0))
+        day = _to_date(_field(session, "session_date"))
+        hours = float(hours or 0.0)
+
+        self.total_points += float(_field(session, "points_awarded", 0.0) or 0.0)
+        self.total_hours += hours
+        self.total_sessions += 1
+        item_id = _field(session, "item_id")
+        if item_id is not None:
+            self._items.add(str(item_id))
+        language = _field(session, "language_code")
+        if language:
+            self._languages.add(str(language))
+        h, n = self._per_day.get(day, (0.0, 0))
+        self._per_day[day] = (h + hours, n + 1)
+        if self._last is None or day > self._last:
+            self._last = day
+
+    def snapshot(self, *, today: Any | None = None) -> GamificationStateDTO:
+        anchor = _to_date(today) if today is not None else date.today()
+        week_hours, week_sessions = 0.0, 0
+        for k in range(WEEK_DAYS):
+            h, n = self._per_day.get(anchor - timedelta(days=k), (0.0, 0))
+            week_hours += h
+            week_sessions += n
+        streak = 0
+        while anchor - timedelta(days=streak) in self._per_day:
+            streak += 1
+        return GamificationStateDTO(
+            total_points=round(self.total_points, 2),
+            weekly_hours=week_hours,
+            weekly_sessions=week_sessions,
+            streak_days=streak,
+            total_sessions=self.total_sessions,
+            total_hours=self.total_hours,
+            total_items=len(self._items),
+            total_languages=len(self._languages),
+            last_session_date=self._last,
+        )
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> "GamificationRollup":
+        """Seed from an existing history with grouped (vectorized) sums."""
+        rollup = cls()
+        if df.empty:
+            return rollup
+        days = _to_day_array(df["session_date"])
+        hours = _numeric(df, "hour_spent", "hours_spent")
+        rollup.total_points = float(_numeric(df, "points_awarded").sum())
+        rollup.total_hours = float(hours.sum())
+        rollup.total_sessions = len(df)
+        for col, target in (
+            ("item_id", rollup._items),
+            ("language_code", rollup._languages),
+        ):
+            if col in df.columns:
+                target.update(str(v) for v in df[col].dropna().unique())
+        per_day = (
+            pd.DataFrame({"d": days, "h": hours})
+            .dropna(subset=["d"])
+            .groupby("d")["h"]
+            .agg(["sum", "count"])
+        )
+        rollup._per_day = {
+            ts.date(): (float(h), int(n))
+            for ts, h, n in zip(per_day.index, per_day["sum"], per_day["count"])
+        }
+        rollup._last = max(rollup._per_day, default=None)
+        return rollup
@@ -6,7 +6,10 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
 
 from core.types.enums import Difficulty, SessionStatus
 
@@ -37,3 +40,77 @@ def compute_points(
     multiplier = weights.get(difficulty, 1.0)
     points = hours_spent * multiplier
     return round(points, 2)
+
+
+# ---------- Vectorized ----------
+
+_SPLIT = 134217729.0  # 2**27 + 1, Veltkamp splitter for float64
+
+
+def _round2(x: np.ndarray) -> np.ndarray:
+    """Elementwise `round(x, 2)` with Python's exact semantics.
+
+    `np.round` scales by 100 first, so values like 0.325 (= 0.25 * 1.3) whose
+    scaled product lands exactly on .5 get rounded differently from the
+    builtin, which looks at the exact binary value. The rounding error of the
+    scaled product is recovered exactly (Dekker two-product) and only those
+    apparent ties are corrected.
+    """
+    p = x * 100.0
+    c = x * _SPLIT
+    hi = c - (c - x)
+    lo = x - hi
+    err = (hi * 100.0 - p) + lo * 100.0  # p + err == 100 * x exactly
+    n = np.rint(p)
+    frac = p - n
+    n = np.where((frac == 0.5) & (err > 0), n + 1.0, n)
+    n = np.where((frac == -0.5) & (err < 0), n - 1.0, n)
+    return n / 100.0
+
+
+def _lookup(values: Any, fn) -> np.ndarray:
+    # Map each distinct category once, then broadcast through the codes;
+    # missing values take code -1, i.e. the trailing fn(None) slot.
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    table = np.array([fn(u) for u in uniques] + [fn(None)], dtype=np.float64)
+    return table[codes]
+
+
+def compute_points_batch(
+    hours_spent: Any,
+    difficulty: Optional[Any] = None,
+    status: Optional[Any] = None,
+    weights: Dict[Difficulty, float] = DEFAULT_WEIGHTS,
+) -> Any:
+    """
+    Vectorized `compute_points` over many sessions.
+
+    Accepts either three equal-length array-likes (hours, difficulty, status)
+    or a sessions DataFrame with the `SESSIONS_SCHEMA` columns `hour_spent`,
+    `difficulty` and `status` (`hours_spent` is accepted too). Results are
+    identical to calling `compute_points` per row; a DataFrame input returns a
+    `points_awarded` Series on the frame's index, arrays return an ndarray.
+    """
+    index = None
+    if isinstance(hours_spent, pd.DataFrame):
+        df = hours_spent
+        hours_col = "hour_spent" if "hour_spent" in df.columns else "hours_spent"
+        index = df.index
+        hours_spent, difficulty, status = df[hours_col], df["difficulty"], df["status"]
+    elif difficulty is None or status is None:
+        raise TypeError("difficulty and status are required with array input")
+
+    if isinstance(hours_spent, pd.Series):
+        hours = hours_spent.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        hours = np.asarray(hours_spent, dtype=np.float64)
+
+    multiplier = _lookup(difficulty, lambda d: weights.get(d, 1.0))
+    live = _lookup(status, lambda st: 0.0 if st == SessionStatus.cancelled else 1.0)
+    if not (len(hours) == len(multiplier) == len(live)):
+        raise ValueError("hours_spent, difficulty and status must have equal length")
+
+    points = np.where(live == 0.0, 0.0, _round2(hours * multiplier))
+    if index is not None:
+        return pd.Series(points, index=index, name="points_awarded")
+    return points
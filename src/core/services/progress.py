@@ -7,20 +7,36 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Optional, Protocol
+from typing import Any, AsyncIterable, Iterable, Optional, Protocol
 
 
 class _HasHours(Protocol):
     hours: float
 
 
+class _HasTotalHours(Protocol):
+    total_hours: float
+
+
+def hours_of(session: Any) -> float:
+    """Hours of one session: a dict or object with `hours_spent` (or `hours`)."""
+    if isinstance(session, dict):
+        return session.get("hours_spent", session.get("hours", 0.0))
+    return getattr(session, "hours_spent", getattr(session, "hours", 0.0))
+
+
 def accumulate_hours(sessions: Iterable[_HasHours]) -> float:
     total = 0.0
     for session in sessions:
-        if isinstance(session, dict):
-            total += session.get("hours_spent", session.get("hours", 0.0))
-        else:
-            total += getattr(session, "hours_spent", getattr(session, "hours", 0.0))
+        total += hours_of(session)
+    return total
+
+
+async def accumulate_hours_async(sessions: AsyncIterable[_HasHours]) -> float:
+    """`accumulate_hours` for async streams (e.g. `iter_by_item`), in constant memory."""
+    total = 0.0
+    async for session in sessions:
+        total += hours_of(session)
     return total
 
 
@@ -59,3 +75,13 @@ def progress_from_sessions(
     """
     total = accumulate_hours(sessions)
     return compute_progress(total, target_hours)
+
+
+def progress_from_aggregate(
+    aggregate: _HasTotalHours, target_hours: float
+) -> ProgressReport:
+    """
+    Same as `progress_from_sessions`, but from a pre-computed aggregate
+    (e.g. `SessionAggregateDTO` from a SQL `SUM`) instead of session rows.
+    """
+    return compute_progress(getattr(aggregate, "total_hours", 0.0), target_hours)
@@ -0,0 +1,176 @@
+# src/core/services/rollups.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Implements pure functions to maintain per-item rollups (hours, streaks) incrementally or by full rebuild.
+# Role: Core logic
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.services.points import _round2
+from core.services.progress import accumulate_hours
+from core.services.streaks import StreakState, run_containing, streak_states_by_item
+
+__all__ = [
+    "ItemRollup",
+    "rollup_from_item",
+    "apply_session",
+    "repair_session",
+    "rebuild_rollup",
+    "rollup_from_aggregate",
+    "rollups_by_item",
+]
+
+
+@dataclass(frozen=True)
+class ItemRollup:
+    """Stored rollup state for one item: total hours plus its `StreakState`."""
+
+    total_hours: float = 0.0
+    streak: StreakState = field(default_factory=StreakState)
+
+    @property
+    def streak_current(self) -> int:
+        return self.streak.current
+
+    @property
+    def streak_longest(self) -> int:
+        return self.streak.longest
+
+    @property
+    def last_session_date(self) -> Optional[date]:
+        return self.streak.last_date
+
+
+def _field(obj: Any, name: str, default: Any = None) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def rollup_from_item(item: Any) -> Optional[ItemRollup]:
+    """Read stored rollup state from an item (dict or object).
+
+    Returns None when the item carries no serialized streak state yet, which
+    callers treat as "rebuild from sessions".
+    """
+    raw = _field(item, "streak_state")
+    if raw is None:
+        return None
+    if isinstance(raw, str):
+        streak = StreakState.from_json(raw)
+    elif isinstance(raw, dict):
+        streak = StreakState.from_dict(raw)
+    else:
+        streak = raw
+    return ItemRollup(float(_field(item, "total_hours", 0.0) or 0.0), streak)
+
+
+def apply_session(
+    rollup: Optional[ItemRollup], hours_spent: float, session_date: Any
+) -> Optional[ItemRollup]:
+    """Apply one newly inserted session to a stored rollup in O(1).
+
+    Returns None when there is no stored state, or when the session is dated
+    before the current run and so may join older runs; callers then use
+    `repair_session` with the days around it, or rebuild. The stored
+    `StreakState` is only mutated when the delta applies.
+    """
+    if rollup is None or session_date is None:
+        return None
+    if not rollup.streak.add(session_date):
+        return None
+    return ItemRollup(rollup.total_hours + float(hours_spent or 0.0), rollup.streak)
+
+
+def repair_session(
+    rollup: ItemRollup, hours_spent: float, session_date: Any, nearby: Iterable[Any]
+) -> Optional[ItemRollup]:
+    """Apply a back-dated session using only the stored days near it.
+
+    `nearby` must hold every stored day of the run through `session_date`
+    (the session itself included). Returns None if `session_date` is not in
+    `nearby`.
+    """
+    run = run_containing(session_date, list(nearby))
+    if run is None:
+        return None
+    rollup.streak.merge_run(*run)
+    return ItemRollup(rollup.total_hours + float(hours_spent or 0.0), rollup.streak)
+
+
+def rebuild_rollup(sessions: Iterable[Any]) -> ItemRollup:
+    """Full rebuild from every session of an item."""
+    sessions = list(sessions)
+    return ItemRollup(
+        total_hours=accumulate_hours(sessions),
+        streak=StreakState.from_dates([_field(s, "session_date") for s in sessions]),
+    )
+
+
+def rollup_from_aggregate(aggregate: Any, dates: Iterable[Any]) -> ItemRollup:
+    """Full rebuild from SQL-side results instead of session rows.
+
+    `aggregate` needs a `total_hours` attribute (e.g. `SessionAggregateDTO`);
+    `dates` are the item's distinct session days.
+    """
+    return ItemRollup(
+        total_hours=float(_field(aggregate, "total_hours", 0.0)),
+        streak=StreakState.from_dates(list(dates)),
+    )
+
+
+def rollups_by_item(sessions: pd.DataFrame, targets: pd.Series) -> pd.DataFrame:
+    """Full rebuild of many items' rollups from one sessions frame.
+
+    `sessions` needs `item_id`, `session_date` and `hour_spent` (or
+    `hours_spent`); `targets` maps item_id -> target hours and decides which
+    items are returned (those without sessions get empty rollups). Columns
+    match the stored item fields: `total_hours`, `progress_pct` (as
+    `compute_progress` rounds it), `streak_current`, `streak_longest`,
+    `last_session_date` (ISO string or None) and `streak_state` (JSON).
+    """
+    index = pd.Index(targets.index.astype(str), name="item_id")
+    hours_col = "hour_spent" if "hour_spent" in sessions.columns else "hours_spent"
+    item_ids = sessions["item_id"].astype(str).to_numpy(dtype=object)
+    hours = sessions[hours_col].to_numpy(dtype=np.float64, na_value=0.0)
+    total = pd.Series(hours).groupby(item_ids).sum().reindex(index, fill_value=0.0)
+
+    th = np.maximum(total.to_numpy(), 0.0)
+    tgt = targets.to_numpy(dtype=np.float64, na_value=0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.where(tgt > 0.0, np.clip(th / tgt * 100.0, 0.0, 100.0), 0.0)
+
+    states = streak_states_by_item(item_ids, sessions["session_date"]).reindex(index)
+    streaks = [
+        (
+            StreakState()
+            if pd.isna(last)
+            else StreakState(last.date(), int(cur), int(longest), end.date())
+        )
+        for last, cur, longest, end in zip(
+            states["last_date"],
+            states["current"],
+            states["longest"],
+            states["longest_end"],
+        )
+    ]
+    return pd.DataFrame(
+        {
+            "total_hours": total.to_numpy(),
+            "progress_pct": _round2(pct),
+            "streak_current": [st.current for st in streaks],
+            "streak_longest": [st.longest for st in streaks],
+            "last_session_date": [
+                st.last_date.isoformat() if st.last_date else None for st in streaks
+            ],
+            "streak_state": [st.to_json() for st in streaks],
+        },
+        index=index,
+    )
@@ -6,10 +6,26 @@
 
 from __future__ import annotations
 
+import json
+import warnings
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, Iterable
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Tuple
 
-__all__ = ["get_streak", "streaks_from_sessions"]
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "get_streak",
+    "streaks_from_sessions",
+    "streaks_from_sessions_async",
+    "StreakRuns",
+    "streak_runs",
+    "get_streak_vectorized",
+    "run_containing",
+    "StreakState",
+    "streak_states_by_item",
+]
 
 
 def _to_date(x: Any) -> date:
@@ -79,3 +95,295 @@ def streaks_from_sessions(
         return getattr(s, date_attr) if hasattr(s, date_attr) else s[date_attr]
 
     return get_streak((extract(s) for s in sessions), today=today)
+
+
+async def streaks_from_sessions_async(
+    sessions: AsyncIterable[Any],
+    date_attr: str = "session_date",
+    *,
+    today: Any | None = None,
+) -> Dict[str, int]:
+    """`streaks_from_sessions` for async streams, in constant memory.
+
+    Expects sessions in ascending date order (as `iter_by_item` / `iter_all`
+    yield them) and folds runs as they arrive instead of building a day set.
+    Raises `ValueError` if a date goes backwards.
+    """
+    anchor = _to_date(today) if today is not None else date.today()
+    one = timedelta(days=1)
+    prev: date | None = None
+    run = 0
+    longest = 0
+    async for s in sessions:
+        raw = getattr(s, date_attr) if hasattr(s, date_attr) else s[date_attr]
+        d = _to_date(raw)
+        if d > anchor:
+            continue
+        if prev is not None and d < prev:
+            raise ValueError("sessions must be ordered by date")
+        if prev is None or d - prev > one:
+            run = 1
+        elif d != prev:
+            run += 1
+        prev = d
+        if run > longest:
+            longest = run
+
+    current = run if prev == anchor else 0
+    return {"current": current, "longest": longest}
+
+
+# ---------- Vectorized engine ----------
+
+_ONE_DAY = np.timedelta64(1, "D")
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@dataclass(frozen=True)
+class StreakRuns:
+    """Every run of consecutive days up to an anchor, as parallel arrays.
+
+    `starts` holds each run's first day (`datetime64[D]`, ascending) and
+    `lengths` its length in days; `current`/`longest` match `get_streak`.
+    """
+
+    current: int
+    longest: int
+    starts: np.ndarray
+    lengths: np.ndarray
+
+    @property
+    def runs(self) -> List[Tuple[date, int]]:
+        return [(d.item(), int(n)) for d, n in zip(self.starts, self.lengths)]
+
+
+def _to_day_array(dates: Any) -> np.ndarray:
+    """Normalize inputs to a `datetime64[D]` array (NaT for missing)."""
+    if isinstance(dates, (pd.Series, pd.Index)):
+        values = dates
+        if isinstance(values.dtype, pd.DatetimeTZDtype):
+            # keep each value's own wall-clock day, like `datetime.date()`
+            values = (
+                values.dt.tz_localize(None)
+                if isinstance(values, pd.Series)
+                else values.tz_localize(None)
+            )
+        if pd.api.types.is_datetime64_any_dtype(values.dtype):
+            return values.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+        dates = values.to_numpy(dtype=object)
+    if isinstance(dates, np.ndarray) and np.issubdtype(dates.dtype, np.datetime64):
+        return dates.astype("datetime64[D]")
+
+    seq = dates if isinstance(dates, (list, tuple, np.ndarray)) else list(dates)
+    if len(seq) == 0:
+        return np.array([], dtype="datetime64[D]")
+    missing = pd.isna(np.asarray(seq, dtype=object))
+    if missing.any():
+        # None/NaN/NaT/NA carry no day: convert the rest, NaT in their slots
+        out = np.full(len(seq), np.datetime64("NaT"), dtype="datetime64[D]")
+        if not missing.all():
+            out[~missing] = _to_day_array([d for d, m in zip(seq, missing) if not m])
+        return out
+    try:
+        if isinstance(seq[0], str):
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", DeprecationWarning)
+                return np.array(seq, dtype="datetime64[D]")
+        # date/datetime: toordinal() is the wall-clock day, like `_to_date`,
+        # and much cheaper than numpy's per-object datetime parsing
+        ordinals = np.fromiter((d.toordinal() for d in seq), np.int64, len(seq))
+    except (AttributeError, TypeError, ValueError, DeprecationWarning):
+        # mixed inputs
+        ordinals = np.fromiter(
+            (_to_date(d).toordinal() for d in seq), np.int64, len(seq)
+        )
+    return (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def streak_runs(dates: Any, *, today: Any | None = None) -> StreakRuns:
+    """Vectorized streak computation via unique/sort/diff run detection.
+
+    Args:
+        dates: array-like of days (`datetime64`, pandas datetimes, `date`,
+            `datetime` or ISO strings). Duplicates allowed; missing values ignored.
+        today: Optional anchor day; defaults to `date.today()`. Future inputs are ignored.
+    """
+    anchor = np.datetime64(_to_date(today) if today is not None else date.today(), "D")
+    days = _to_day_array(dates)
+    days = days[~np.isnat(days)]
+    days = np.unique(days[days <= anchor])  # sorted, de-duplicated
+    if days.size == 0:
+        empty = np.array([], dtype="datetime64[D]")
+        return StreakRuns(0, 0, empty, np.array([], dtype=np.int64))
+
+    breaks = np.flatnonzero(np.diff(days) != _ONE_DAY) + 1
+    heads = np.concatenate(([0], breaks))
+    lengths = np.diff(np.concatenate((heads, [days.size]))).astype(np.int64)
+    current = int(lengths[-1]) if days[-1] == anchor else 0
+    return StreakRuns(current, int(lengths.max()), days[heads], lengths)
+
+
+def get_streak_vectorized(dates: Any, *, today: Any | None = None) -> Dict[str, int]:
+    """Drop-in for `get_streak` on large histories."""
+    runs = streak_runs(dates, today=today)
+    return {"current": runs.current, "longest": runs.longest}
+
+
+# ---------- Incremental state ----------
+
+
+def run_containing(day: Any, dates: Any) -> Optional[Tuple[date, date]]:
+    """First and last day of the run of consecutive `dates` through `day`.
+
+    None when `day` is not among `dates`. Costs O(len(dates)), so callers pass
+    a window around `day` rather than a whole history.
+    """
+    days = _to_day_array(dates)
+    days = np.unique(days[~np.isnat(days)])
+    target = np.datetime64(_to_date(day), "D")
+    i = int(np.searchsorted(days, target))
+    if i == days.size or days[i] != target:
+        return None
+    breaks = np.flatnonzero(np.diff(days) != _ONE_DAY) + 1
+    k = int(np.searchsorted(breaks, i, side="right"))
+    lo = int(breaks[k - 1]) if k else 0
+    hi = int(breaks[k]) - 1 if k < breaks.size else days.size - 1
+    return days[lo].item(), days[hi].item()
+
+
+@dataclass
+class StreakState:
+    """Persistent, serializable streak state of constant size.
+
+    Tracks the last day, the run ending there (`current`), the longest run and
+    its anchor (`longest_end`, the last day of the most recent run of that
+    length). `add` updates it in O(1) for days at or after the start of the
+    current run. Earlier days may join older runs, which this state does not
+    keep: `add` returns False and the caller fetches the days around the new
+    one and passes the resulting run to `merge_run`.
+    """
+
+    last_date: Optional[date] = None
+    current: int = 0
+    longest: int = 0
+    longest_end: Optional[date] = None
+
+    def add(self, day: Any) -> bool:
+        """Fold one day in; False when it needs `merge_run` instead."""
+        d = _to_date(day)
+        last = self.last_date
+        if last is None or d > last:
+            self.current = (
+                self.current + 1
+                if last is not None and d == last + timedelta(days=1)
+                else 1
+            )
+            self.last_date = d
+            self._observe(self.current, d)
+            return True
+        # inside the current run: nothing changes
+        return d > last - timedelta(days=self.current)
+
+    def merge_run(self, start: Any, end: Any) -> None:
+        """Account for the run `[start, end]` containing an out-of-order day.
+
+        Only that run can change when a day is inserted, and runs only grow,
+        so the longest run and, when the run reaches `last_date`, the current
+        one are updated from it directly.
+        """
+        start, end = _to_date(start), _to_date(end)
+        length = (end - start).days + 1
+        self._observe(length, end)
+        if end == self.last_date:
+            self.current = length
+
+    def _observe(self, length: int, end: date) -> None:
+        if length > self.longest or (
+            length == self.longest
+            and (self.longest_end is None or end > self.longest_end)
+        ):
+            self.longest = length
+            self.longest_end = end
+
+    @classmethod
+    def from_dates(cls, dates: Any) -> "StreakState":
+        """Build from a full history in one vectorized pass."""
+        runs = streak_runs(dates, today=date.max)
+        if runs.lengths.size == 0:
+            return cls()
+        ends = runs.starts + (runs.lengths - 1).astype("timedelta64[D]")
+        i = runs.lengths.size - 1 - int(np.argmax(runs.lengths[::-1]))
+        return cls(
+            last_date=ends[-1].item(),
+            current=int(runs.lengths[-1]),
+            longest=int(runs.lengths[i]),
+            longest_end=ends[i].item(),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "last_date": self.last_date.isoformat() if self.last_date else None,
+            "current": self.current,
+            "longest": self.longest,
+            "longest_end": self.longest_end.isoformat() if self.longest_end else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StreakState":
+        last = data.get("last_date")
+        state = cls(
+            date.fromisoformat(last) if last else None, int(data.get("current", 0))
+        )
+        anchor = data.get("longest_end")
+        state.longest = int(data.get("longest", 0))
+        state.longest_end = date.fromisoformat(anchor) if anchor else None
+        return state
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> "StreakState":
+        return cls.from_dict(json.loads(text))
+
+
+def streak_states_by_item(keys: Any, dates: Any) -> pd.DataFrame:
+    """`StreakState.from_dates` for every key at once, without a Python loop.
+
+    `keys` and `dates` are parallel (one entry per session). Returns one row
+    per key with the `StreakState` fields `last_date`, `current`, `longest`
+    and `longest_end` (datetime64 and int64 columns), indexed by key. Sessions
+    without a date are ignored; keys with none are absent.
+    """
+    days = _to_day_array(dates)
+    pairs = pd.DataFrame({"k": np.asarray(keys, dtype=object), "d": days})
+    pairs = pairs[~np.isnat(days)].drop_duplicates().sort_values(["k", "d"])
+    columns = ["last_date", "current", "longest", "longest_end"]
+    if pairs.empty:
+        return pd.DataFrame(columns=columns, index=pd.Index([], name="key"))
+
+    k = pairs["k"].to_numpy()
+    d = pairs["d"].to_numpy(dtype="datetime64[D]")
+    # a run starts at each new key or wherever the day gap isn't one
+    starts = np.ones(len(d), dtype=bool)
+    starts[1:] = (k[1:] != k[:-1]) | (np.diff(d) != _ONE_DAY)
+    heads = np.flatnonzero(starts)
+    ends = np.concatenate((heads[1:], [len(d)])) - 1
+    runs = pd.DataFrame(
+        {"key": k[heads], "length": (ends - heads + 1).astype(np.int64), "end": d[ends]}
+    )
+
+    by_key = runs.groupby("key", sort=False)
+    last = by_key.tail(1).set_index("key")
+    longest = by_key["length"].transform("max")
+    # the most recent run of the longest length anchors `longest_end`
+    anchors = runs[runs["length"] == longest].groupby("key", sort=False).tail(1)
+    anchors = anchors.set_index("key")
+    return pd.DataFrame(
+        {
+            "last_date": last["end"],
+            "current": last["length"],
+            "longest": anchors["length"],
+            "longest_end": anchors["end"],
+        }
+    )
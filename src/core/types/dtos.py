@@ -7,10 +7,10 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timezone
-from typing import List, Optional
+from typing import Any, List, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
 
 from core.types.enums import (
     Difficulty,
@@ -129,6 +129,18 @@ class GamificationStateDTO(BaseModel):
     last_session_date: Optional[date] = None
 
 
+# ---------- Session aggregates ----------
+class SessionAggregateDTO(BaseModel):
+    """SQL-side rollup of sessions for one item (or all items when item_id is None)."""
+
+    item_id: Optional[str] = None
+    session_count: int = 0
+    total_hours: float = 0.0
+    total_points: float = 0.0
+    first_session_date: Optional[date] = None
+    last_session_date: Optional[date] = None
+
+
 # ---------- Preferences ----------
 class PreferencesDTO(BaseModel):
     language_id: UUID = Field(default_factory=uuid4)
@@ -166,3 +178,21 @@ class SnapshotDTO(BaseModel):
             date: lambda v: v.isoformat(),
         },
     }
+
+
+# ---------- Batch validation ----------
+# Built once: the list schema wraps SessionDTO's compiled validator, so a
+# whole batch is validated in a single call instead of one per session
+SESSIONS_ADAPTER: TypeAdapter[List[SessionDTO]] = TypeAdapter(List[SessionDTO])
+
+
+def validate_sessions(data: Any) -> List[SessionDTO]:
+    """Validate a batch of sessions with one `TypeAdapter` call.
+
+    `data` is a JSON array (str or bytes, e.g. an export file's contents) or
+    a list of dicts / `SessionDTO`s. Every `SessionDTO` rule applies; a
+    `ValidationError` lists every failing session, located by its position.
+    """
+    if isinstance(data, (str, bytes, bytearray)):
+        return SESSIONS_ADAPTER.validate_json(data)
+    return SESSIONS_ADAPTER.validate_python(data)
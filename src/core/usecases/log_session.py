@@ -1,21 +1,183 @@
 # core/usecases/log_session.py
 from __future__ import annotations
 
-from dataclasses import replace
-from typing import Any, Iterable
+import asyncio
+from collections import Counter
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from core.services.points import compute_points
-from core.services.progress import accumulate_hours, compute_progress
-from core.services.streaks import streaks_from_sessions
-from core.types.dtos import SessionDTO
+from core.services.progress import compute_progress, hours_of, progress_from_aggregate
+from core.services.rollups import (
+    ItemRollup,
+    apply_session,
+    rebuild_rollup,
+    repair_session,
+    rollup_from_aggregate,
+    rollup_from_item,
+)
+from core.services.streaks import StreakState, _to_date, run_containing
 from core.types.enums import Difficulty, SessionStatus
-from ports.repositories import ConfigRepository, ItemRepository, SessionRepository
+from ports.repositories import (
+    ConfigRepository,
+    ItemRepository,
+    SessionAggregates,
+    SessionExistence,
+    SessionRepository,
+)
+
+# first window (days either side) read to repair a back-dated session
+_REPAIR_WINDOW_DAYS = 32
+
+DEFAULT_LOCK_STRIPES = 64
+
+
+def _field(obj: Any, name: str, default: Any = None) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _streak_on(day: date, rollup: ItemRollup, run: Optional[Tuple[date, date]]) -> int:
+    """Streak as of the logged day (later sessions don't count)."""
+    if run is not None:
+        return (day - run[0]).days + 1
+    last = rollup.last_session_date
+    if last is not None and 0 <= (last - day).days < rollup.streak_current:
+        # a day inside the current run
+        return rollup.streak_current - (last - day).days
+    return 0
+
+
+def _points(session_input: Any, cfg: Any) -> float:
+    return compute_points(
+        session_input.hours_spent,
+        getattr(session_input, "difficulty", Difficulty.beginner),
+        getattr(session_input, "status", SessionStatus.in_progress),
+        cfg,
+    )
+
+
+def _with_points(session_input: Any, pts: float) -> Any:
+    if hasattr(session_input, "__dataclass_fields__"):
+        # It's a dataclass, use replace
+        return replace(session_input, points_awarded=pts)
+    # An already-validated model: copy it rather than dump and re-validate
+    return session_input.model_copy(update={"points_awarded": pts})
+
+
+def _with_results(
+    saved: Any, progress_pct: float, pts: float, streak_current: int
+) -> Any:
+    if hasattr(saved, "__dataclass_fields__"):
+        # It's a dataclass, use replace
+        return replace(
+            saved,
+            progress_pct=progress_pct,
+            points_awarded=pts,
+            streak_current=streak_current,
+        )
+    # A model: copy without re-running validators (execute rejects the
+    # zero-hour cancelled sessions enforce_cancelled_zeroes would touch)
+    return saved.model_copy(
+        update={
+            "progress_pct": progress_pct,
+            "points_awarded": pts,
+            "streak_current": streak_current,
+        }
+    )
+
+
+def _session_day(session: Any) -> date:
+    session_date = getattr(session, "session_date", None)
+    return _to_date(session_date) if session_date is not None else date.today()
+
+
+@dataclass
+class _History:
+    """An item's stored sessions reduced to what a replay needs: total hours,
+    sessions per day, and (when read from rows) each session's contribution."""
+
+    total_hours: float
+    days: Counter
+    by_id: Dict[str, Tuple[float, date]]
+
+    def put(self, session_id: str, hours: float, day: date) -> None:
+        old = self.by_id.get(session_id)
+        if old is not None:
+            # an upsert replaces the stored session's hours and day
+            self.total_hours -= old[0]
+            self.days[old[1]] -= 1
+            if not self.days[old[1]]:
+                del self.days[old[1]]
+        self.total_hours += hours
+        self.days[day] += 1
+        self.by_id[session_id] = (hours, day)
+
+    def streak_on(self, day: date) -> int:
+        streak = 0
+        while day - timedelta(days=streak) in self.days:
+            streak += 1
+        return streak
+
+
+_Steps = List[Tuple[float, int]]  # (total hours, streak_current) after each session
+
+
+def _fold_new(
+    stored: Optional[ItemRollup], group: List[Any], existed: List[Optional[bool]]
+) -> Tuple[Optional[ItemRollup], _Steps]:
+    """`apply_session` over a group of new sessions, on a copy of the stored
+    state. (None, []) when any session needs a repair or a rebuild instead."""
+    ids = [str(s.session_id) for s in group]
+    if (
+        stored is None
+        or any(e is not False for e in existed)
+        or len(set(ids)) < len(ids)
+    ):
+        return None, []
+    rollup: Optional[ItemRollup] = ItemRollup(
+        stored.total_hours, replace(stored.streak)
+    )
+    steps: _Steps = []
+    for s in group:
+        session_date = getattr(s, "session_date", None)
+        rollup = apply_session(rollup, s.hours_spent, session_date)
+        if rollup is None:
+            return None, []
+        steps.append(
+            (rollup.total_hours, _streak_on(_to_date(session_date), rollup, None))
+        )
+    return rollup, steps
+
+
+def _replay(history: _History, group: List[Any]) -> Tuple[ItemRollup, _Steps]:
+    """Apply a group to the item's history one session at a time."""
+    steps: _Steps = []
+    for s in group:
+        day = _session_day(s)
+        history.put(str(s.session_id), float(s.hours_spent), day)
+        steps.append((history.total_hours, history.streak_on(day)))
+    rollup = ItemRollup(history.total_hours, StreakState.from_dates(list(history.days)))
+    return rollup, steps
 
 
 class LogSessionUseCase:
     """Orchestrates logging a session and updating rollups.
     Expects DTO-like objects with attributes used below (infra-free).
+
+    Item rollups are updated incrementally from the stored state (total hours
+    plus a constant-size `StreakState`) when the session is new. Back-dated
+    sessions are repaired from the days around them, fetched with a bounded
+    `distinct_dates` range. Upserts and items without stored state fall back
+    to a full rebuild, using the repository's SQL-side aggregates when it has
+    them and `list_by_item` otherwise.
+
+    Concurrent calls for the same item are serialized by a striped set of
+    per-item `asyncio.Lock`s; calls for different items run concurrently.
     """
 
     def __init__(
@@ -23,74 +185,230 @@ class LogSessionUseCase:
         sessions: SessionRepository,
         items: ItemRepository,
         config: ConfigRepository,
+        lock_stripes: int = DEFAULT_LOCK_STRIPES,
     ):
+        if lock_stripes <= 0:
+            raise ValueError("lock_stripes must be positive")
         self._sessions = sessions
         self._items = items
         self._config = config
+        # Item rollups are read-modify-write, so calls for the same item_id
+        # are serialized on one of `lock_stripes` locks (items hashing to the
+        # same stripe share it); different items proceed concurrently. This
+        # guards callers sharing this instance, not other processes.
+        self._locks = [asyncio.Lock() for _ in range(lock_stripes)]
+
+    def _stripe(self, item_id: UUID | str) -> int:
+        return hash(str(item_id)) % len(self._locks)
+
+    @asynccontextmanager
+    async def _locked(self, item_ids: Iterable[UUID | str]) -> AsyncIterator[None]:
+        # stripes are always taken in ascending order, so batches never deadlock
+        async with AsyncExitStack() as stack:
+            for stripe in sorted({self._stripe(i) for i in item_ids}):
+                await stack.enter_async_context(self._locks[stripe])
+            yield
 
     async def execute(self, session_input: Any) -> Any:
         if getattr(session_input, "hours_spent", 0) <= 0:
             raise ValueError("Duration must be positive")
+        async with self._locked([session_input.item_id]):
+            return await self._execute(session_input)
 
+    async def _execute(self, session_input: Any) -> Any:
         item = await self._items.get_by_id(session_input.item_id)
-        cfg = await self._config.get("points") if hasattr(self._config, "get") else {}
-
-        pts = compute_points(
-            session_input.hours_spent,
-            getattr(session_input, "difficulty", Difficulty.beginner),
-            getattr(session_input, "status", SessionStatus.in_progress),
-            cfg,
-        )
-
-        # Update points directly on the input object using replace for dataclasses or copy for Pydantic
-        if hasattr(session_input, "__dataclass_fields__"):
-            # It's a dataclass, use replace
-            to_save = replace(session_input, points_awarded=pts)
-        else:
-            # It's likely a Pydantic model, create a copy with updated points
-            session_dict = session_input.model_dump()
-            session_dict["points_awarded"] = pts
-            to_save = SessionDTO(**session_dict)
+        cfg = await self._points_config()
+        pts = _points(session_input, cfg)
+        to_save = _with_points(session_input, pts)
 
+        existed = await self._session_exists(session_input.session_id)
         saved = await self._sessions.save(to_save)
 
-        # Recompute rollups for item
-        all_sessions: Iterable[Any] = list(
-            await self._sessions.list_by_item(session_input.item_id)
+        session_date = getattr(session_input, "session_date", None)
+        day = _session_day(session_input)
+        rollup: Optional[ItemRollup] = None
+        run: Optional[Tuple[date, date]] = None
+        if existed is False:
+            stored = rollup_from_item(item)
+            rollup = apply_session(stored, to_save.hours_spent, session_date)
+            if rollup is None and stored is not None and session_date is not None:
+                rollup, run = await self._repair(
+                    session_input.item_id, stored, to_save.hours_spent, day
+                )
+        if rollup is None:
+            rollup, run = await self._rebuild(session_input.item_id, day)
+        streak_current = _streak_on(day, rollup, run)
+
+        progress_report = progress_from_aggregate(
+            rollup, _field(item, "target_hours", 1) or 1
         )
-        total = accumulate_hours(all_sessions)
-        progress_report = compute_progress(total, getattr(item, "target_hours", 1) or 1)
         progress_pct = progress_report.percent_complete
-        streak = streaks_from_sessions(
-            all_sessions, today=getattr(session_input, "session_date", None)
-        )
+        await self._save_item_rollup(item, rollup, progress_pct)
+
+        # Return session with final progress snapshot
+        return _with_results(saved, progress_pct, pts, streak_current)
+
+    async def execute_many(self, session_inputs: Iterable[Any]) -> List[Any]:
+        """Log a batch; returns what one `execute` call per session, in input
+        order, would have returned.
+
+        Sessions are grouped by item: each item and the points config are
+        fetched once, every session is written with a single `save_many`
+        (one transaction on SQLite), and each item's rollup is computed and
+        saved once. Per-session progress and streaks are replayed in memory,
+        from the stored rollup when every session of the item is new and
+        in date order, otherwise from the item's history read before the
+        write. Nothing is written if any duration is not positive.
+        """
+        inputs = list(session_inputs)
+        if any(getattr(s, "hours_spent", 0) <= 0 for s in inputs):
+            raise ValueError("Duration must be positive")
+        if not inputs:
+            return []
+
+        groups: Dict[str, List[int]] = {}
+        for i, s in enumerate(inputs):
+            groups.setdefault(str(s.item_id), []).append(i)
+        async with self._locked(groups):
+            return await self._execute_many(inputs, groups)
+
+    async def _execute_many(
+        self, inputs: List[Any], groups: Dict[str, List[int]]
+    ) -> List[Any]:
+        cfg = await self._points_config()
+        pts = [_points(s, cfg) for s in inputs]
+        to_save = [_with_points(s, p) for s, p in zip(inputs, pts)]
 
-        # Optionally persist item rollups (implementation-defined)
-        if hasattr(item, "total_hours"):
-            item_dict = (
-                item.__dict__ if not hasattr(item, "model_dump") else item.model_dump()
+        # everything read before the write, as sequential calls would see it
+        plans = []
+        for positions in groups.values():
+            item_id = inputs[positions[0]].item_id
+            item = await self._items.get_by_id(item_id)
+            group = [to_save[i] for i in positions]
+            existed = [await self._session_exists(s.session_id) for s in group]
+            rollup, steps = _fold_new(rollup_from_item(item), group, existed)
+            if rollup is None:
+                rollup, steps = _replay(
+                    await self._history(item_id, any(e is not False for e in existed)),
+                    group,
+                )
+            plans.append((positions, item, rollup, steps))
+
+        saved = list(await self._sessions.save_many(to_save))
+
+        results: List[Any] = [None] * len(inputs)
+        for positions, item, rollup, steps in plans:
+            target = _field(item, "target_hours", 1) or 1
+            for i, (total_hours, streak_current) in zip(positions, steps):
+                progress_pct = compute_progress(total_hours, target).percent_complete
+                results[i] = _with_results(
+                    saved[i], progress_pct, pts[i], streak_current
+                )
+            await self._save_item_rollup(
+                item, rollup, progress_from_aggregate(rollup, target).percent_complete
             )
-            item_dict.update({"total_hours": total, "progress_pct": progress_pct})
-            item = type(item)(**item_dict)
-            await self._items.save(item)
+        return results
 
-        # Return session with final progress snapshot
-        if hasattr(saved, "__dataclass_fields__"):
-            # It's a dataclass, use replace
-            return replace(
-                saved,
-                progress_pct=progress_pct,
-                points_awarded=pts,
-                streak_current=streak["current"],
+    async def _points_config(self) -> Any:
+        return await self._config.get("points") if hasattr(self._config, "get") else {}
+
+    async def _history(self, item_id: UUID | str, rows: bool) -> _History:
+        """The item's stored sessions, as far as a replay needs them.
+
+        Per-session rows are only read when a replayed session may replace a
+        stored one; otherwise SQL-side aggregates suffice when available.
+        """
+        if not rows and isinstance(self._sessions, SessionAggregates):
+            aggregate = await self._sessions.aggregate(item_id)
+            dates = await self._sessions.distinct_dates(item_id)
+            return _History(
+                float(_field(aggregate, "total_hours", 0.0)),
+                Counter(_to_date(d) for d in dates),
+                {},
             )
-        else:
-            # It's a Pydantic model
-            saved_dict = saved.model_dump()
-            saved_dict.update(
-                {
-                    "progress_pct": progress_pct,
-                    "points_awarded": pts,
-                    "streak_current": streak["current"],
-                }
+        history = _History(0.0, Counter(), {})
+        for row in await self._sessions.list_by_item(item_id):
+            history.put(
+                str(_field(row, "session_id")),
+                float(hours_of(row) or 0.0),
+                _to_date(_field(row, "session_date")),
             )
-            return type(saved)(**saved_dict)
+        return history
+
+    async def _session_exists(self, session_id: Any) -> Optional[bool]:
+        """None when the repository cannot tell (forces a full rebuild)."""
+        if not isinstance(self._sessions, SessionExistence):
+            return None
+        return await self._sessions.exists(session_id)
+
+    async def _repair(
+        self, item_id: UUID | str, stored: ItemRollup, hours: float, day: date
+    ) -> Tuple[Optional[ItemRollup], Optional[Tuple[date, date]]]:
+        """Merge a back-dated day using only the stored days around it.
+
+        The window doubles until the run through `day` ends strictly inside
+        it, so the rows read are bounded by that run's length, not by the
+        item's history. (None, None) when the store has no `distinct_dates`.
+        """
+        if not isinstance(self._sessions, SessionAggregates):
+            return None, None
+        last = stored.last_session_date
+        width = _REPAIR_WINDOW_DAYS
+        while True:
+            lo = day - timedelta(days=width)
+            hi = min(day + timedelta(days=width), last) if last else day
+            nearby = await self._sessions.distinct_dates(item_id, start=lo, end=hi)
+            run = run_containing(day, nearby)
+            if run is None:
+                return None, None
+            if run[0] > lo and (run[1] < hi or hi == last):
+                break
+            width *= 2
+        return repair_session(stored, hours, day, nearby), run
+
+    async def _rebuild(
+        self, item_id: UUID | str, day: date
+    ) -> Tuple[ItemRollup, Optional[Tuple[date, date]]]:
+        if isinstance(self._sessions, SessionAggregates):
+            # Let the store do the SUM/DISTINCT; no session rows reach Python
+            aggregate = await self._sessions.aggregate(item_id)
+            dates = await self._sessions.distinct_dates(item_id)
+            return rollup_from_aggregate(aggregate, dates), run_containing(day, dates)
+
+        all_sessions: Iterable[Any] = list(await self._sessions.list_by_item(item_id))
+        dates = [_field(s, "session_date") for s in all_sessions]
+        return rebuild_rollup(all_sessions), run_containing(day, dates)
+
+    async def _save_item_rollup(
+        self, item: Any, rollup: ItemRollup, progress_pct: float
+    ) -> None:
+        # Optionally persist item rollups (implementation-defined): only the
+        # rollup fields the item already carries are written back.
+        if isinstance(item, dict):
+            item_dict = dict(item)
+        elif hasattr(item, "__dict__"):
+            item_dict = dict(item.__dict__)
+        else:
+            return
+        if "total_hours" not in item_dict:
+            return
+
+        updates = {
+            "total_hours": rollup.total_hours,
+            "progress_pct": progress_pct,
+            "streak_current": rollup.streak_current,
+            "streak_longest": rollup.streak_longest,
+            "last_session_date": (
+                rollup.last_session_date.isoformat()
+                if rollup.last_session_date
+                else None
+            ),
+            "streak_state": rollup.streak.to_json(),
+        }
+        updates = {k: v for k, v in updates.items() if k in item_dict}
+        if hasattr(item, "model_copy"):
+            # the stored item was validated on its way in; skip re-validation
+            await self._items.save(item.model_copy(update=updates))
+            return
+        item_dict.update(updates)
+        await self._items.save(type(item)(**item_dict))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+
+from core.services.points import DEFAULT_WEIGHTS
+from infrastructure.persistence.sqlite.rebuild import RebuildProgress, rebuild_rollups
+
+
+def report(p: RebuildProgress) -> None:
+    print(
+        f"[{p.shards_done}/{p.shards_total}] items={p.items} sessions={p.sessions} "
+        f"points_changed={p.points_changed} {p.sessions_per_second:,.0f} sessions/s",
+        file=sys.stderr,
+    )
+
+
+async def run():
+    p = argparse.ArgumentParser(
+        description="SmartTracker — recompute points and item rollups after a weights change"
+    )
+    p.add_argument("--db", required=True)
+    p.add_argument(
+        "--weights",
+        default=None,
+        help='JSON difficulty weights, e.g. \'{"beginner": 1, "expert": 2.5}\' (default: built-in)',
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="processes (default=CPU count, 0=in-process)",
+    )
+    p.add_argument("--shards", type=int, default=None)
+    args = p.parse_args()
+
+    weights = json.loads(args.weights) if args.weights else DEFAULT_WEIGHTS
+    done = await rebuild_rollups(
+        args.db, weights, workers=args.workers, shards=args.shards, progress=report
+    )
+    print(
+        json.dumps(
+            {
+                "items": done.items,
+                "sessions": done.sessions,
+                "points_changed": done.points_changed,
+                "seconds": round(done.elapsed, 3),
+                "sessions_per_second": round(done.sessions_per_second, 1),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,191 @@
+# src/infrastructure/persistence/cache.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Read-through LRU/TTL caching decorators for ItemRepository and ConfigRepository, invalidated on writes.
+# Role: Infrastructure/UI/Tests/Config
+
+from __future__ import annotations
+
+import copy
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from uuid import UUID
+
+from ports.repositories import ConfigRepository, ItemRepository
+
+__all__ = [
+    "CacheStats",
+    "LRUCache",
+    "CachedItemRepository",
+    "CachedConfigRepository",
+]
+
+DEFAULT_MAXSIZE = 256
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """Bounded mapping with least-recently-used eviction and an optional TTL.
+
+    Entries older than `ttl` seconds (by `clock`) count as misses. Every
+    invalidation bumps `generation`, which lets callers drop a value they
+    loaded while a write to the same store was in flight.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self.generation = 0
+        self._clock = clock
+        self._data: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """(True, value) on a hit, (False, None) on a miss or expired entry."""
+        entry = self._data.get(key)
+        if entry is not None and (
+            self.ttl is None or self._clock() - entry[0] < self.ttl
+        ):
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return True, entry[1]
+        if entry is not None:
+            del self._data[key]
+        self.stats.misses += 1
+        return False, None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (self._clock(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop `key`, or everything when `key` is None."""
+        self.generation += 1
+        self.stats.invalidations += 1
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
+
+
+def _item_key(item: Any) -> str:
+    item_id = item.get("item_id") if isinstance(item, dict) else item.item_id
+    return str(item_id)
+
+
+class _ReadThrough:
+    def __init__(self, inner: Any, cache: LRUCache):
+        self._inner = inner
+        self.cache = cache
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    def __getattr__(self, name: str) -> Any:
+        # anything not cached (e.g. `load_frame`) goes straight to the store
+        return getattr(self._inner, name)
+
+    async def _read(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        hit, value = self.cache.get(key)
+        if not hit:
+            generation = self.cache.generation
+            value = await load()
+            # a write landed while loading: the value may predate it
+            if self.cache.generation == generation:
+                self.cache.put(key, value)
+        # callers get their own copy, so edits never leak into the cache
+        return copy.copy(value)
+
+
+class CachedItemRepository(_ReadThrough, ItemRepository):
+    """Read-through cache in front of any `ItemRepository`.
+
+    `get_by_id` is served from a bounded LRU (optionally expiring after `ttl`
+    seconds); a miss loads from `inner`, and lookups that raise (unknown
+    items) are not cached. `save` writes to `inner` and then invalidates
+    that item. With `write_through=True` it stores the saved object instead,
+    which is only correct when saved items have the same shape as the ones
+    `get_by_id` returns, as in `LogSessionUseCase`. Other methods pass
+    through to `inner`. Counters are on `stats`.
+    """
+
+    def __init__(
+        self,
+        inner: ItemRepository,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: Optional[float] = None,
+        *,
+        write_through: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(inner, LRUCache(maxsize, ttl, clock))
+        self._write_through = write_through
+
+    async def get_by_id(self, item_id: UUID | str) -> Any:
+        key = str(item_id)
+        return await self._read(key, lambda: self._inner.get_by_id(item_id))
+
+    async def save(self, item: Any) -> Any:
+        key = _item_key(item)
+        try:
+            saved = await self._inner.save(item)
+        finally:
+            # also on failure: the store may hold either version now
+            self.cache.invalidate(key)
+        if self._write_through:
+            self.cache.put(key, copy.copy(item))
+        return saved
+
+
+class CachedConfigRepository(_ReadThrough, ConfigRepository):
+    """Read-through cache in front of any `ConfigRepository`; `set`
+    invalidates the key it writes. Same options as `CachedItemRepository`."""
+
+    def __init__(
+        self,
+        inner: ConfigRepository,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(inner, LRUCache(maxsize, ttl, clock))
+
+    async def get(self, key: str) -> Dict[str, Any]:
+        return await self._read(key, lambda: self._inner.get(key))
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        try:
+            await self._inner.set(key, value)
+        finally:
+            self.cache.invalidate(key)
@@ -0,0 +1,5 @@
+# src/infrastructure/persistence/memory/__init__.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Marks the `memory` subpackage. Implements in-process, DataFrame-backed adapters.
+# Role: Infrastructure/UI/Tests/Config
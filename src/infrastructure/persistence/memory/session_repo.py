@@ -0,0 +1,283 @@
+# src/infrastructure/persistence/memory/session_repo.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Implements SessionRepository as columnar in-memory buffers laid out like SESSIONS_SCHEMA.
+# Role: Infrastructure/UI/Tests/Config
+
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Set
+from uuid import UUID
+
+import numpy as np
+import pandas as pd
+
+from core.dataframes.schemas import SESSIONS_SCHEMA, coerce_sessions_df
+from core.services.gamification import gamification_from_df
+from core.services.streaks import _to_date, streak_runs
+from core.types.dtos import GamificationStateDTO, SessionAggregateDTO
+from ports.repositories import SessionRepository
+
+DEFAULT_CAPACITY = 1024
+DEFAULT_LOAD_BATCH = 5000
+
+_FLOAT_COLUMNS = ("hour_spent", "points_awarded", "progress_pct")
+
+# Columns returned by `list_by_item`, named as the SQLite repository names them
+_ROW_COLUMNS = {
+    "session_id": "session_id",
+    "item_id": "item_id",
+    "session_date": "session_date",
+    "hours_spent": "hour_spent",
+    "difficulty": "difficulty",
+    "status": "status",
+    "points_awarded": "points_awarded",
+    "progress_pct": "progress_pct",
+    "language_code": "language_code",
+}
+
+
+def _field(session: Any, name: str, default: Any = None) -> Any:
+    if isinstance(session, dict):
+        return session.get(name, default)
+    return getattr(session, name, default)
+
+
+def _plain(value: Any) -> Any:
+    # enum members are stored by value, ids as strings
+    if isinstance(value, UUID):
+        return str(value)
+    return getattr(value, "value", value)
+
+
+def _session_values(session: Any) -> Dict[str, Any]:
+    hours = _field(session, "hours_spent")
+    if hours is None:
+        hours = _field(session, "hour_spent")
+    day = _to_date(_field(session, "session_date"))
+    tags = _field(session, "tags")
+    values = {col: _plain(_field(session, col)) for col in SESSIONS_SCHEMA}
+    values.update(
+        session_id=str(_field(session, "session_id")),
+        item_id=str(_field(session, "item_id")),
+        session_date=day.isoformat(),
+        hour_spent=float(hours),
+        points_awarded=float(_field(session, "points_awarded", 0.0) or 0.0),
+        progress_pct=float(_field(session, "progress_pct", 0.0) or 0.0),
+        tags=list(tags) if tags else [],
+    )
+    values["_day"] = np.datetime64(day, "D")
+    return values
+
+
+class InMemorySessionRepository(SessionRepository):
+    """Sessions held in one growable buffer per `SESSIONS_SCHEMA` column.
+
+    Buffers double when full, so appends are amortized O(1). `session_id` and
+    `item_id` indexes map to row positions, making upserts and `list_by_item`
+    lookups instead of scans. `load_from` / `flush_to` move rows in bulk
+    between this store and another repository such as SQLite.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._n = 0
+        self._capacity = 0
+        self._cols: Dict[str, np.ndarray] = {}
+        self._by_id: Dict[str, int] = {}
+        self._by_item: Dict[str, List[int]] = {}
+        self._dirty: Set[int] = set()
+        self._grow(max(capacity, 1))
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def _grow(self, needed: int) -> None:
+        capacity = max(self._capacity, 1)
+        while capacity < needed:
+            capacity *= 2
+        if capacity == self._capacity:
+            return
+        cols: Dict[str, np.ndarray] = {}
+        for col in (*SESSIONS_SCHEMA, "_day"):
+            if col == "_day":
+                buf = np.empty(capacity, dtype="datetime64[D]")
+            elif col in _FLOAT_COLUMNS:
+                buf = np.empty(capacity, dtype=np.float64)
+            else:
+                buf = np.empty(capacity, dtype=object)
+            if self._n:
+                buf[: self._n] = self._cols[col][: self._n]
+            cols[col] = buf
+        self._cols = cols
+        self._capacity = capacity
+
+    def _write(self, values: Dict[str, Any]) -> None:
+        session_id = values["session_id"]
+        pos = self._by_id.get(session_id)
+        if pos is None:
+            pos = self._n
+            self._n += 1
+            self._by_id[session_id] = pos
+            self._by_item.setdefault(values["item_id"], []).append(pos)
+        else:
+            previous = self._cols["item_id"][pos]
+            if previous != values["item_id"]:
+                self._by_item[previous].remove(pos)
+                if not self._by_item[previous]:
+                    del self._by_item[previous]
+                self._by_item.setdefault(values["item_id"], []).append(pos)
+        for col, value in values.items():
+            self._cols[col][pos] = value
+        self._dirty.add(pos)
+
+    # ---------- SessionRepository ----------
+
+    async def save(self, session: Any) -> Any:
+        values = _session_values(session)
+        self._grow(self._n + 1)
+        self._write(values)
+        return session
+
+    async def save_many(self, sessions: Iterable[Any]) -> list[Any]:
+        """Upsert a batch; every row is converted before any is written, so a
+        bad row leaves the store untouched."""
+        saved = list(sessions)
+        rows = [_session_values(s) for s in saved]
+        self._grow(self._n + len(rows))
+        for values in rows:
+            self._write(values)
+        return saved
+
+    async def exists(self, session_id: UUID | str) -> bool:
+        return str(session_id) in self._by_id
+
+    def _positions(self, item_id: UUID | str | None) -> np.ndarray:
+        if item_id is None:
+            return np.arange(self._n)
+        return np.asarray(self._by_item.get(str(item_id), ()), dtype=np.int64)
+
+    async def list_by_item(self, item_id: UUID | str) -> Iterable[Any]:
+        pos = self._positions(item_id)
+        pos = pos[np.lexsort((pos, self._cols["_day"][pos]))]
+        columns = {
+            key: self._cols[col][pos].tolist() for key, col in _ROW_COLUMNS.items()
+        }
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    # ---------- Aggregates ----------
+
+    def _aggregate(self, item_id: str | None, pos: np.ndarray) -> SessionAggregateDTO:
+        if pos.size == 0:
+            return SessionAggregateDTO(item_id=item_id)
+        days = self._cols["_day"][pos]
+        return SessionAggregateDTO(
+            item_id=item_id,
+            session_count=int(pos.size),
+            total_hours=float(self._cols["hour_spent"][pos].sum()),
+            total_points=float(self._cols["points_awarded"][pos].sum()),
+            first_session_date=days.min().item(),
+            last_session_date=days.max().item(),
+        )
+
+    async def aggregate(self, item_id: UUID | str | None = None) -> SessionAggregateDTO:
+        key = None if item_id is None else str(item_id)
+        return self._aggregate(key, self._positions(item_id))
+
+    async def aggregate_by_item(self) -> Dict[str, SessionAggregateDTO]:
+        return {
+            item_id: self._aggregate(item_id, self._positions(item_id))
+            for item_id in self._by_item
+        }
+
+    async def distinct_dates(
+        self,
+        item_id: UUID | str | None = None,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> List[date]:
+        days = np.unique(self._cols["_day"][self._positions(item_id)])
+        if start is not None:
+            days = days[days >= np.datetime64(_to_date(start), "D")]
+        if end is not None:
+            days = days[days <= np.datetime64(_to_date(end), "D")]
+        return days.tolist()
+
+    async def streaks_by_item(
+        self,
+        item_ids: Iterable[UUID | str] | None = None,
+        *,
+        today: date | str | None = None,
+    ) -> Dict[str, Dict[str, int]]:
+        keys = self._by_item if item_ids is None else [str(i) for i in item_ids]
+        out: Dict[str, Dict[str, int]] = {}
+        for key in keys:
+            if key not in self._by_item:
+                continue
+            runs = streak_runs(self._cols["_day"][self._positions(key)], today=today)
+            if runs.longest:
+                out[key] = {"current": runs.current, "longest": runs.longest}
+        return out
+
+    async def gamification_state(
+        self, *, today: date | str | None = None
+    ) -> GamificationStateDTO:
+        return gamification_from_df(self.to_frame(), today=today)
+
+    # ---------- Frames and bulk transfer ----------
+
+    def to_frame(self) -> pd.DataFrame:
+        """A `SESSIONS_SCHEMA` frame of the stored rows (a copy)."""
+        frame = pd.DataFrame(
+            {col: self._cols[col][: self._n].copy() for col in SESSIONS_SCHEMA}
+        )
+        return coerce_sessions_df(frame, inplace=True)
+
+    async def load_from(self, source: Any, batch_size: int = DEFAULT_LOAD_BATCH) -> int:
+        """Bulk load every session from `source` (e.g. `SQLiteSessionRepository`).
+
+        Streams with `source.iter_all()` and writes in batches of
+        `batch_size`. Loaded rows start clean, so they are not flushed back.
+        Returns the number of rows loaded.
+        """
+        loaded = 0
+        batch: List[Any] = []
+        async for row in source.iter_all(batch_size=batch_size):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                loaded += await self._load(batch)
+                batch = []
+        if batch:
+            loaded += await self._load(batch)
+        return loaded
+
+    async def _load(self, batch: List[Any]) -> int:
+        dirty = set(self._dirty)
+        await self.save_many(batch)
+        # keep rows that were already pending; the loaded ones are in sync
+        self._dirty = dirty
+        return len(batch)
+
+    async def flush_to(self, target: SessionRepository, dirty_only: bool = True) -> int:
+        """Write rows to `target` with one `save_many` call.
+
+        By default only rows saved since the last load/flush are written.
+        Returns the number of rows flushed.
+        """
+        pos = sorted(self._dirty) if dirty_only else range(self._n)
+        rows = [
+            SimpleNamespace(
+                **{key: self._cols[col][p] for key, col in _ROW_COLUMNS.items()}
+            )
+            for p in pos
+        ]
+        if rows:
+            await target.save_many(rows)
+        self._dirty.clear()
+        return len(rows)
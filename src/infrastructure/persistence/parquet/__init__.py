@@ -0,0 +1,5 @@
+# src/infrastructure/persistence/parquet/__init__.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Marks the `parquet` subpackage. Implements read-only Parquet snapshots of the SQLite store.
+# Role: Infrastructure/UI/Tests/Config
@@ -0,0 +1,246 @@
+# src/infrastructure/persistence/parquet/export.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Exports sessions/items from SQLite to Parquet partitioned by year/month/language, incrementally, with pruning readers.
+# Role: Infrastructure/UI/Tests/Config
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from core.dataframes.schemas import (
+    ITEMS_SCHEMA,
+    SESSIONS_SCHEMA,
+    TAGS_DTYPE,
+    coercion_plan,
+    empty_sessions_df,
+)
+from infrastructure.persistence.sqlite.item_repo import SQLiteItemRepository
+from infrastructure.persistence.sqlite.session_repo import SQLiteSessionRepository
+
+__all__ = ["ExportResult", "ParquetExporter", "read_items", "read_sessions"]
+
+MANIFEST = "_manifest.json"
+PART_FILE = "part-0.parquet"
+
+# Hive layout: sessions/year=2025/month=8/language_code=py/part-0.parquet.
+# Partition keys are not repeated inside the files; a NULL language goes to
+# pyarrow's default null partition.
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+PARTITIONING = ds.partitioning(
+    pa.schema(
+        [("year", pa.int16()), ("month", pa.int8()), ("language_code", pa.string())]
+    ),
+    flavor="hive",
+)
+
+# One file schema for every partition, so the dataset never has to unify
+_SESSIONS_FILE_SCHEMA = pa.Schema.from_pandas(
+    empty_sessions_df().drop(columns="language_code"), preserve_index=False
+)
+
+# Arrow -> SESSIONS_SCHEMA/ITEMS_SCHEMA dtypes, applied while converting
+_PANDAS_TYPES = {
+    pa.string(): pd.StringDtype(),
+    pa.float64(): pd.Float64Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.list_(pa.string()): TAGS_DTYPE,
+}
+
+PartitionKey = Tuple[int, int, Optional[str]]
+
+
+def _partition_dir(key: PartitionKey) -> str:
+    year, month, language = key
+    return f"year={year}/month={month}/language_code={language or NULL_PARTITION}"
+
+
+def _month_bounds(year: int, month: int) -> Tuple[date, date]:
+    first = date(year, month, 1)
+    following = date(year + month // 12, month % 12 + 1, 1)
+    return first, following - timedelta(days=1)
+
+
+def _write_atomic(table: pa.Table, path: Path) -> None:
+    # readers see either the previous file or the new one, never a partial one.
+    # pandas metadata is dropped: it names the Arrow-backed tags dtype in a form
+    # pandas cannot parse back; readers map Arrow types themselves.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    pq.write_table(table.replace_schema_metadata(None), tmp)
+    os.replace(tmp, path)
+
+
+@dataclass
+class ExportResult:
+    written: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    items_written: bool = False
+
+
+class ParquetExporter:
+    """Snapshots the SQLite store under `root` for dashboards.
+
+    Sessions are written per (year, month, language_code) partition and
+    items to a single file. `_manifest.json` records each partition's
+    fingerprint (row count, `version` sum, latest `updated_at`) from the
+    last export; `export` rewrites only partitions whose fingerprint moved
+    and deletes partitions that no longer have rows. Reads go through the
+    repositories' read connections, so the writer is never blocked.
+    """
+
+    def __init__(
+        self,
+        sessions: SQLiteSessionRepository,
+        items: SQLiteItemRepository,
+        root: str | Path,
+    ):
+        self._sessions = sessions
+        self._items = items
+        self.root = Path(root)
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        path = self.root / MANIFEST
+        if not path.exists():
+            return {"sessions": {}, "items": None}
+        return json.loads(path.read_text())
+
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        tmp = self.root / f".{MANIFEST}.tmp"
+        tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+        os.replace(tmp, self.root / MANIFEST)
+
+    async def export(self, full: bool = False) -> ExportResult:
+        """Bring the snapshot up to date; `full=True` rewrites everything."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        previous = {"sessions": {}, "items": None} if full else self._load_manifest()
+        result = ExportResult()
+
+        current = {
+            _partition_dir(key): (key, list(fp))
+            for key, fp in (await self._sessions.partition_versions()).items()
+        }
+        stale = {
+            name: key
+            for name, (key, fp) in current.items()
+            if previous["sessions"].get(name) != fp
+        }
+        # changed partitions are loaded a month at a time (one range scan)
+        months = sorted({key[:2] for key in stale.values()})
+        for year, month in months:
+            start, end = _month_bounds(year, month)
+            frame = await self._sessions.load_frame(start=start, end=end)
+            for language, part in frame.groupby("language_code", dropna=False):
+                name = _partition_dir(
+                    (year, month, None if pd.isna(language) else language)
+                )
+                if name in stale:
+                    self._write_sessions(part, name)
+                    result.written.append(name)
+        for name in previous["sessions"]:
+            if name not in current:
+                (self.root / "sessions" / name / PART_FILE).unlink(missing_ok=True)
+                result.removed.append(name)
+        result.unchanged = len(current) - len(stale)
+
+        items_fp = list(await self._items.version_summary())
+        if items_fp != previous["items"]:
+            frame = await self._items.load_frame()
+            _write_atomic(
+                pa.Table.from_pandas(frame, preserve_index=False),
+                self.root / "items" / PART_FILE,
+            )
+            result.items_written = True
+
+        self._save_manifest(
+            {
+                "sessions": {name: fp for name, (_, fp) in current.items()},
+                "items": items_fp,
+            }
+        )
+        return result
+
+    def _write_sessions(self, part: pd.DataFrame, name: str) -> None:
+        table = pa.Table.from_pandas(
+            part.drop(columns="language_code"),
+            schema=_SESSIONS_FILE_SCHEMA,
+            preserve_index=False,
+        )
+        _write_atomic(table, self.root / "sessions" / name / PART_FILE)
+
+
+# ---------- Readers ----------
+
+
+def _is_in(name: str, values: Iterable[Any]) -> ds.Expression:
+    values = list(values)
+    present = [v for v in values if v is not None]
+    expr = ds.field(name).isin(present) if present else None
+    if len(present) < len(values):
+        null = ds.field(name).is_null()
+        expr = null if expr is None else expr | null
+    return expr if expr is not None else ds.scalar(False)
+
+
+def _to_frame(table: pa.Table, schema: Dict[str, object]) -> pd.DataFrame:
+    df = table.to_pandas(types_mapper=_PANDAS_TYPES.get)
+    known = {col: dtype for col, dtype in schema.items() if col in df.columns}
+    return coercion_plan(known).apply(df, allow_extra=True, inplace=True)
+
+
+def read_sessions(
+    root: str | Path,
+    columns: Sequence[str] | None = None,
+    *,
+    years: Iterable[int] | None = None,
+    months: Iterable[int] | None = None,
+    languages: Iterable[str | None] | None = None,
+) -> pd.DataFrame:
+    """Sessions from an export as a `SESSIONS_SCHEMA` frame.
+
+    `years`/`months`/`languages` prune whole partition directories before
+    any file is opened (`None` in `languages` selects sessions without
+    one); `columns` limits what is read from each file. `year`/`month` can
+    be requested as columns too.
+    """
+    path = Path(root) / "sessions"
+    if not path.exists():
+        frame = empty_sessions_df()
+        return frame if columns is None else frame[list(columns)]
+    dataset = ds.dataset(path, format="parquet", partitioning=PARTITIONING)
+    filters = [
+        _is_in(name, values)
+        for name, values in (
+            ("year", years),
+            ("month", months),
+            ("language_code", languages),
+        )
+        if values is not None
+    ]
+    expr = None
+    for f in filters:
+        expr = f if expr is None else expr & f
+    if columns is None:
+        columns = list(SESSIONS_SCHEMA)
+    table = dataset.to_table(columns=list(columns), filter=expr)
+    return _to_frame(table, SESSIONS_SCHEMA)
+
+
+def read_items(root: str | Path, columns: Sequence[str] | None = None) -> pd.DataFrame:
+    """Items from an export: `ITEMS_SCHEMA` columns followed by the rollups."""
+    table = pq.read_table(
+        Path(root) / "items" / PART_FILE,
+        columns=None if columns is None else list(columns),
+    )
+    return _to_frame(table, ITEMS_SCHEMA)
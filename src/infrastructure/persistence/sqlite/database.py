@@ -10,13 +10,18 @@ from pathlib import Path
 
 import aiosqlite
 
+from infrastructure.persistence.sqlite.migrations import Migration, migrate
+
 DDL = {
     "items": """
     CREATE TABLE IF NOT EXISTS items (
         item_id TEXT PRIMARY KEY,
         target_hours REAL NOT NULL,
         total_hours REAL NOT NULL DEFAULT 0,
-        progress_pct REAL NOT NULL DEFAULT 0
+        progress_pct REAL NOT NULL DEFAULT 0,
+        streak_current INTEGER NOT NULL DEFAULT 0,
+        streak_longest INTEGER NOT NULL DEFAULT 0,
+        last_session_date TEXT
     );
     """,
     "sessions": """
@@ -34,11 +39,101 @@ DDL = {
     """,
 }
 
+# Columns added after tables may already exist on disk; CREATE TABLE IF NOT
+# EXISTS leaves older files untouched, so these are added with ALTER TABLE.
+ADDED_COLUMNS = {
+    "items": {
+        "streak_current": "INTEGER NOT NULL DEFAULT 0",
+        "streak_longest": "INTEGER NOT NULL DEFAULT 0",
+        "last_session_date": "TEXT",
+    },
+}
+
+
+async def _add_columns(
+    conn: aiosqlite.Connection, table: str, columns: dict[str, str]
+) -> None:
+    cur = await conn.execute(f"PRAGMA table_info({table})")
+    existing = {row[1] for row in await cur.fetchall()}
+    await cur.close()
+    for name, decl in columns.items():
+        if name not in existing:
+            await conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+
+
+async def _add_missing_columns(conn: aiosqlite.Connection) -> None:
+    for table, columns in ADDED_COLUMNS.items():
+        await _add_columns(conn, table, columns)
+
+
+# ---------- Migrations ----------
+
+
+async def _create_base_tables(conn: aiosqlite.Connection) -> None:
+    # Also adopts files created before migrations existed (user_version 0)
+    for sql in DDL.values():
+        await conn.execute(sql)
+    await _add_missing_columns(conn)
+
+
+async def _index_sessions_by_item_date(conn: aiosqlite.Connection) -> None:
+    # Serves list_by_item's ORDER BY without a sort, and covers the SQL-side
+    # aggregates (hours/points sums, distinct dates) without touching the table.
+    await conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_sessions_item_date
+        ON sessions (item_id, session_date, session_id, hours_spent, points_awarded)
+        """
+    )
+    await conn.execute("ANALYZE")
+
+
+async def _index_sessions_by_date(conn: aiosqlite.Connection) -> None:
+    # Keyset pagination over all sessions orders by (session_date, session_id)
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions (session_date, session_id)"
+    )
+    await conn.execute("ANALYZE")
+
+
+async def _add_item_streak_state(conn: aiosqlite.Connection) -> None:
+    # Serialized StreakState; NULL means "rebuild on next log"
+    await _add_columns(conn, "items", {"streak_state": "TEXT"})
+
+
+async def _add_session_language(conn: aiosqlite.Connection) -> None:
+    await _add_columns(conn, "sessions", {"language_code": "TEXT"})
+
+
+async def _add_change_tracking(conn: aiosqlite.Connection) -> None:
+    # Upserts stamp updated_at and bump version when a row actually changes;
+    # rows written before this migration keep updated_at NULL and version 1
+    for table in ("sessions", "items"):
+        await _add_columns(
+            conn,
+            table,
+            {"updated_at": "TEXT", "version": "INTEGER NOT NULL DEFAULT 1"},
+        )
+
+
+MIGRATIONS = (
+    Migration(1, "base tables", _create_base_tables),
+    Migration(
+        2,
+        "covering index on sessions(item_id, session_date)",
+        _index_sessions_by_item_date,
+    ),
+    Migration(
+        3, "index on sessions(session_date, session_id)", _index_sessions_by_date
+    ),
+    Migration(4, "items.streak_state", _add_item_streak_state),
+    Migration(5, "sessions.language_code", _add_session_language),
+    Migration(6, "sessions/items updated_at and version", _add_change_tracking),
+)
+
 
 async def open_db(path: str | Path = ":memory:") -> aiosqlite.Connection:
     conn = await aiosqlite.connect(str(path))
     await conn.execute("PRAGMA journal_mode=WAL;")
-    for sql in DDL.values():
-        await conn.executescript(sql)
-    await conn.commit()
+    await migrate(conn, MIGRATIONS)
     return conn
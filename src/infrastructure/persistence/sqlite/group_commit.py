@@ -0,0 +1,198 @@
+# src/infrastructure/persistence/sqlite/group_commit.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Write-behind group commit for SQLite. Queues writes and commits them together every N rows or M milliseconds.
+# Role: Infrastructure/UI/Tests/Config
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, Sequence
+
+import aiosqlite
+
+__all__ = ["GroupCommitWriter"]
+
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_DELAY_MS = 5.0
+
+
+@dataclass
+class _Op:
+    sql: str
+    params: Any
+    many: bool
+    future: asyncio.Future = field(repr=False)
+
+    @property
+    def rows(self) -> int:
+        return len(self.params) if self.many else 1
+
+
+_STOP = object()
+
+
+def _fail(ops: Iterable[_Op], exc: BaseException) -> None:
+    for op in ops:
+        if not op.future.done():
+            op.future.set_exception(exc)
+
+
+class GroupCommitWriter:
+    """Funnels writes for one connection through a single flusher task.
+
+    `submit` enqueues a statement and returns a future that resolves once the
+    transaction containing it has been committed; the flusher commits as soon
+    as `max_batch` rows are queued or `max_delay_ms` has passed since the first
+    one. If a batch fails it is rolled back and replayed one operation per
+    commit, so only the offending write sees the error. Writes submitted once
+    `stop` has begun are refused, and any write the flusher can no longer
+    commit (it crashed or was cancelled) fails instead of waiting forever.
+
+    While a writer is attached, every write on its connection must go through
+    it; statements issued directly would land in the writer's open transaction.
+    """
+
+    def __init__(
+        self,
+        conn: aiosqlite.Connection,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay_ms: float = DEFAULT_MAX_DELAY_MS,
+    ):
+        if max_batch <= 0 or max_delay_ms < 0:
+            raise ValueError("max_batch must be positive and max_delay_ms >= 0")
+        self._db = conn
+        self._max_batch = max_batch
+        self._max_delay = max_delay_ms / 1000.0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._arrived = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        # the batch being collected or flushed, failed if the flusher dies
+        self._inflight: list[_Op] = []
+        self.commits = 0
+        self.rows = 0
+
+    # ---------- lifecycle ----------
+
+    async def start(self) -> "GroupCommitWriter":
+        if self._task is None:
+            self._closing = False
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    async def stop(self) -> None:
+        """Flush everything queued so far, then stop the flusher."""
+        if self._task is None:
+            return
+        self._closing = True
+        self._queue.put_nowait(_STOP)
+        self._arrived.set()
+        await self._task
+        self._task = None
+
+    async def __aenter__(self) -> "GroupCommitWriter":
+        return await self.start()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.stop()
+
+    # ---------- submission ----------
+
+    def submit(self, sql: str, params: Sequence[Any] = ()) -> asyncio.Future:
+        return self._enqueue(sql, tuple(params), many=False)
+
+    def submit_many(self, sql: str, rows: Iterable[Sequence[Any]]) -> asyncio.Future:
+        """One `executemany`; all rows commit (or fail) together."""
+        return self._enqueue(sql, list(rows), many=True)
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+        await self.submit(sql, params)
+
+    async def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        await self.submit_many(sql, rows)
+
+    def _enqueue(self, sql: str, params: Any, many: bool) -> asyncio.Future:
+        if self._task is None:
+            raise RuntimeError("GroupCommitWriter is not started")
+        if self._closing:
+            raise RuntimeError("GroupCommitWriter is stopping")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_Op(sql, params, many, future))
+        self._arrived.set()
+        return future
+
+    # ---------- flusher ----------
+
+    async def _run(self) -> None:
+        try:
+            await self._serve()
+        finally:
+            # stopped, cancelled or crashed: nothing may be left waiting
+            leftover = self._inflight
+            while not self._queue.empty():
+                op = self._queue.get_nowait()
+                if op is not _STOP:
+                    leftover.append(op)
+            self._inflight = []
+            _fail(leftover, RuntimeError("GroupCommitWriter stopped before commit"))
+
+    async def _serve(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+            batch = self._inflight = [first]
+            rows = first.rows
+            deadline = loop.time() + self._max_delay
+            while rows < self._max_batch:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    # wait on the event rather than queue.get() so a timeout
+                    # can never drop an item that was dequeued at the same time
+                    self._arrived.clear()
+                    try:
+                        await asyncio.wait_for(self._arrived.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    continue
+                nxt = self._queue.get_nowait()
+                if nxt is _STOP:
+                    stopping = True
+                    break
+                batch.append(nxt)
+                rows += nxt.rows
+            try:
+                await self._flush(batch)
+            except Exception as exc:
+                # e.g. rollback() itself failed; keep serving later writes
+                _fail(batch, exc)
+            self._inflight = []
+
+    async def _flush(self, batch: list[_Op]) -> None:
+        try:
+            for op in batch:
+                if op.many:
+                    await self._db.executemany(op.sql, op.params)
+                else:
+                    await self._db.execute(op.sql, op.params)
+            await self._db.commit()
+        except Exception as exc:
+            await self._db.rollback()
+            if len(batch) == 1:
+                _fail(batch, exc)
+                return
+            for op in batch:
+                await self._flush([op])
+            return
+
+        self.commits += 1
+        for op in batch:
+            self.rows += op.rows
+            if not op.future.done():
+                op.future.set_result(None)
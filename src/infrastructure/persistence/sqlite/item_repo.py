@@ -6,25 +6,111 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Tuple
 from uuid import UUID
 
-import aiosqlite
+import pandas as pd
 
+from core.dataframes.schemas import coerce_items_df
+from infrastructure.persistence.sqlite.group_commit import GroupCommitWriter
+from infrastructure.persistence.sqlite.pool import Source, read_connection, writer_of
 from ports.repositories import ItemRepository
 
 
+def _get(item: Any, name: str, default: Any = None) -> Any:
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+_UPSERT_SQL = """
+    INSERT INTO items (item_id, target_hours, total_hours, progress_pct, streak_current, streak_longest, last_session_date, streak_state, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+    ON CONFLICT(item_id) DO UPDATE SET
+      target_hours=excluded.target_hours,
+      total_hours=excluded.total_hours,
+      progress_pct=excluded.progress_pct,
+      streak_current=excluded.streak_current,
+      streak_longest=excluded.streak_longest,
+      last_session_date=excluded.last_session_date,
+      streak_state=excluded.streak_state,
+      updated_at=excluded.updated_at,
+      version=items.version + 1
+    WHERE (items.target_hours, items.total_hours, items.progress_pct,
+           items.streak_current, items.streak_longest, items.last_session_date,
+           items.streak_state)
+      IS NOT (excluded.target_hours, excluded.total_hours, excluded.progress_pct,
+              excluded.streak_current, excluded.streak_longest,
+              excluded.last_session_date, excluded.streak_state)
+    """
+
+_UPDATE_ROLLUPS_SQL = """
+    UPDATE items
+    SET total_hours=?, progress_pct=?, streak_current=?, streak_longest=?,
+        last_session_date=?, streak_state=?,
+        updated_at=strftime('%Y-%m-%dT%H:%M:%fZ', 'now'), version=version + 1
+    WHERE item_id=? AND version=?
+      AND (total_hours, progress_pct, streak_current, streak_longest,
+           last_session_date, streak_state) IS NOT (?, ?, ?, ?, ?, ?)
+    """
+_ROLLUP_COLUMNS = (
+    "total_hours",
+    "progress_pct",
+    "streak_current",
+    "streak_longest",
+    "last_session_date",
+    "streak_state",
+)
+
+# ITEMS_SCHEMA columns the table has, plus the rollups as extra columns
+_FRAME_SQL = """
+    SELECT item_id, updated_at, version, target_hours, total_hours, progress_pct,
+           streak_current, streak_longest, last_session_date
+    FROM items ORDER BY item_id
+    """
+_FRAME_COLUMNS = (
+    "item_id",
+    "updated_at",
+    "version",
+    "target_hours",
+    "total_hours",
+    "progress_pct",
+    "streak_current",
+    "streak_longest",
+    "last_session_date",
+)
+
+
+def _item_params(item: Any) -> tuple:
+    last = _get(item, "last_session_date")
+    return (
+        getattr(item, "item_id", None) or item["item_id"],
+        float(getattr(item, "target_hours", None) or item["target_hours"]),
+        float(_get(item, "total_hours", 0.0)),
+        float(_get(item, "progress_pct", 0.0)),
+        int(_get(item, "streak_current", 0)),
+        int(_get(item, "streak_longest", 0)),
+        str(last) if last is not None else None,
+        _get(item, "streak_state"),
+    )
+
+
 class SQLiteItemRepository(ItemRepository):
-    def __init__(self, conn: aiosqlite.Connection):
-        self._db = conn
+    """Pass a started `GroupCommitWriter` as `writer` to batch commits."""
+
+    def __init__(self, conn: Source, writer: GroupCommitWriter | None = None):
+        self._source = conn
+        self._db = writer_of(conn)
+        self._writer = writer
 
     async def get_by_id(self, item_id: UUID | str) -> Any:
-        cur = await self._db.execute(
-            "SELECT item_id, target_hours, total_hours, progress_pct FROM items WHERE item_id=?",
-            (str(item_id),),
-        )
-        row = await cur.fetchone()
-        await cur.close()
+        async with read_connection(self._source) as db:
+            cur = await db.execute(
+                "SELECT item_id, target_hours, total_hours, progress_pct, streak_current, streak_longest, last_session_date, streak_state FROM items WHERE item_id=?",
+                (str(item_id),),
+            )
+            row = await cur.fetchone()
+            await cur.close()
         if not row:
             raise KeyError("item not found")
         return {
@@ -32,32 +118,60 @@ class SQLiteItemRepository(ItemRepository):
             "target_hours": float(row[1]),
             "total_hours": float(row[2]),
             "progress_pct": float(row[3]),
+            "streak_current": int(row[4]),
+            "streak_longest": int(row[5]),
+            "last_session_date": row[6],
+            "streak_state": row[7],
         }
 
     async def save(self, item: Any) -> Any:
-        await self._db.execute(
-            """
-            INSERT INTO items (item_id, target_hours, total_hours, progress_pct)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(item_id) DO UPDATE SET
-              target_hours=excluded.target_hours,
-              total_hours=excluded.total_hours,
-              progress_pct=excluded.progress_pct
-            """,
-            (
-                getattr(item, "item_id", None) or item["item_id"],
-                float(getattr(item, "target_hours", None) or item["target_hours"]),
-                float(
-                    getattr(item, "total_hours", 0.0)
-                    if isinstance(item, dict) is False
-                    else item.get("total_hours", 0.0)
-                ),
-                float(
-                    getattr(item, "progress_pct", 0.0)
-                    if isinstance(item, dict) is False
-                    else item.get("progress_pct", 0.0)
-                ),
-            ),
-        )
+        if self._writer is not None:
+            await self._writer.execute(_UPSERT_SQL, _item_params(item))
+            return item
+        await self._db.execute(_UPSERT_SQL, _item_params(item))
         await self._db.commit()
         return item
+
+    async def load_frame(self) -> pd.DataFrame:
+        """Every item as an `ITEMS_SCHEMA` frame, with the rollup columns
+        (`target_hours`, `total_hours`, `progress_pct`, streaks,
+        `last_session_date`) kept after the schema columns."""
+        async with read_connection(self._source) as db:
+            cur = await db.execute(_FRAME_SQL)
+            rows = await cur.fetchall()
+            await cur.close()
+        frame = pd.DataFrame.from_records(rows, columns=list(_FRAME_COLUMNS))
+        return coerce_items_df(frame, allow_extra=True, inplace=True)
+
+    async def version_summary(self) -> Tuple[int, int, str]:
+        """(count, version sum, latest updated_at); changes with any item write."""
+        async with read_connection(self._source) as db:
+            cur = await db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(version), 0), "
+                "COALESCE(MAX(updated_at), '') FROM items"
+            )
+            row = await cur.fetchone()
+            await cur.close()
+        return (row[0], row[1], row[2])
+
+    async def update_rollups(self, rollups: pd.DataFrame) -> None:
+        """Write rebuilt rollups in one transaction.
+
+        `rollups` is a `rollups_by_item` frame (indexed by item_id) plus the
+        `version` each item had when its sessions were read; items written
+        since then, or whose rollups already match, are left untouched.
+        """
+        rows = []
+        frame = rollups[[*_ROLLUP_COLUMNS, "version"]]
+        for item_id, *values, version in frame.itertuples():
+            values = [v.item() if hasattr(v, "item") else v for v in values]
+            rows.append((*values, str(item_id), int(version), *values))
+        if self._writer is not None:
+            await self._writer.executemany(_UPDATE_ROLLUPS_SQL, rows)
+            return
+        try:
+            await self._db.executemany(_UPDATE_ROLLUPS_SQL, rows)
+            await self._db.commit()
+        except BaseException:
+            await self._db.rollback()
+            raise
@@ -0,0 +1,61 @@
+# src/infrastructure/persistence/sqlite/migrations.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Minimal versioned migration runner for SQLite, tracked through PRAGMA user_version.
+# Role: Infrastructure/UI/Tests/Config
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Sequence
+
+import aiosqlite
+
+__all__ = ["Migration", "get_version", "migrate"]
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable[[aiosqlite.Connection], Awaitable[None]]
+
+
+async def get_version(conn: aiosqlite.Connection) -> int:
+    cur = await conn.execute("PRAGMA user_version")
+    row = await cur.fetchone()
+    await cur.close()
+    return int(row[0])
+
+
+async def migrate(
+    conn: aiosqlite.Connection,
+    migrations: Sequence[Migration],
+    target: int | None = None,
+) -> int:
+    """Apply pending migrations in version order, each in its own transaction.
+
+    Stops at `target` when given (used by tests to inspect older schemas).
+    Returns the resulting schema version.
+    """
+    versions = [m.version for m in migrations]
+    if versions != sorted(set(versions)):
+        raise ValueError("migration versions must be unique and ascending")
+
+    current = await get_version(conn)
+    for m in migrations:
+        if m.version <= current:
+            continue
+        if target is not None and m.version > target:
+            break
+        await conn.execute("BEGIN")
+        try:
+            await m.apply(conn)
+            # PRAGMA does not accept bound parameters; version is an int we own
+            await conn.execute(f"PRAGMA user_version = {int(m.version)}")
+            await conn.commit()
+        except BaseException:
+            await conn.rollback()
+            raise
+        current = m.version
+    return current
@@ -0,0 +1,93 @@
+# src/infrastructure/persistence/sqlite/pool.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Small aiosqlite pool with one writer and N read-only connections, plus routing helpers for repositories.
+# Role: Infrastructure/UI/Tests/Config
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, List, Union
+
+import aiosqlite
+
+from infrastructure.persistence.sqlite.database import open_db
+
+__all__ = ["SQLitePool", "open_pool", "open_reader", "writer_of", "read_connection"]
+
+DEFAULT_READERS = 4
+
+
+class SQLitePool:
+    """One writer connection plus N read-only connections on the same file.
+
+    Each aiosqlite connection runs on its own thread, so with WAL enabled
+    dashboard reads proceed on the readers while the writer is busy instead
+    of queueing behind it on a shared connection. With no readers (e.g. an
+    in-memory database) reads fall back to the writer.
+    """
+
+    def __init__(
+        self, writer: aiosqlite.Connection, readers: List[aiosqlite.Connection]
+    ):
+        self.writer = writer
+        self._readers = list(readers)
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        for conn in self._readers:
+            self._idle.put_nowait(conn)
+
+    @property
+    def size(self) -> int:
+        return len(self._readers)
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        if not self._readers:
+            yield self.writer
+            return
+        conn = await self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        for conn in self._readers:
+            await conn.close()
+        await self.writer.close()
+
+
+async def open_pool(
+    path: str | Path = ":memory:", readers: int = DEFAULT_READERS
+) -> SQLitePool:
+    """Open (and migrate) the writer, then attach `readers` connections with `mode=ro`."""
+    writer = await open_db(path)
+    if str(path) == ":memory:" or readers <= 0:
+        return SQLitePool(writer, [])
+    conns = [await open_reader(path) for _ in range(readers)]
+    return SQLitePool(writer, conns)
+
+
+async def open_reader(path: str | Path) -> aiosqlite.Connection:
+    """A read-only connection to an existing database file (`mode=ro`)."""
+    uri = Path(path).resolve().as_uri() + "?mode=ro"
+    return await aiosqlite.connect(uri, uri=True)
+
+
+Source = Union[aiosqlite.Connection, SQLitePool]
+
+
+def writer_of(source: Source) -> aiosqlite.Connection:
+    return source.writer if isinstance(source, SQLitePool) else source
+
+
+@asynccontextmanager
+async def read_connection(source: Source) -> AsyncIterator[aiosqlite.Connection]:
+    """Borrow a read connection: a pooled reader, or the single shared connection."""
+    if isinstance(source, SQLitePool):
+        async with source.reader() as conn:
+            yield conn
+    else:
+        yield source
@@ -0,0 +1,191 @@
+# src/infrastructure/persistence/sqlite/rebuild.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Rebuilds every session's points and every item's rollups, sharding items across a process pool.
+# Role: Infrastructure/UI/Tests/Config
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.services.points import DEFAULT_WEIGHTS, compute_points_batch
+from core.services.rollups import rollups_by_item
+from infrastructure.persistence.sqlite.database import open_db
+from infrastructure.persistence.sqlite.item_repo import SQLiteItemRepository
+from infrastructure.persistence.sqlite.pool import open_reader
+from infrastructure.persistence.sqlite.session_repo import SQLiteSessionRepository
+
+__all__ = ["RebuildProgress", "rebuild_rollups"]
+
+SHARDS_PER_WORKER = 4
+# items per `item_id IN (...)` query, well under SQLite's variable limit
+LOAD_ITEMS = 500
+
+
+@dataclass(frozen=True)
+class RebuildProgress:
+    """Running totals of a rebuild, reported after each shard is written."""
+
+    shards_done: int
+    shards_total: int
+    items: int
+    sessions: int
+    points_changed: int
+    elapsed: float
+
+    @property
+    def sessions_per_second(self) -> float:
+        return self.sessions / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class _ShardResult:
+    rollups: pd.DataFrame  # rollups_by_item plus the version read
+    points: List[Tuple[str, float, int]]  # changed (session_id, points, version)
+    sessions: int
+
+
+def _rebuild_shard(
+    path: str, items: Dict[str, Tuple[float, int]], weights: Dict[str, float]
+) -> _ShardResult:
+    """Process-pool entry point: read one shard, recompute it, return updates."""
+    return asyncio.run(_read_and_rebuild(path, items, weights))
+
+
+async def _read_and_rebuild(
+    path: str, items: Dict[str, Tuple[float, int]], weights: Dict[str, float]
+) -> _ShardResult:
+    ids = list(items)
+    conn = await open_reader(path)
+    try:
+        repo = SQLiteSessionRepository(conn)
+        frames = [
+            await repo.load_frame(item_ids=ids[i : i + LOAD_ITEMS])
+            for i in range(0, len(ids), LOAD_ITEMS)
+        ]
+    finally:
+        await conn.close()
+    sessions = pd.concat(frames, ignore_index=True)
+
+    targets = pd.Series({i: t for i, (t, _) in items.items()}, dtype=np.float64)
+    rollups = rollups_by_item(sessions, targets)
+    rollups["version"] = [items[i][1] for i in rollups.index]
+
+    points = compute_points_batch(sessions, weights=weights).to_numpy()
+    stored = sessions["points_awarded"].to_numpy(dtype=np.float64, na_value=np.nan)
+    changed = np.flatnonzero(points != stored)
+    return _ShardResult(
+        rollups,
+        list(
+            zip(
+                sessions["session_id"].to_numpy(dtype=object)[changed].tolist(),
+                points[changed].tolist(),
+                sessions["version"].to_numpy(dtype=np.int64)[changed].tolist(),
+            )
+        ),
+        len(sessions),
+    )
+
+
+def _shards(item_ids: List[str], count: int) -> List[List[str]]:
+    if not item_ids:
+        return []
+    size = -(-len(item_ids) // count)
+    return [item_ids[i : i + size] for i in range(0, len(item_ids), size)]
+
+
+async def rebuild_rollups(
+    path: str | Path,
+    weights: Dict[Any, float] = DEFAULT_WEIGHTS,
+    *,
+    workers: Optional[int] = None,
+    shards: Optional[int] = None,
+    progress: Optional[Callable[[RebuildProgress], None]] = None,
+) -> RebuildProgress:
+    """Recompute `points_awarded` for every session (with `weights`) and the
+    rollups (`total_hours`, `progress_pct`, streaks) of every item.
+
+    Items are split into `shards` (default `SHARDS_PER_WORKER` per worker).
+    Each shard is read over its own read-only connection and recomputed
+    with the vectorized services in one of `workers` processes (default: CPU
+    count; 0 runs shards in this process). The parent is the only writer:
+    each finished shard is written in two bulk transactions, and `progress`
+    is called with running totals and throughput. Returns the final totals.
+
+    Writes are guarded by the row `version` read with the shard, so sessions
+    and items changed while the job runs keep their newer values.
+    """
+    if str(path) == ":memory:":
+        raise ValueError("rebuild_rollups needs a database file")
+    path = str(path)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    plain_weights = {str(getattr(k, "value", k)): float(v) for k, v in weights.items()}
+    started = time.perf_counter()
+
+    db = await open_db(path)
+    try:
+        items_repo = SQLiteItemRepository(db)
+        sessions_repo = SQLiteSessionRepository(db)
+        items = await items_repo.load_frame()
+        info = {
+            str(i): (float(t), int(v))
+            for i, t, v in zip(
+                items["item_id"], items["target_hours"], items["version"]
+            )
+        }
+        count = shards or max(1, workers) * SHARDS_PER_WORKER
+        groups = _shards(sorted(info), max(1, min(count, len(info))))
+        tasks = [(path, {i: info[i] for i in group}, plain_weights) for group in groups]
+
+        done = 0
+        totals = RebuildProgress(0, len(tasks), 0, 0, 0, 0.0)
+
+        async def write(result: _ShardResult) -> None:
+            nonlocal done, totals
+            await sessions_repo.update_points(result.points)
+            await items_repo.update_rollups(result.rollups)
+            done += 1
+            totals = RebuildProgress(
+                done,
+                len(tasks),
+                totals.items + len(result.rollups),
+                totals.sessions + result.sessions,
+                totals.points_changed + len(result.points),
+                time.perf_counter() - started,
+            )
+            if progress is not None:
+                progress(totals)
+
+        if workers == 0:
+            for task in tasks:
+                await write(await _read_and_rebuild(*task))
+        elif tasks:
+            loop = asyncio.get_running_loop()
+            # spawn: forking a process with live aiosqlite threads is unsafe
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(workers, mp_context=context) as pool:
+                futures = [
+                    loop.run_in_executor(pool, _rebuild_shard, *t) for t in tasks
+                ]
+                for next_done in asyncio.as_completed(futures):
+                    await write(await next_done)
+        return RebuildProgress(
+            done,
+            len(tasks),
+            totals.items,
+            totals.sessions,
+            totals.points_changed,
+            time.perf_counter() - started,
+        )
+    finally:
+        await db.close()
@@ -6,64 +6,561 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Dict, Iterable, List, Tuple
 from uuid import UUID
 
-import aiosqlite
+import numpy as np
+import pandas as pd
 
+from core.dataframes.schemas import coerce_sessions_df, empty_sessions_df
+from core.services.streaks import _to_date
+from core.types.dtos import GamificationStateDTO, SessionAggregateDTO
+from infrastructure.persistence.sqlite.group_commit import GroupCommitWriter
+from infrastructure.persistence.sqlite.pool import Source, read_connection, writer_of
 from ports.repositories import SessionRepository
 
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_PAGE_SIZE = 2000
+
+_SESSION_COLUMNS = "session_id, item_id, session_date, hours_spent, difficulty, status, points_awarded, progress_pct, language_code"
+
+_UPSERT_SQL = """
+    INSERT INTO sessions (session_id, item_id, session_date, hours_spent, difficulty, status, points_awarded, progress_pct, language_code, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+    ON CONFLICT(session_id) DO UPDATE SET
+      item_id=excluded.item_id,
+      session_date=excluded.session_date,
+      hours_spent=excluded.hours_spent,
+      difficulty=excluded.difficulty,
+      status=excluded.status,
+      points_awarded=excluded.points_awarded,
+      progress_pct=excluded.progress_pct,
+      language_code=excluded.language_code,
+      updated_at=excluded.updated_at,
+      version=sessions.version + 1
+    WHERE (sessions.item_id, sessions.session_date, sessions.hours_spent,
+           sessions.difficulty, sessions.status, sessions.points_awarded,
+           sessions.progress_pct, sessions.language_code)
+      IS NOT (excluded.item_id, excluded.session_date, excluded.hours_spent,
+              excluded.difficulty, excluded.status, excluded.points_awarded,
+              excluded.progress_pct, excluded.language_code)
+    """
+
+_UPDATE_POINTS_SQL = """
+    UPDATE sessions
+    SET points_awarded=?, updated_at=strftime('%Y-%m-%dT%H:%M:%fZ', 'now'),
+        version=version + 1
+    WHERE session_id=? AND version=? AND points_awarded IS NOT ?
+    """
+
+# Row values for the frame loader: the row columns plus change tracking
+_FRAME_SQL_COLUMNS = f"{_SESSION_COLUMNS}, updated_at, version"
+
+# One fingerprint per (year, month, language) partition; any insert, update
+# or move changes the count, the version sum or the latest stamp
+_PARTITION_VERSIONS_SQL = """
+    SELECT CAST(strftime('%Y', session_date) AS INTEGER) AS y,
+           CAST(strftime('%m', session_date) AS INTEGER) AS m,
+           language_code,
+           COUNT(*), SUM(version), COALESCE(MAX(updated_at), '')
+    FROM sessions
+    GROUP BY y, m, language_code
+    """
+
+
+_AGGREGATE_COLUMNS = """
+    COUNT(*), COALESCE(SUM(hours_spent), 0), COALESCE(SUM(points_awarded), 0),
+    MIN(date(session_date)), MAX(date(session_date))
+    """
+
+
+# Gaps and islands: within a partition, consecutive days minus their row
+# number are constant, so each (key, grp) group is one run of days.
+_STREAKS_SQL = """
+    WITH days AS (
+        SELECT DISTINCT {key} AS k, CAST(julianday(date(session_date)) AS INTEGER) AS d
+        FROM sessions
+        WHERE date(session_date) <= :today {filter}
+    ),
+    islands AS (
+        SELECT k, d, d - ROW_NUMBER() OVER (PARTITION BY k ORDER BY d) AS grp
+        FROM days
+    ),
+    runs AS (
+        SELECT k, MAX(d) AS end_d, COUNT(*) AS len FROM islands GROUP BY k, grp
+    )
+    SELECT k,
+           COALESCE(MAX(CASE WHEN end_d = CAST(julianday(:today) AS INTEGER) THEN len END), 0),
+           MAX(len)
+    FROM runs GROUP BY k
+    """
+
+
+# One scan over sessions; the weekly window is [today - 6 days, today].
+_GAMIFICATION_SQL = """
+    SELECT COALESCE(SUM(points_awarded), 0),
+           COALESCE(SUM(CASE WHEN date(session_date) BETWEEN date(:today, '-6 days') AND :today
+                             THEN hours_spent END), 0),
+           COUNT(CASE WHEN date(session_date) BETWEEN date(:today, '-6 days') AND :today
+                      THEN 1 END),
+           COUNT(*),
+           COALESCE(SUM(hours_spent), 0),
+           COUNT(DISTINCT item_id),
+           COUNT(DISTINCT language_code),
+           MAX(date(session_date))
+    FROM sessions
+    """
+
+
+def _anchor(today: Any) -> str:
+    # a datetime must become its day: julianday() of a time past noon would
+    # round into the next day
+    return (_to_date(today) if today is not None else date.today()).isoformat()
+
+
+def _aggregate_from_row(item_id: str | None, row: tuple) -> SessionAggregateDTO:
+    return SessionAggregateDTO(
+        item_id=item_id,
+        session_count=row[0],
+        total_hours=row[1],
+        total_points=row[2],
+        first_session_date=row[3],
+        last_session_date=row[4],
+    )
+
+
+def _row_to_dict(r: tuple) -> dict:
+    return {
+        "session_id": r[0],
+        "item_id": r[1],
+        "session_date": r[2],
+        "hours_spent": r[3],
+        "difficulty": r[4],
+        "status": r[5],
+        "points_awarded": r[6],
+        "progress_pct": r[7],
+        "language_code": r[8],
+    }
+
+
+# `_FRAME_SQL_COLUMNS` in order, named as SESSIONS_SCHEMA names them
+_FRAME_COLUMNS = (
+    "session_id",
+    "item_id",
+    "session_date",
+    "hour_spent",
+    "difficulty",
+    "status",
+    "points_awarded",
+    "progress_pct",
+    "language_code",
+    "updated_at",
+    "version",
+)
+_FRAME_FLOATS = frozenset({"hour_spent", "points_awarded", "progress_pct"})
+
+
+def _rows_to_frame(rows: list, start: int = 0) -> pd.DataFrame:
+    # one typed buffer per column (REAL columns are NOT NULL, so float64 fits);
+    # schema columns the table lacks are filled by the coercion plan
+    n = len(rows)
+    cols: Dict[str, np.ndarray] = {}
+    for i, col in enumerate(_FRAME_COLUMNS):
+        if col in _FRAME_FLOATS:
+            cols[col] = np.fromiter((r[i] for r in rows), dtype=np.float64, count=n)
+        else:
+            buf = np.empty(n, dtype=object)
+            buf[:] = [r[i] for r in rows]
+            cols[col] = buf
+    frame = pd.DataFrame(cols, index=pd.RangeIndex(start, start + n), copy=False)
+    return coerce_sessions_df(frame, inplace=True)
+
+
+def _session_params(session: Any) -> tuple:
+    return (
+        getattr(session, "session_id"),
+        getattr(session, "item_id"),
+        str(getattr(session, "session_date")),
+        float(getattr(session, "hours_spent")),
+        getattr(session, "difficulty"),
+        getattr(session, "status"),
+        float(getattr(session, "points_awarded", 0.0)),
+        float(getattr(session, "progress_pct", 0.0)),
+        getattr(session, "language_code", None),
+    )
+
 
 class SQLiteSessionRepository(SessionRepository):
-    def __init__(self, conn: aiosqlite.Connection):
-        self._db = conn
+    """Writes go to the writer connection; reads go to a pooled read-only
+    connection when constructed with a `SQLitePool`, else to the same one.
+    Pass a started `GroupCommitWriter` as `writer` to batch commits."""
+
+    def __init__(
+        self,
+        conn: Source,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        writer: GroupCommitWriter | None = None,
+    ):
+        self._source = conn
+        self._db = writer_of(conn)
+        self._chunk_size = chunk_size
+        self._writer = writer
+
+    async def _read_all(self, sql: str, params: tuple | dict = ()) -> list:
+        async with read_connection(self._source) as db:
+            cur = await db.execute(sql, params)
+            rows = await cur.fetchall()
+            await cur.close()
+        return rows
+
+    async def _read_one(self, sql: str, params: tuple | dict = ()) -> Any:
+        async with read_connection(self._source) as db:
+            cur = await db.execute(sql, params)
+            row = await cur.fetchone()
+            await cur.close()
+        return row
 
     async def save(self, session: Any) -> Any:
-        await self._db.execute(
-            """
-            INSERT INTO sessions (session_id, item_id, session_date, hours_spent, difficulty, status, points_awarded, progress_pct)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(session_id) DO UPDATE SET
-              item_id=excluded.item_id,
-              session_date=excluded.session_date,
-              hours_spent=excluded.hours_spent,
-              difficulty=excluded.difficulty,
-              status=excluded.status,
-              points_awarded=excluded.points_awarded,
-              progress_pct=excluded.progress_pct
-            """,
-            (
-                getattr(session, "session_id"),
-                getattr(session, "item_id"),
-                str(getattr(session, "session_date")),
-                float(getattr(session, "hours_spent")),
-                getattr(session, "difficulty"),
-                getattr(session, "status"),
-                float(getattr(session, "points_awarded", 0.0)),
-                float(getattr(session, "progress_pct", 0.0)),
-            ),
-        )
+        if self._writer is not None:
+            # resolves once the group commit containing this row is durable
+            await self._writer.execute(_UPSERT_SQL, _session_params(session))
+            return session
+        await self._db.execute(_UPSERT_SQL, _session_params(session))
         await self._db.commit()
         return session
 
+    async def save_many(
+        self, sessions: Iterable[Any], chunk_size: int | None = None
+    ) -> list[Any]:
+        """Upsert many sessions with `executemany` inside a single transaction.
+
+        Rows are sent in chunks of `chunk_size` (defaults to the repository
+        setting) so the parameter buffer stays bounded; the commit happens once
+        at the end, and any failure rolls back the whole batch.
+        """
+        size = self._chunk_size if chunk_size is None else chunk_size
+        if size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        if self._writer is not None:
+            # one executemany entry, so the batch commits or fails as a unit
+            saved = list(sessions)
+            await self._writer.executemany(
+                _UPSERT_SQL, [_session_params(s) for s in saved]
+            )
+            return saved
+
+        saved: list[Any] = []
+        chunk: list[tuple] = []
+        try:
+            for session in sessions:
+                saved.append(session)
+                chunk.append(_session_params(session))
+                if len(chunk) >= size:
+                    await self._db.executemany(_UPSERT_SQL, chunk)
+                    chunk = []
+            if chunk:
+                await self._db.executemany(_UPSERT_SQL, chunk)
+            await self._db.commit()
+        except BaseException:
+            await self._db.rollback()
+            raise
+        return saved
+
+    async def update_points(self, points: Iterable[Tuple[str, float, int]]) -> None:
+        """Set `points_awarded` from `(session_id, points, version)` triples in
+        one transaction. `version` is the one the points were computed from:
+        sessions written since then, or whose points already match, are left
+        untouched."""
+        rows = [(float(p), str(sid), int(v), float(p)) for sid, p, v in points]
+        if self._writer is not None:
+            await self._writer.executemany(_UPDATE_POINTS_SQL, rows)
+            return
+        try:
+            await self._db.executemany(_UPDATE_POINTS_SQL, rows)
+            await self._db.commit()
+        except BaseException:
+            await self._db.rollback()
+            raise
+
+    async def exists(self, session_id: UUID | str) -> bool:
+        row = await self._read_one(
+            "SELECT 1 FROM sessions WHERE session_id=?", (str(session_id),)
+        )
+        return row is not None
+
     async def list_by_item(self, item_id: UUID | str) -> Iterable[Any]:
-        cur = await self._db.execute(
-            "SELECT session_id, item_id, session_date, hours_spent, difficulty, status, points_awarded, progress_pct FROM sessions WHERE item_id=? ORDER BY session_date",
+        rows = await self._read_all(
+            f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE item_id=? ORDER BY session_date",
             (str(item_id),),
         )
-        rows = await cur.fetchall()
-        await cur.close()
         # Return lightweight dicts; presenters/use cases can adapt
-        return [
-            {
-                "session_id": r[0],
-                "item_id": r[1],
-                "session_date": r[2],
-                "hours_spent": r[3],
-                "difficulty": r[4],
-                "status": r[5],
-                "points_awarded": r[6],
-                "progress_pct": r[7],
-            }
-            for r in rows
+        return [_row_to_dict(r) for r in rows]
+
+    # ---------- Streaming ----------
+
+    async def iter_by_item(
+        self,
+        item_id: UUID | str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[dict]:
+        """Stream an item's sessions ordered by (session_date, session_id)."""
+        async for row in self._iter_pages(
+            "item_id=?", (str(item_id),), batch_size, page_size
+        ):
+            yield row
+
+    async def iter_all(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[dict]:
+        """Stream every session ordered by (session_date, session_id)."""
+        async for row in self._iter_pages("1=1", (), batch_size, page_size):
+            yield row
+
+    async def iter_frames(
+        self,
+        item_id: UUID | str | None = None,
+        chunk_size: int = DEFAULT_PAGE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+        item_ids: Iterable[UUID | str] | None = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Stream sessions as `SESSIONS_SCHEMA` frames of up to `chunk_size` rows.
+
+        Each keyset page is written straight into typed column buffers and
+        coerced once, without building per-row dicts. Frames are ordered by
+        (session_date, session_id) and carry consecutive index ranges, so they
+        concatenate into one frame as-is. `start`/`end` (inclusive) restrict
+        the session dates; `item_ids` selects several items at once.
+        """
+        clauses: List[str] = []
+        params: list = []
+        if item_id is not None:
+            clauses.append("item_id=?")
+            params.append(str(item_id))
+        if item_ids is not None:
+            ids = [str(i) for i in item_ids]
+            clauses.append(f"item_id IN ({', '.join('?' * len(ids))})")
+            params.extend(ids)
+        if start is not None:
+            clauses.append("session_date >= ?")
+            params.append(_to_date(start).isoformat())
+        if end is not None:
+            clauses.append("session_date < ?")
+            params.append((_to_date(end) + timedelta(days=1)).isoformat())
+        where = " AND ".join(clauses) or "1=1"
+        offset = 0
+        async for page in self._pages(
+            where, tuple(params), batch_size, chunk_size, _FRAME_SQL_COLUMNS
+        ):
+            yield _rows_to_frame(page, offset)
+            offset += len(page)
+
+    async def load_frame(
+        self,
+        item_id: UUID | str | None = None,
+        chunk_size: int = DEFAULT_PAGE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+        item_ids: Iterable[UUID | str] | None = None,
+    ) -> pd.DataFrame:
+        """All matching sessions as a single `SESSIONS_SCHEMA` frame."""
+        frames = [
+            f
+            async for f in self.iter_frames(
+                item_id,
+                chunk_size,
+                batch_size,
+                start=start,
+                end=end,
+                item_ids=item_ids,
+            )
         ]
+        if not frames:
+            return empty_sessions_df()
+        if len(frames) == 1:
+            return frames[0]
+        return coerce_sessions_df(pd.concat(frames, copy=False), inplace=True)
+
+    async def partition_versions(
+        self,
+    ) -> Dict[Tuple[int, int, str | None], Tuple[int, int, str]]:
+        """(year, month, language_code) -> (count, version sum, latest updated_at).
+
+        A partition's fingerprint changes whenever one of its sessions is
+        inserted, changed or moved out, so exporters can skip the rest.
+        """
+        rows = await self._read_all(_PARTITION_VERSIONS_SQL)
+        return {(r[0], r[1], r[2]): (r[3], r[4], r[5]) for r in rows}
+
+    async def _iter_pages(
+        self, where: str, params: tuple, batch_size: int, page_size: int
+    ) -> AsyncIterator[dict]:
+        async for page in self._pages(where, params, batch_size, page_size):
+            for r in page:
+                yield _row_to_dict(r)
+
+    async def _pages(
+        self,
+        where: str,
+        params: tuple,
+        batch_size: int,
+        page_size: int,
+        columns: str = _SESSION_COLUMNS,
+    ) -> AsyncIterator[list]:
+        # Keyset pagination: each page is a fresh indexed range query that
+        # resumes after the last (session_date, session_id) seen. A page is
+        # read in `fetchmany(batch_size)` steps and the cursor and pooled
+        # reader are released before any row is yielded, so nothing stays open
+        # while the consumer works; memory is bounded by page_size regardless
+        # of history length.
+        if batch_size <= 0 or page_size <= 0:
+            raise ValueError("batch_size and page_size must be positive")
+        order = "ORDER BY session_date, session_id LIMIT ?"
+        last: tuple | None = None
+        while True:
+            if last is None:
+                sql = f"SELECT {columns} FROM sessions WHERE {where} {order}"
+                args = (*params, page_size)
+            else:
+                sql = (
+                    f"SELECT {columns} FROM sessions WHERE {where} "
+                    f"AND (session_date, session_id) > (?, ?) {order}"
+                )
+                args = (*params, *last, page_size)
+
+            page: list = []
+            async with read_connection(self._source) as db:
+                cur = await db.execute(sql, args)
+                try:
+                    while rows := await cur.fetchmany(batch_size):
+                        page.extend(rows)
+                finally:
+                    await cur.close()
+            if page:
+                last = (page[-1][2], page[-1][0])
+                yield page
+            if len(page) < page_size:
+                return
+
+    # ---------- SQL-side aggregates ----------
+
+    async def aggregate(self, item_id: UUID | str | None = None) -> SessionAggregateDTO:
+        """Count, hours and points for one item, or across all items."""
+        if item_id is None:
+            row = await self._read_one(f"SELECT {_AGGREGATE_COLUMNS} FROM sessions")
+        else:
+            row = await self._read_one(
+                f"SELECT {_AGGREGATE_COLUMNS} FROM sessions WHERE item_id=?",
+                (str(item_id),),
+            )
+        return _aggregate_from_row(None if item_id is None else str(item_id), row)
+
+    async def aggregate_by_item(self) -> Dict[str, SessionAggregateDTO]:
+        """One aggregate per item in a single `GROUP BY` query."""
+        rows = await self._read_all(
+            f"SELECT item_id, {_AGGREGATE_COLUMNS} FROM sessions GROUP BY item_id"
+        )
+        return {r[0]: _aggregate_from_row(r[0], r[1:]) for r in rows}
+
+    async def distinct_dates(
+        self,
+        item_id: UUID | str | None = None,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> List[date]:
+        """Sorted distinct session days for one item, or across all items,
+        optionally limited to `start <= day <= end`."""
+        where, params = [], []
+        if item_id is not None:
+            where.append("item_id=?")
+            params.append(str(item_id))
+        # plain string bounds on the ISO text keep the range on the index
+        if start is not None:
+            where.append("session_date >= ?")
+            params.append(_to_date(start).isoformat())
+        if end is not None:
+            where.append("session_date < ?")
+            params.append((_to_date(end) + timedelta(days=1)).isoformat())
+        sql = "SELECT DISTINCT date(session_date) AS d FROM sessions"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        rows = await self._read_all(sql + " ORDER BY d", tuple(params))
+        return [date.fromisoformat(r[0]) for r in rows if r[0] is not None]
+
+    # ---------- SQL-side streaks ----------
+
+    async def streaks_by_item(
+        self,
+        item_ids: Iterable[UUID | str] | None = None,
+        *,
+        today: date | str | None = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """Current and longest streak per item in one window-function query.
+
+        Same semantics as `get_streak`: days after `today` (default: today)
+        are ignored. Items without sessions are absent from the result.
+        """
+        params: Dict[str, Any] = {"today": _anchor(today)}
+        filt = ""
+        if item_ids is not None:
+            ids = [str(i) for i in item_ids]
+            if not ids:
+                return {}
+            names = [f"id{n}" for n in range(len(ids))]
+            params.update(zip(names, ids))
+            filt = "AND item_id IN (" + ", ".join(f":{n}" for n in names) + ")"
+        rows = await self._read_all(
+            _STREAKS_SQL.format(key="item_id", filter=filt), params
+        )
+        return {r[0]: {"current": r[1], "longest": r[2]} for r in rows}
+
+    async def streak(
+        self,
+        item_id: UUID | str | None = None,
+        *,
+        today: date | str | None = None,
+    ) -> Dict[str, int]:
+        """Streak for one item, or across all items when `item_id` is None."""
+        if item_id is not None:
+            found = await self.streaks_by_item([item_id], today=today)
+            return found.get(str(item_id), {"current": 0, "longest": 0})
+        rows = await self._read_all(
+            _STREAKS_SQL.format(key="NULL", filter=""),
+            {"today": _anchor(today)},
+        )
+        if not rows:
+            return {"current": 0, "longest": 0}
+        return {"current": rows[0][1], "longest": rows[0][2]}
+
+    # ---------- Gamification ----------
+
+    async def gamification_state(
+        self, *, today: date | str | None = None
+    ) -> GamificationStateDTO:
+        """All `GamificationStateDTO` totals from one aggregate query plus the
+        global streak query; no session rows leave SQLite."""
+        anchor = _anchor(today)
+        row = await self._read_one(_GAMIFICATION_SQL, {"today": anchor})
+        streak = await self.streak(today=anchor)
+        return GamificationStateDTO(
+            total_points=round(row[0], 2),
+            weekly_hours=row[1],
+            weekly_sessions=row[2],
+            streak_days=streak["current"],
+            total_sessions=row[3],
+            total_hours=row[4],
+            total_items=row[5],
+            total_languages=row[6],
+            last_session_date=row[7],
+        )
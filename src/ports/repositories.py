@@ -6,7 +6,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable, Protocol
+from datetime import date
+from typing import Any, Dict, Iterable, List, Protocol, runtime_checkable
 from uuid import UUID
 
 # Domain-facing repository contracts (infrastructure-agnostic)
@@ -15,9 +16,47 @@ from uuid import UUID
 class SessionRepository(Protocol):
     async def save(self, session: Any) -> Any: ...
 
+    # bulk upsert; implementations should apply the whole batch atomically
+    async def save_many(self, sessions: Iterable[Any]) -> Iterable[Any]: ...
+
     async def list_by_item(self, item_id: UUID | str) -> Iterable[Any]: ...
 
 
+# Optional session-store capabilities. They are separate protocols, not stubs
+# on SessionRepository, so `isinstance` tells whether a store really has them.
+
+
+@runtime_checkable
+class SessionExistence(Protocol):
+    # lets use cases tell inserts from upserts for incremental rollups
+    async def exists(self, session_id: UUID | str) -> bool: ...
+
+
+@runtime_checkable
+class SessionAggregates(Protocol):
+    # store-side aggregates; item_id=None aggregates across all items
+    async def aggregate(self, item_id: UUID | str | None = None) -> Any: ...
+
+    async def aggregate_by_item(self) -> Dict[str, Any]: ...
+
+    # start/end (inclusive) bound the days, e.g. to repair a streak locally
+    async def distinct_dates(
+        self,
+        item_id: UUID | str | None = None,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> List[date]: ...
+
+
+@runtime_checkable
+class SessionStreaks(Protocol):
+    # {"current", "longest"} streaks computed by the store
+    async def streaks_by_item(
+        self, item_ids: Iterable[UUID | str] | None = None, *, today: Any = None
+    ) -> Dict[str, Dict[str, int]]: ...
+
+
 class ItemRepository(Protocol):
     async def get_by_id(self, item_id: UUID | str) -> Any: ...
 
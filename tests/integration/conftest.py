@@ -0,0 +1,19 @@
+# tests/integration/conftest.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Shared fixtures for the integration tests.
+# Role: Infrastructure/UI/Tests/Config
+
+import pytest_asyncio
+
+from infrastructure.persistence.sqlite.database import open_db
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path):
+    """A migrated SQLite database file, closed after the test."""
+    conn = await open_db(tmp_path / "test.db")
+    try:
+        yield conn
+    finally:
+        await conn.close()
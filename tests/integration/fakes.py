@@ -0,0 +1,45 @@
+# tests/integration/fakes.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Shared item/session records and config store used by the integration tests.
+# Role: Infrastructure/UI/Tests/Config
+
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class Item:
+    item_id: str
+    target_hours: float
+    total_hours: float = 0.0
+    progress_pct: float = 0.0
+
+
+@dataclass
+class Session:
+    session_id: str
+    item_id: str
+    session_date: date
+    hours_spent: float
+    language_code: str | None = "python"
+    difficulty: str = "beginner"
+    status: str = "in_progress"
+    points_awarded: float = 0.0
+    progress_pct: float = 0.0
+    streak_current: int = 0
+
+
+class Config:
+    """In-process ConfigRepository; `reads` counts `get` calls."""
+
+    def __init__(self, values=None):
+        self.values = values or {}
+        self.reads = 0
+
+    async def get(self, key):
+        self.reads += 1
+        return self.values.get(key, {})
+
+    async def set(self, key, value):
+        self.values[key] = value
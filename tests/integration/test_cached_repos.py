@@ -0,0 +1,122 @@
+# tests/integration/test_cached_repos.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Integration test for the read-through item/config caches in front of SQLite and in-process stores.
+# Role: Infrastructure/UI/Tests/Config
+
+import asyncio
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from core.usecases.log_session import LogSessionUseCase
+from infrastructure.persistence.cache import (
+    CachedConfigRepository,
+    CachedItemRepository,
+)
+from infrastructure.persistence.sqlite.item_repo import SQLiteItemRepository
+from infrastructure.persistence.sqlite.session_repo import SQLiteSessionRepository
+
+from fakes import Config, Item, Session
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_item_reads_are_cached_until_saved(db):
+    items = CachedItemRepository(SQLiteItemRepository(db))
+    item_id = str(uuid4())
+    await items.save(Item(item_id, 5.0))
+
+    first = await items.get_by_id(item_id)
+    first["target_hours"] = 99.0  # a caller's copy, not the cached value
+    assert (await items.get_by_id(item_id))["target_hours"] == 5.0
+    assert (items.stats.hits, items.stats.misses) == (1, 1)
+
+    await items.save(Item(item_id, 8.0))
+    assert (await items.get_by_id(item_id))["target_hours"] == 8.0
+    assert items.stats.misses == 2
+
+    with pytest.raises(KeyError):
+        await items.get_by_id("missing")
+    with pytest.raises(KeyError):
+        await items.get_by_id("missing")
+    assert items.stats.misses == 4  # failed lookups are not cached
+    assert await items.version_summary()  # other methods pass through
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_ttl(db):
+    clock = Clock()
+    inner = SQLiteItemRepository(db)
+    items = CachedItemRepository(inner, maxsize=2, ttl=10.0, clock=clock)
+    ids = [str(uuid4()) for _ in range(3)]
+    for item_id in ids:
+        await inner.save(Item(item_id, 1.0))
+
+    await items.get_by_id(ids[0])
+    await items.get_by_id(ids[1])
+    await items.get_by_id(ids[0])  # ids[1] is now least recently used
+    await items.get_by_id(ids[2])
+    assert items.stats.evictions == 1 and len(items.cache) == 2
+    await items.get_by_id(ids[0])
+    await items.get_by_id(ids[1])
+    assert (items.stats.hits, items.stats.misses) == (2, 4)
+
+    clock.now = 10.0
+    await items.get_by_id(ids[1])
+    assert items.stats.misses == 5
+
+
+@pytest.mark.asyncio
+async def test_config_cache_invalidated_by_set():
+    inner = Config({"points": {"base": 10}})
+    config = CachedConfigRepository(inner)
+    assert await config.get("points") == {"base": 10}
+    assert await config.get("points") == {"base": 10}
+    assert inner.reads == 1
+    await config.set("points", {"base": 20})
+    assert await config.get("points") == {"base": 20}
+    assert inner.reads == 2 and config.stats.invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_value_loaded_during_a_write_is_not_cached():
+    class SlowConfig(Config):
+        async def get(self, key):
+            value = await super().get(key)
+            await asyncio.sleep(0.01)
+            return value
+
+    inner = SlowConfig({"points": {"base": 10}})
+    config = CachedConfigRepository(inner)
+    stale, _ = await asyncio.gather(
+        config.get("points"), config.set("points", {"base": 20})
+    )
+    assert stale == {"base": 10}
+    assert await config.get("points") == {"base": 20}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write_through", [False, True])
+async def test_usecase_with_cached_repositories(db, write_through):
+    inner_items = SQLiteItemRepository(db)
+    items = CachedItemRepository(inner_items, write_through=write_through)
+    config = CachedConfigRepository(Config())
+    use = LogSessionUseCase(SQLiteSessionRepository(db), items, config)
+    item_id = str(uuid4())
+    await inner_items.save(Item(item_id, 10.0))
+
+    for d in range(1, 6):
+        saved = await use.execute(Session(str(uuid4()), item_id, date(2025, 8, d), 1.0))
+    assert saved.progress_pct == 50.0 and saved.streak_current == 5
+    assert await items.get_by_id(item_id) == await inner_items.get_by_id(item_id)
+    assert config.stats.misses == 1 and config.stats.hits == 4
+    assert items.stats.misses == (1 if write_through else 6)
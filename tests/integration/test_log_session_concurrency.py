@@ -0,0 +1,128 @@
+# tests/integration/test_log_session_concurrency.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Stress test for concurrent LogSessionUseCase calls; per-item locks keep rollups correct.
+# Role: Infrastructure/UI/Tests/Config
+
+import asyncio
+import random
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+
+from core.services.streaks import StreakState
+from core.usecases.log_session import LogSessionUseCase
+from infrastructure.persistence.sqlite.database import open_db
+from infrastructure.persistence.sqlite.item_repo import SQLiteItemRepository
+from infrastructure.persistence.sqlite.session_repo import SQLiteSessionRepository
+
+from fakes import Config, Item, Session
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lock_stripes", [64, 3])
+async def test_concurrent_logging_keeps_item_rollups_exact(tmp_path, lock_stripes):
+    rng = random.Random(7)
+    db = await open_db(tmp_path / "test.db")
+    try:
+        items = SQLiteItemRepository(db)
+        use = LogSessionUseCase(
+            SQLiteSessionRepository(db), items, Config(), lock_stripes=lock_stripes
+        )
+        item_ids = [str(uuid4()) for _ in range(12)]
+        for item_id in item_ids:
+            await items.save(Item(item_id=item_id, target_hours=1000.0))
+
+        start = date(2025, 6, 1)
+        sessions = [
+            Session(
+                str(uuid4()),
+                item_id,
+                start + timedelta(days=rng.randrange(60)),
+                rng.choice((0.25, 0.5, 1.0, 2.0)),
+            )
+            for item_id in item_ids
+            for _ in range(40)
+        ]
+        rng.shuffle(sessions)
+        singles, batch = sessions[:400], sessions[400:]
+        await asyncio.gather(
+            *(use.execute(s) for s in singles),
+            use.execute_many(batch[:40]),
+            use.execute_many(batch[40:]),
+        )
+
+        for item_id in item_ids:
+            mine = [s for s in sessions if s.item_id == item_id]
+            expected = StreakState.from_dates([s.session_date for s in mine])
+            stored = await items.get_by_id(item_id)
+            assert stored["total_hours"] == sum(s.hours_spent for s in mine)
+            assert stored["streak_longest"] == expected.longest
+            assert stored["streak_current"] == expected.current
+            assert stored["last_session_date"] == expected.last_date.isoformat()
+    finally:
+        await db.close()
+
+
+class SlowItems:
+    """Item store that yields inside get_by_id and records overlap per item."""
+
+    def __init__(self, item_ids):
+        self.rows = {
+            i: {"item_id": i, "target_hours": 10.0, "total_hours": 0.0}
+            for i in item_ids
+        }
+        self.active = {}
+        self.max_active = 0
+        self.max_same_item = 0
+
+    async def get_by_id(self, item_id):
+        self.active[item_id] = self.active.get(item_id, 0) + 1
+        self.max_active = max(self.max_active, sum(self.active.values()))
+        self.max_same_item = max(self.max_same_item, self.active[item_id])
+        await asyncio.sleep(0.001)
+        return self.rows[item_id]
+
+    async def save(self, item):
+        self.active[item["item_id"]] -= 1
+        self.rows[item["item_id"]] = item
+        return item
+
+
+class ListSessions:
+    def __init__(self):
+        self.rows = []
+
+    async def save(self, session):
+        self.rows.append(session)
+        return session
+
+    async def save_many(self, sessions):
+        return [await self.save(s) for s in sessions]
+
+    async def list_by_item(self, item_id):
+        await asyncio.sleep(0)
+        return [s for s in self.rows if s.item_id == item_id]
+
+
+@pytest.mark.asyncio
+async def test_different_items_overlap_and_same_item_does_not():
+    item_ids = [f"item-{i}" for i in range(8)]
+    items = SlowItems(item_ids)
+    use = LogSessionUseCase(ListSessions(), items, Config())
+    await asyncio.gather(
+        *(
+            use.execute(Session(str(uuid4()), item_id, date(2025, 8, d), 1.0))
+            for d in range(1, 6)
+            for item_id in item_ids
+        )
+    )
+    assert items.max_same_item == 1
+    assert items.max_active > 1
+    assert all(items.rows[i]["total_hours"] == 5.0 for i in item_ids)
+
+
+def test_lock_stripes_must_be_positive():
+    with pytest.raises(ValueError):
+        LogSessionUseCase(ListSessions(), SlowItems([]), Config(), lock_stripes=0)
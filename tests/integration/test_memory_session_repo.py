@@ -0,0 +1,137 @@
+# tests/integration/test_memory_session_repo.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Integration test for the in-memory SessionRepository. Checks parity with SQLite and bulk load/flush between them.
+# Role: Infrastructure/UI/Tests/Config
+
+import random
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+
+from core.dataframes.schemas import SESSIONS_SCHEMA
+from core.types.dtos import SessionDTO
+from core.types.enums import Difficulty, SessionStatus
+from core.usecases.log_session import LogSessionUseCase
+from infrastructure.persistence.memory.session_repo import InMemorySessionRepository
+from infrastructure.persistence.sqlite.item_repo import SQLiteItemRepository
+from infrastructure.persistence.sqlite.session_repo import SQLiteSessionRepository
+
+from fakes import Config, Session
+
+
+def _sessions(n, seed=3):
+    rnd = random.Random(seed)
+    base = date(2025, 1, 1)
+    return [
+        Session(str(uuid4()), f"item-{rnd.randrange(6)}", base + timedelta(days=rnd.randrange(40)),
+                rnd.choice([0.5, 1.0, 2.0]), points_awarded=rnd.choice([1.0, 2.5]))
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_buffers_grow_by_doubling_and_upserts_reuse_rows():
+    repo = InMemorySessionRepository(capacity=4)
+    batch = _sessions(9)
+    await repo.save_many(batch[:5])
+    assert (len(repo), repo.capacity) == (5, 8)
+    await repo.save_many(batch[5:])
+    assert (len(repo), repo.capacity) == (9, 16)
+
+    moved = Session(batch[0].session_id, "item-new", batch[0].session_date, 3.0)
+    await repo.save(moved)
+    assert len(repo) == 9
+    assert [r["hours_spent"] for r in await repo.list_by_item("item-new")] == [3.0]
+    assert all(r["session_id"] != moved.session_id for r in await repo.list_by_item(batch[0].item_id))
+    assert await repo.exists(moved.session_id)
+
+
+@pytest.mark.asyncio
+async def test_save_many_is_atomic_on_bad_row():
+    repo = InMemorySessionRepository()
+    bad = Session(str(uuid4()), "item-0", "not-a-date", 1.0)
+    with pytest.raises(Exception):
+        await repo.save_many([*_sessions(3), bad])
+    assert len(repo) == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_repo_matches_sqlite(db):
+    sql = SQLiteSessionRepository(db)
+    mem = InMemorySessionRepository()
+    batch = _sessions(200)
+    await sql.save_many(batch)
+    await mem.save_many(batch)
+
+    for item_id in ("item-0", "item-3", "missing"):
+        assert [r["session_date"] for r in await mem.list_by_item(item_id)] == \
+            [r["session_date"] for r in await sql.list_by_item(item_id)]
+        assert await mem.distinct_dates(item_id) == await sql.distinct_dates(item_id)
+    assert await mem.aggregate() == await sql.aggregate()
+    assert await mem.aggregate_by_item() == await sql.aggregate_by_item()
+    today = date(2025, 1, 25)
+    assert await mem.streaks_by_item(today=today) == await sql.streaks_by_item(today=today)
+    assert await mem.gamification_state(today=today) == await sql.gamification_state(today=today)
+    frame = mem.to_frame()
+    assert list(frame.columns) == list(SESSIONS_SCHEMA) and len(frame) == 200
+
+
+@pytest.mark.asyncio
+async def test_bulk_load_and_flush_dirty_rows(db):
+    sql = SQLiteSessionRepository(db)
+    await sql.save_many(_sessions(120))
+
+    mem = InMemorySessionRepository(capacity=8)
+    assert await mem.load_from(sql, batch_size=50) == 120
+    assert await mem.aggregate() == await sql.aggregate()
+    assert await mem.flush_to(sql) == 0
+
+    extra = _sessions(5, seed=9)
+    await mem.save_many(extra)
+    assert await mem.flush_to(sql) == 5
+    assert (await sql.aggregate()).session_count == 125
+    assert await mem.flush_to(sql, dirty_only=False) == 125
+
+
+@pytest.mark.asyncio
+async def test_usecase_runs_on_memory_repo(db):
+    items = SQLiteItemRepository(db)
+    sessions = InMemorySessionRepository()
+    use = LogSessionUseCase(sessions, items, Config())
+    await items.save({"item_id": "item-0", "target_hours": 4.0})
+    for d in range(3):
+        await use.execute(Session(str(uuid4()), "item-0", date(2025, 8, 15 + d), 1.0))
+    item = await items.get_by_id("item-0")
+    assert item["total_hours"] == 3.0
+    assert item["streak_longest"] == 3
+
+
+@pytest.mark.asyncio
+async def test_usecase_copies_session_dtos_without_revalidating(db):
+    items = SQLiteItemRepository(db)
+    use = LogSessionUseCase(InMemorySessionRepository(), items, Config())
+    item_id = uuid4()
+    await items.save({"item_id": str(item_id), "target_hours": 4.0})
+
+    def dto(day, status, **fields):
+        return SessionDTO(
+            item_id=item_id,
+            language_code="py",
+            session_date=date(2025, 8, day),
+            hours_spent=1.0,
+            difficulty=Difficulty.advanced,
+            status=status,
+            **fields,
+        )
+
+    first = dto(15, SessionStatus.completed, tags=["a"])
+    out = await use.execute(first)
+    assert type(out) is SessionDTO
+    assert (out.points_awarded, out.progress_pct, out.streak_current) == (1.0, 25.0, 1)
+    assert out.tags == ["a"] and first.points_awarded == 0.0
+
+    # trusted values are copied as-is: re-validating would round hours to 0.25
+    trusted = dto(16, SessionStatus.completed).model_copy(update={"hours_spent": 0.3})
+    assert (await use.execute(trusted)).hours_spent == 0.3
@@ -0,0 +1,118 @@
+# tests/integration/test_parquet_export.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Integration test for the partitioned Parquet export of the SQLite store and its pruning readers.
+# Role: Infrastructure/UI/Tests/Config
+
+from dataclasses import replace
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from core.dataframes.schemas import SESSIONS_SCHEMA
+from infrastructure.persistence.parquet.export import (
+    ParquetExporter,
+    read_items,
+    read_sessions,
+)
+from infrastructure.persistence.sqlite.item_repo import SQLiteItemRepository
+from infrastructure.persistence.sqlite.session_repo import SQLiteSessionRepository
+
+from fakes import Item, Session
+
+
+async def _seed(db):
+    items, sessions = SQLiteItemRepository(db), SQLiteSessionRepository(db)
+    item_id = str(uuid4())
+    await items.save(Item(item_id, 10.0))
+    batch = [
+        Session(str(uuid4()), item_id, date(2025, 7, 30), 1.0, language_code="py"),
+        Session(str(uuid4()), item_id, date(2025, 8, 1), 2.0, language_code="py"),
+        Session(str(uuid4()), item_id, date(2025, 8, 2), 3.0, language_code="sql"),
+        Session(str(uuid4()), item_id, date(2025, 8, 3), 0.5, language_code=None),
+    ]
+    await sessions.save_many(batch)
+    return items, sessions, item_id, batch
+
+
+@pytest.mark.asyncio
+async def test_export_writes_hive_partitions_readable_as_schema(db, tmp_path):
+    items, sessions, item_id, batch = await _seed(db)
+    root = tmp_path / "export"
+    result = await ParquetExporter(sessions, items, root).export()
+
+    assert sorted(result.written) == [
+        "year=2025/month=7/language_code=py",
+        "year=2025/month=8/language_code=__HIVE_DEFAULT_PARTITION__",
+        "year=2025/month=8/language_code=py",
+        "year=2025/month=8/language_code=sql",
+    ]
+    assert result.items_written
+    df = read_sessions(root)
+    assert list(df.columns) == list(SESSIONS_SCHEMA)
+    assert {c: str(t) for c, t in df.dtypes.items()} == {
+        c: str(t) for c, t in (await sessions.load_frame()).dtypes.items()
+    }
+    assert sorted(df["hour_spent"]) == [0.5, 1.0, 2.0, 3.0]
+    assert df["tags"].tolist() == [[]] * 4
+
+    items_df = read_items(root)
+    assert items_df["item_id"].tolist() == [item_id]
+    assert items_df["target_hours"].tolist() == [10.0]
+
+
+@pytest.mark.asyncio
+async def test_readers_prune_partitions_and_columns(db, tmp_path):
+    items, sessions, _, _ = await _seed(db)
+    root = tmp_path / "export"
+    await ParquetExporter(sessions, items, root).export()
+
+    august_py = read_sessions(
+        root, ["session_date", "hour_spent"], months=[8], languages=["py"]
+    )
+    assert list(august_py.columns) == ["session_date", "hour_spent"]
+    assert august_py["hour_spent"].tolist() == [2.0]
+    untagged = read_sessions(root, ["language_code", "hour_spent"], languages=[None])
+    assert untagged["hour_spent"].tolist() == [0.5]
+    assert untagged["language_code"].isna().all()
+    assert read_sessions(root, years=[2024]).empty
+
+
+@pytest.mark.asyncio
+async def test_export_rewrites_only_changed_partitions(db, tmp_path):
+    items, sessions, item_id, batch = await _seed(db)
+    root = tmp_path / "export"
+    exporter = ParquetExporter(sessions, items, root)
+    await exporter.export()
+
+    again = await exporter.export()
+    assert again.written == [] and again.unchanged == 4 and not again.items_written
+
+    # re-saving identical rows does not bump versions
+    await sessions.save_many(batch)
+    assert (await exporter.export()).written == []
+
+    # an edit in July and a move of the only "sql" session into July
+    await sessions.save(replace(batch[0], hours_spent=4.0))
+    await sessions.save(replace(batch[2], session_date=date(2025, 7, 31)))
+    result = await exporter.export()
+    assert sorted(result.written) == [
+        "year=2025/month=7/language_code=py",
+        "year=2025/month=7/language_code=sql",
+    ]
+    assert result.removed == ["year=2025/month=8/language_code=sql"]
+    assert result.unchanged == 2
+
+    df = read_sessions(root, ["session_date", "hour_spent", "version"])
+    assert sorted(zip(df["session_date"], df["hour_spent"], df["version"])) == [
+        ("2025-07-30", 4.0, 2),
+        ("2025-07-31", 3.0, 2),
+        ("2025-08-01", 2.0, 1),
+        ("2025-08-03", 0.5, 1),
+    ]
+
+    full = await exporter.export(full=True)
+    assert len(full.written) == 4 and full.items_written
@@ -0,0 +1,143 @@
+# tests/integration/test_sqlite_group_commit.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Integration test for write-behind group commit. Checks batching, durability on await, failure isolation and flush on stop.
+# Role: Infrastructure/UI/Tests/Config
+
+import asyncio
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from core.usecases.log_session import LogSessionUseCase
+from infrastructure.persistence.sqlite.database import open_db
+from infrastructure.persistence.sqlite.group_commit import GroupCommitWriter
+from infrastructure.persistence.sqlite.item_repo import SQLiteItemRepository
+from infrastructure.persistence.sqlite.session_repo import SQLiteSessionRepository
+
+from fakes import Config, Item, Session
+
+async def count_sessions(db):
+    cur = await db.execute("SELECT COUNT(*) FROM sessions")
+    (n,) = await cur.fetchone()
+    await cur.close()
+    return n
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_share_commits(tmp_path):
+    db = await open_db(tmp_path/"gc.db")
+    async with GroupCommitWriter(db, max_batch=50, max_delay_ms=50) as writer:
+        sessions = SQLiteSessionRepository(db, writer=writer)
+        batch = [Session(str(uuid4()), "a", date(2025,8,1), 1.0) for _ in range(200)]
+        await asyncio.gather(*(sessions.save(s) for s in batch))
+        # every awaited save is committed, in far fewer commits than rows
+        assert await count_sessions(db) == 200
+        assert writer.rows == 200
+        assert writer.commits <= 8
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_write_only_fails_its_caller(tmp_path):
+    db = await open_db(tmp_path/"gc.db")
+    async with GroupCommitWriter(db, max_batch=10, max_delay_ms=20) as writer:
+        good = [writer.submit("INSERT INTO items (item_id, target_hours) VALUES (?, ?)", (f"i{n}", 1.0))
+                for n in range(5)]
+        bad = writer.submit("INSERT INTO items (item_id, target_hours) VALUES (?, ?)", ("x", None))
+        results = await asyncio.gather(*good, bad, return_exceptions=True)
+    assert results[:5] == [None] * 5
+    assert isinstance(results[5], Exception)
+    cur = await db.execute("SELECT COUNT(*) FROM items")
+    assert (await cur.fetchone())[0] == 5
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_writes(tmp_path):
+    db = await open_db(tmp_path/"gc.db")
+    writer = await GroupCommitWriter(db, max_batch=1000, max_delay_ms=10_000).start()
+    sessions = SQLiteSessionRepository(db, writer=writer)
+    pending = [asyncio.ensure_future(sessions.save(Session(str(uuid4()), "a", date(2025,8,1), 1.0)))
+               for _ in range(10)]
+    await asyncio.sleep(0)
+    await writer.stop()
+    await asyncio.gather(*pending)
+    assert await count_sessions(db) == 10
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_usecase_runs_on_group_commit_repositories(tmp_path):
+    db = await open_db(tmp_path/"gc.db")
+    async with GroupCommitWriter(db, max_delay_ms=1) as writer:
+        items = SQLiteItemRepository(db, writer=writer)
+        sessions = SQLiteSessionRepository(db, writer=writer)
+        use = LogSessionUseCase(sessions, items, Config())
+        item_id = str(uuid4())
+        await items.save(Item(item_id=item_id, target_hours=10.0))
+        await sessions.save_many([Session(str(uuid4()), item_id, date(2025,8,1), 1.0)])
+        saved = await use.execute(Session(str(uuid4()), item_id, date(2025,8,2), 2.0))
+    assert saved.progress_pct == 30.0
+    assert saved.streak_current == 2
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_submit_requires_started_writer(tmp_path):
+    db = await open_db(tmp_path/"gc.db")
+    with pytest.raises(RuntimeError):
+        GroupCommitWriter(db).submit("SELECT 1")
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_submit_while_stopping_is_refused(tmp_path):
+    db = await open_db(tmp_path/"gc.db")
+    try:
+        writer = await GroupCommitWriter(db, max_delay_ms=10_000).start()
+        first = writer.submit("INSERT INTO items (item_id, target_hours) VALUES (?, ?)", ("a", 1.0))
+        stopping = asyncio.ensure_future(writer.stop())
+        await asyncio.sleep(0)
+        with pytest.raises(RuntimeError):
+            writer.submit("INSERT INTO items (item_id, target_hours) VALUES (?, ?)", ("b", 1.0))
+        await stopping
+        await asyncio.wait_for(first, 1)
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_rollback_fails_the_batch_instead_of_hanging(tmp_path):
+    db = await open_db(tmp_path/"gc.db")
+
+    async def broken_rollback():
+        raise OSError("disk gone")
+
+    try:
+        async with GroupCommitWriter(db, max_delay_ms=1) as writer:
+            db.rollback = broken_rollback
+            bad = writer.submit("INSERT INTO items (item_id, target_hours) VALUES (?, ?)", ("x", None))
+            with pytest.raises(OSError):
+                await asyncio.wait_for(bad, 1)
+            del db.rollback
+            # the flusher survived and keeps committing
+            await asyncio.wait_for(writer.execute("INSERT INTO items (item_id, target_hours) VALUES (?, ?)", ("y", 1.0)), 1)
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_flusher_fails_queued_writes(tmp_path):
+    db = await open_db(tmp_path/"gc.db")
+    try:
+        writer = await GroupCommitWriter(db, max_batch=1000, max_delay_ms=10_000).start()
+        pending = [writer.submit("INSERT INTO items (item_id, target_hours) VALUES (?, ?)", (f"i{n}", 1.0))
+                   for n in range(3)]
+        await asyncio.sleep(0)
+        writer._task.cancel()
+        results = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), 1)
+        assert all(isinstance(r, RuntimeError) for r in results)
+    finally:
+        await db.close()
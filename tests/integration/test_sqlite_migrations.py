@@ -0,0 +1,131 @@
+# tests/integration/test_sqlite_migrations.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Integration test for SQLite schema migrations. Checks versioning, legacy upgrades and query plans before/after the indexes.
+# Role: Infrastructure/UI/Tests/Config
+
+import aiosqlite
+import pytest
+
+from infrastructure.persistence.sqlite.database import MIGRATIONS, open_db
+from infrastructure.persistence.sqlite.migrations import Migration, get_version, migrate
+
+LIST_BY_ITEM = (
+    "SELECT session_id, item_id, session_date, hours_spent, difficulty, status, "
+    "points_awarded, progress_pct FROM sessions WHERE item_id=? ORDER BY session_date"
+)
+
+
+async def plan(db, sql, params=()):
+    cur = await db.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+    rows = await cur.fetchall()
+    await cur.close()
+    return " | ".join(r[-1] for r in rows)
+
+
+@pytest.mark.asyncio
+async def test_open_db_migrates_to_latest_and_is_idempotent(tmp_path):
+    db = await open_db(tmp_path/"test.db")
+    assert await get_version(db) == MIGRATIONS[-1].version
+    await db.close()
+
+    db = await open_db(tmp_path/"test.db")
+    assert await get_version(db) == MIGRATIONS[-1].version
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_legacy_file_without_user_version_is_upgraded(tmp_path):
+    db = await aiosqlite.connect(str(tmp_path/"legacy.db"))
+    await db.executescript(
+        """
+        CREATE TABLE items (item_id TEXT PRIMARY KEY, target_hours REAL NOT NULL,
+            total_hours REAL NOT NULL DEFAULT 0, progress_pct REAL NOT NULL DEFAULT 0);
+        INSERT INTO items VALUES ('a', 5.0, 1.0, 20.0);
+        """
+    )
+    await db.commit()
+    await db.close()
+
+    db = await open_db(tmp_path/"legacy.db")
+    cur = await db.execute("SELECT item_id, total_hours, streak_current, last_session_date FROM items")
+    assert await cur.fetchall() == [("a", 1.0, 0, None)]
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_item_date_index_removes_scan_and_sort(tmp_path):
+    db = await aiosqlite.connect(str(tmp_path/"plan.db"))
+    await migrate(db, MIGRATIONS, target=1)
+
+    before = await plan(db, LIST_BY_ITEM, ("x",))
+    assert "SCAN sessions" in before
+    assert "TEMP B-TREE" in before
+
+    await migrate(db, MIGRATIONS)
+    after = await plan(db, LIST_BY_ITEM, ("x",))
+    assert "SEARCH sessions USING INDEX idx_sessions_item_date" in after
+    assert "TEMP B-TREE" not in after
+
+    agg = await plan(db, "SELECT SUM(hours_spent), SUM(points_awarded) FROM sessions WHERE item_id=?", ("x",))
+    assert "COVERING INDEX idx_sessions_item_date" in agg
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_migration_rolls_back_and_keeps_version(tmp_path):
+    async def broken(conn):
+        await conn.execute("CREATE TABLE scratch (x INTEGER)")
+        raise RuntimeError("boom")
+
+    db = await aiosqlite.connect(str(tmp_path/"broken.db"))
+    await migrate(db, MIGRATIONS)
+    with pytest.raises(RuntimeError):
+        await migrate(db, [*MIGRATIONS, Migration(99, "broken", broken)])
+    assert await get_version(db) == MIGRATIONS[-1].version
+    cur = await db.execute("SELECT name FROM sqlite_master WHERE name='scratch'")
+    assert await cur.fetchall() == []
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_use_indexes(tmp_path):
+    db = await open_db(tmp_path/"plan.db")
+    by_item = await plan(
+        db,
+        "SELECT session_id FROM sessions WHERE item_id=? AND (session_date, session_id) > (?, ?) "
+        "ORDER BY session_date, session_id LIMIT 10",
+        ("x", "2025-01-01", ""),
+    )
+    assert "idx_sessions_item_date" in by_item and "TEMP B-TREE" not in by_item
+
+    overall = await plan(
+        db,
+        "SELECT session_id FROM sessions WHERE (session_date, session_id) > (?, ?) "
+        "ORDER BY session_date, session_id LIMIT 10",
+        ("2025-01-01", ""),
+    )
+    assert "idx_sessions_date" in overall and "TEMP B-TREE" not in overall
+    await db.close()
+
+
+async def columns(db, table):
+    cur = await db.execute(f"PRAGMA table_info({table})")
+    names = [r[1] for r in await cur.fetchall()]
+    await cur.close()
+    return names
+
+
+@pytest.mark.asyncio
+async def test_later_columns_come_only_from_their_migrations(tmp_path):
+    db = await aiosqlite.connect(str(tmp_path/"test.db"))
+    try:
+        await migrate(db, MIGRATIONS, target=3)
+        assert "streak_state" not in await columns(db, "items")
+        await migrate(db, MIGRATIONS, target=4)
+        assert "streak_state" in await columns(db, "items")
+        assert "language_code" not in await columns(db, "sessions")
+        await migrate(db, MIGRATIONS, target=5)
+        assert "language_code" in await columns(db, "sessions")
+    finally:
+        await db.close()
@@ -0,0 +1,111 @@
+# tests/integration/test_sqlite_pool.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Integration test for the SQLite read/write pool. Checks routing, read-only readers and reads proceeding while a write is in flight.
+# Role: Infrastructure/UI/Tests/Config
+
+import asyncio
+import sqlite3
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from infrastructure.persistence.sqlite.item_repo import SQLiteItemRepository
+from infrastructure.persistence.sqlite.pool import open_pool
+from infrastructure.persistence.sqlite.session_repo import SQLiteSessionRepository
+
+from fakes import Item, Session
+
+# A single statement that keeps the writer thread busy for a while
+SLOW_WRITE = """
+    INSERT INTO sessions (session_id, item_id, session_date, hours_spent, difficulty, status)
+    WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 100000)
+    SELECT 'bulk-' || i, 'bulk', '2025-01-01', 1.0, 'beginner', 'completed' FROM n
+"""
+
+
+@pytest.mark.asyncio
+async def test_pool_routes_reads_to_read_only_connections(tmp_path):
+    pool = await open_pool(tmp_path/"pool.db", readers=2)
+    assert pool.size == 2
+    items = SQLiteItemRepository(pool)
+    sessions = SQLiteSessionRepository(pool)
+
+    item_id = str(uuid4())
+    await items.save(Item(item_id=item_id, target_hours=5.0))
+    await sessions.save(Session(str(uuid4()), item_id, date(2025,8,1), 2.0))
+
+    # committed writes are visible through the readers
+    assert (await items.get_by_id(item_id))["target_hours"] == 5.0
+    assert (await sessions.aggregate(item_id)).total_hours == 2.0
+
+    async with pool.reader() as ro:
+        with pytest.raises(sqlite3.OperationalError):
+            await ro.execute("DELETE FROM sessions")
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_pool_falls_back_to_writer():
+    pool = await open_pool(":memory:", readers=4)
+    assert pool.size == 0
+    sessions = SQLiteSessionRepository(pool)
+    await sessions.save(Session(str(uuid4()), "a", date(2025,8,1), 1.0))
+    assert (await sessions.aggregate()).session_count == 1
+    await pool.close()
+
+
+async def reads_finished_during_write(sessions, writer, n_reads=8):
+    """Start a slow write, fire reads, count reads done before the write ends."""
+    write = asyncio.ensure_future(writer.execute(SLOW_WRITE))
+    await asyncio.sleep(0.05)  # let the writer thread start the statement
+    done_before = 0
+
+    async def read():
+        nonlocal done_before
+        await sessions.aggregate()
+        if not write.done():
+            done_before += 1
+
+    await asyncio.gather(*(read() for _ in range(n_reads)))
+    await write
+    await writer.commit()
+    return done_before
+
+
+@pytest.mark.asyncio
+async def test_reads_proceed_while_write_in_flight(tmp_path):
+    pool = await open_pool(tmp_path/"pool.db", readers=4)
+    await SQLiteSessionRepository(pool).save_many(
+        [Session(str(uuid4()), "a", date(2025,8,d), 1.0) for d in range(1, 29)]
+    )
+
+    # shared connection: every read queues behind the write on one thread
+    shared = SQLiteSessionRepository(pool.writer)
+    assert await reads_finished_during_write(shared, pool.writer) == 0
+    await pool.writer.execute("DELETE FROM sessions WHERE item_id='bulk'")
+    await pool.writer.commit()
+
+    # pooled readers: reads are served while the writer is still busy
+    pooled = SQLiteSessionRepository(pool)
+    assert await reads_finished_during_write(pooled, pool.writer) == 8
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_streaming_releases_reader_between_pages(tmp_path):
+    pool = await open_pool(tmp_path/"pool.db", readers=1)
+    try:
+        sessions = SQLiteSessionRepository(pool)
+        batch = [Session(str(uuid4()), "item", date(2025, 8, 1 + i), 1.0) for i in range(6)]
+        await sessions.save_many(batch)
+
+        seen = 0
+        async for row in sessions.iter_by_item("item", batch_size=2, page_size=3):
+            # the only reader must be free while the consumer handles a row
+            assert await asyncio.wait_for(sessions.exists(row["session_id"]), 5)
+            seen += 1
+        assert seen == 6
+    finally:
+        await pool.close()
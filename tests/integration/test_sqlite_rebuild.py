@@ -0,0 +1,137 @@
+# tests/integration/test_sqlite_rebuild.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Integration tests for the sharded rollup rebuild job over a SQLite file.
+# Role: Infrastructure/UI/Tests/Config
+
+import random
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from core.services.points import DEFAULT_WEIGHTS, compute_points
+from core.types.enums import Difficulty, SessionStatus
+from core.usecases.log_session import LogSessionUseCase
+from infrastructure.persistence.sqlite.database import open_db
+from infrastructure.persistence.sqlite.item_repo import SQLiteItemRepository
+from infrastructure.persistence.sqlite.rebuild import rebuild_rollups
+from infrastructure.persistence.sqlite.session_repo import SQLiteSessionRepository
+
+from fakes import Config, Item, Session
+
+
+@pytest_asyncio.fixture
+async def seeded(tmp_path):
+    """A database logged with flat weights: 9 items, 30 sessions each."""
+    rng = random.Random(5)
+    path = tmp_path / "rebuild.db"
+    db = await open_db(path)
+    try:
+        items = SQLiteItemRepository(db)
+        use = LogSessionUseCase(
+            SQLiteSessionRepository(db),
+            items,
+            Config({"points": {d: 1.0 for d in Difficulty}}),
+        )
+        item_ids = [str(uuid4()) for _ in range(9)]
+        for n, item_id in enumerate(item_ids):
+            await items.save(Item(item_id=item_id, target_hours=5.0 + 10 * n))
+        sessions = [
+            Session(
+                str(uuid4()),
+                item_id,
+                date(2025, 6, 1) + timedelta(days=rng.randrange(45)),
+                rng.choice((0.25, 0.5, 1.0, 2.0)),
+                difficulty=rng.choice(list(Difficulty)),
+                status=rng.choice(list(SessionStatus)),
+            )
+            for item_id in item_ids
+            for _ in range(30)
+        ]
+        await use.execute_many(sessions)
+        expected = {i: await items.get_by_id(i) for i in item_ids}
+    finally:
+        await db.close()
+    return path, sessions, expected
+
+
+async def _stored(path):
+    db = await open_db(path)
+    try:
+        frame = await SQLiteSessionRepository(db).load_frame()
+        items = SQLiteItemRepository(db)
+        rollups = {i: await items.get_by_id(i) for i in frame["item_id"].unique()}
+    finally:
+        await db.close()
+    return frame, rollups
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("workers", [0, 2])
+async def test_rebuild_reweights_points_and_keeps_rollups(seeded, workers):
+    path, sessions, expected = seeded
+    reports = []
+    totals = await rebuild_rollups(
+        path, DEFAULT_WEIGHTS, workers=workers, shards=3, progress=reports.append
+    )
+
+    assert [r.shards_done for r in reports] == [1, 2, 3]
+    assert (totals.items, totals.sessions) == (9, len(sessions))
+    frame, rollups = await _stored(path)
+    points = dict(zip(frame["session_id"], frame["points_awarded"]))
+    for s in sessions:
+        assert points[s.session_id] == compute_points(
+            s.hours_spent, s.difficulty, s.status, DEFAULT_WEIGHTS
+        )
+    reweighted = sum(
+        compute_points(s.hours_spent, s.difficulty, s.status, DEFAULT_WEIGHTS)
+        != compute_points(s.hours_spent, s.difficulty, s.status, {})
+        for s in sessions
+    )
+    assert totals.points_changed == reweighted > 0
+    for item_id, item in expected.items():
+        assert rollups[item_id] == item
+
+    again = await rebuild_rollups(path, DEFAULT_WEIGHTS, workers=0)
+    assert again.points_changed == 0
+
+
+@pytest.mark.asyncio
+async def test_update_points_skips_rows_written_since_read(seeded):
+    path, sessions, _ = seeded
+    db = await open_db(path)
+    try:
+        repo = SQLiteSessionRepository(db)
+        frame = await repo.load_frame()
+        row = frame.iloc[0]
+        fresh, stale = frame.iloc[1], int(row["version"]) - 1
+        await repo.update_points(
+            [
+                (row["session_id"], 99.0, stale),
+                (fresh["session_id"], 42.0, int(fresh["version"])),
+            ]
+        )
+        after = (await repo.load_frame()).set_index("session_id")
+        assert after.loc[row["session_id"], "points_awarded"] == row["points_awarded"]
+        assert after.loc[fresh["session_id"], "points_awarded"] == 42.0
+        assert after.loc[fresh["session_id"], "version"] == fresh["version"] + 1
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_needs_a_database_file():
+    with pytest.raises(ValueError):
+        await rebuild_rollups(":memory:")
+
+
+@pytest.mark.asyncio
+async def test_rebuild_of_an_empty_store_does_nothing(tmp_path):
+    path = tmp_path / "empty.db"
+    await (await open_db(path)).close()
+    reports = []
+    totals = await rebuild_rollups(path, workers=0, progress=reports.append)
+    assert (totals.shards_total, totals.items, totals.sessions) == (0, 0, 0)
+    assert reports == []
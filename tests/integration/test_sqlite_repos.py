@@ -5,7 +5,6 @@
 # Role: Infrastructure/UI/Tests/Config
 
 import pytest
-from dataclasses import dataclass
 from datetime import date
 from uuid import uuid4
 
@@ -13,32 +12,9 @@ from infrastructure.persistence.sqlite.database import open_db
 from infrastructure.persistence.sqlite.item_repo import SQLiteItemRepository
 from infrastructure.persistence.sqlite.session_repo import SQLiteSessionRepository
 from core.usecases.log_session import LogSessionUseCase
+from ports.repositories import SessionRepository
 
-@dataclass
-class Item:
-    item_id: str
-    target_hours: float
-    total_hours: float = 0.0
-    progress_pct: float = 0.0
-
-@dataclass
-class Session:
-    session_id: str
-    item_id: str
-    session_date: date
-    hours_spent: float
-    language_code: str = "python"
-    difficulty: str = "beginner"
-    status: str = "in_progress"
-    points_awarded: float = 0.0
-    progress_pct: float = 0.0
-    streak_current: int = 0
-
-class Config:
-    def __init__(self, v=None): self.v=v or {}
-    async def get(self, key:str): return self.v
-    async def set(self, key: str, value):
-        self.v[key] = value
+from fakes import Config, Item, Session
 
 @pytest.mark.asyncio
 async def test_sqlite_repositories_integrate_with_usecase(tmp_path):
@@ -62,3 +38,422 @@ async def test_sqlite_repositories_integrate_with_usecase(tmp_path):
     assert saved.progress_pct == 100.0
     # Three contiguous days → streak should be 3
     assert saved.streak_current == 3
+
+
+@pytest.mark.asyncio
+async def test_save_many_upserts_in_chunks(tmp_path):
+    db = await open_db(tmp_path/"test.db")
+    items = SQLiteItemRepository(db)
+    sessions = SQLiteSessionRepository(db, chunk_size=3)
+
+    item_id = str(uuid4())
+    await items.save(Item(item_id=item_id, target_hours=5.0))
+
+    batch = [Session(str(uuid4()), item_id, date(2025,8,d), 1.0) for d in range(1, 11)]
+    saved = await sessions.save_many(batch)
+    assert len(saved) == 10
+
+    # re-saving the same ids updates rows instead of duplicating them
+    batch[0].hours_spent = 4.0
+    await sessions.save_many(batch[:1])
+
+    rows = list(await sessions.list_by_item(item_id))
+    assert len(rows) == 10
+    assert rows[0]["hours_spent"] == 4.0
+
+    # an explicit chunk_size=0 is rejected rather than replaced by the default
+    with pytest.raises(ValueError):
+        await sessions.save_many(batch, chunk_size=0)
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_save_many_rolls_back_whole_batch_on_error(tmp_path):
+    db = await open_db(tmp_path/"test.db")
+    sessions = SQLiteSessionRepository(db, chunk_size=2)
+    item_id = str(uuid4())
+
+    good = [Session(str(uuid4()), item_id, date(2025,8,d), 1.0) for d in range(1, 4)]
+    bad = Session(str(uuid4()), item_id, date(2025,8,5), None)  # float(None) fails
+    with pytest.raises(TypeError):
+        await sessions.save_many([*good, bad])
+
+    assert list(await sessions.list_by_item(item_id)) == []
+    await db.close()
+
+
+class CountingSessions(SQLiteSessionRepository):
+    rebuilds = 0
+
+    async def aggregate(self, item_id=None):
+        self.rebuilds += 1
+        return await super().aggregate(item_id)
+
+    async def distinct_dates(self, item_id=None, *, start=None, end=None):
+        self.ranges = getattr(self, "ranges", []) + [(start, end)]
+        return await super().distinct_dates(item_id, start=start, end=end)
+
+
+@pytest.mark.asyncio
+async def test_usecase_updates_item_rollups_incrementally(tmp_path):
+    db = await open_db(tmp_path/"test.db")
+    items = SQLiteItemRepository(db)
+    sessions = CountingSessions(db)
+    use = LogSessionUseCase(sessions, items, Config({}))
+
+    item_id = str(uuid4())
+    await items.save(Item(item_id=item_id, target_hours=10.0))
+
+    for d in (15, 16, 17):
+        saved = await use.execute(Session(str(uuid4()), item_id, date(2025,8,d), 2.0))
+
+    # first log has no stored state yet; the next two apply deltas
+    assert sessions.rebuilds == 1
+    assert saved.progress_pct == 60.0
+    assert saved.streak_current == 3
+    stored = await items.get_by_id(item_id)
+    assert stored["total_hours"] == 6.0
+    assert stored["streak_longest"] == 3
+    assert stored["last_session_date"] == "2025-08-17"
+
+    # upsert of an existing session forces a full rebuild
+    again = Session(saved.session_id, item_id, date(2025,8,17), 4.0)
+    saved = await use.execute(again)
+    assert sessions.rebuilds == 2
+    assert saved.progress_pct == 80.0
+
+    # back-dated sessions are merged into the stored StreakState, no rebuild
+    saved = await use.execute(Session(str(uuid4()), item_id, date(2025,8,13), 1.0))
+    assert sessions.rebuilds == 2
+    assert saved.streak_current == 1
+    saved = await use.execute(Session(str(uuid4()), item_id, date(2025,8,14), 1.0))
+    assert sessions.rebuilds == 2
+    assert saved.streak_current == 2
+    # repairs read a bounded window of days, never the whole history
+    assert all(start is not None and end is not None for start, end in sessions.ranges[-2:])
+    stored = await items.get_by_id(item_id)
+    assert stored["total_hours"] == 10.0
+    assert stored["streak_current"] == 5
+    assert stored["streak_longest"] == 5
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_streak_of_a_day_inside_the_current_run(tmp_path):
+    db = await open_db(tmp_path/"test.db")
+    try:
+        items = SQLiteItemRepository(db)
+        use = LogSessionUseCase(SQLiteSessionRepository(db), items, Config({}))
+        item_id = str(uuid4())
+        await items.save(Item(item_id=item_id, target_hours=50.0))
+        for d in range(1, 6):
+            await use.execute(Session(str(uuid4()), item_id, date(2025,8,d), 1.0))
+        # applied incrementally: Aug 3 is inside the Aug 1-5 run
+        saved = await use.execute(Session(str(uuid4()), item_id, date(2025,8,3), 1.0))
+        assert saved.streak_current == 3
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("minimal", [False, True])
+async def test_execute_many_matches_sequential_execute(tmp_path, minimal):
+    a, b, c = str(uuid4()), str(uuid4()), str(uuid4())
+    seeded = [Session(str(uuid4()), a, date(2025,8,d), 1.0) for d in (3, 4)]
+    seeded += [Session(str(uuid4()), c, date(2025,8,d), 1.5) for d in (10, 11)]
+    batch = [
+        Session(str(uuid4()), a, date(2025,8,5), 2.0),
+        Session(str(uuid4()), b, date(2025,8,1), 1.0, status="completed"),
+        Session(str(uuid4()), c, date(2025,8,12), 0.5),  # c: all new, in order
+        Session(str(uuid4()), a, date(2025,8,2), 0.5),  # back-dated: joins 3..5 later
+        Session(str(uuid4()), b, date(2025,8,2), 3.0, difficulty="advanced"),
+        Session(str(uuid4()), c, date(2025,8,12), 1.0),
+        Session(str(uuid4()), a, date(2025,7,30), 1.0),
+    ]
+    if not minimal:
+        # upserts: a stored session moved to another day, and a batch duplicate
+        batch.append(Session(seeded[1].session_id, a, date(2025,8,6), 4.0))
+        batch.append(Session(batch[1].session_id, b, date(2025,8,3), 2.0))
+
+    async def run(path, many):
+        db = await open_db(path)
+        try:
+            items = SQLiteItemRepository(db)
+            sessions = MinimalSessions() if minimal else SQLiteSessionRepository(db)
+            use = LogSessionUseCase(sessions, items, Config({}))
+            for item_id, target in ((a, 10.0), (b, 5.0), (c, 4.0)):
+                await items.save(Item(item_id=item_id, target_hours=target))
+            for s in seeded:
+                await use.execute(s)
+            if many:
+                results = await use.execute_many(batch)
+            else:
+                results = [await use.execute(s) for s in batch]
+            return results, [await items.get_by_id(i) for i in (a, b, c)]
+        finally:
+            await db.close()
+
+    sequential, seq_items = await run(tmp_path/"seq.db", False)
+    batched, batch_items = await run(tmp_path/"batch.db", True)
+    assert batched == sequential
+    assert batch_items == seq_items
+    assert [r.streak_current for r in batched[:7]] == [3, 1, 3, 1, 2, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_reads_each_item_once_and_validates_first(tmp_path):
+    db = await open_db(tmp_path/"test.db")
+    try:
+        items = SQLiteItemRepository(db)
+        reads = []
+        get_by_id = items.get_by_id
+
+        async def counting_get(item_id):
+            reads.append(item_id)
+            return await get_by_id(item_id)
+
+        items.get_by_id = counting_get
+        sessions = SQLiteSessionRepository(db)
+        use = LogSessionUseCase(sessions, items, Config({}))
+        item_id = str(uuid4())
+        await items.save(Item(item_id=item_id, target_hours=5.0))
+
+        batch = [Session(str(uuid4()), item_id, date(2025,8,d), 1.0) for d in range(1, 6)]
+        with pytest.raises(ValueError):
+            await use.execute_many([*batch, Session(str(uuid4()), item_id, date(2025,8,9), 0.0)])
+        assert (await sessions.aggregate(item_id)).session_count == 0
+
+        results = await use.execute_many(batch)
+        assert reads == [item_id]
+        assert [r.progress_pct for r in results] == [20.0, 40.0, 60.0, 80.0, 100.0]
+        assert (await items.get_by_id(item_id))["streak_current"] == 5
+        assert await use.execute_many([]) == []
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_session_aggregates_in_sql(tmp_path):
+    db = await open_db(tmp_path/"test.db")
+    sessions = SQLiteSessionRepository(db)
+    a, b = str(uuid4()), str(uuid4())
+    await sessions.save_many([
+        Session(str(uuid4()), a, date(2025,8,1), 1.0, points_awarded=1.0),
+        Session(str(uuid4()), a, date(2025,8,1), 2.0, points_awarded=2.6),
+        Session(str(uuid4()), a, date(2025,8,3), 0.5, points_awarded=0.5),
+        Session(str(uuid4()), b, date(2025,8,2), 3.0, points_awarded=3.0),
+    ])
+
+    agg = await sessions.aggregate(a)
+    assert agg.item_id == a
+    assert agg.session_count == 3
+    assert agg.total_hours == 3.5
+    assert agg.total_points == pytest.approx(4.1)
+    assert agg.first_session_date == date(2025,8,1)
+    assert agg.last_session_date == date(2025,8,3)
+
+    overall = await sessions.aggregate()
+    assert overall.item_id is None
+    assert overall.session_count == 4
+    assert overall.total_hours == 6.5
+
+    by_item = await sessions.aggregate_by_item()
+    assert set(by_item) == {a, b}
+    assert by_item[b].total_hours == 3.0
+
+    assert await sessions.distinct_dates(a) == [date(2025,8,1), date(2025,8,3)]
+    assert await sessions.distinct_dates() == [date(2025,8,d) for d in (1, 2, 3)]
+
+    empty = await sessions.aggregate(str(uuid4()))
+    assert empty.session_count == 0 and empty.total_hours == 0.0
+    assert empty.last_session_date is None
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_by_item_streams_in_keyset_pages(tmp_path):
+    from core.services.progress import accumulate_hours, accumulate_hours_async
+    from core.services.streaks import streaks_from_sessions, streaks_from_sessions_async
+
+    db = await open_db(tmp_path/"test.db")
+    sessions = SQLiteSessionRepository(db)
+    a, b = str(uuid4()), str(uuid4())
+    # several sessions share a date so pages must break ties on session_id
+    batch = [Session(str(uuid4()), a, date(2025,8,1 + i // 3), 0.5 + (i % 4)) for i in range(25)]
+    batch += [Session(str(uuid4()), b, date(2025,8,1), 1.0) for _ in range(4)]
+    await sessions.save_many(batch)
+
+    streamed = [r async for r in sessions.iter_by_item(a, batch_size=2, page_size=5)]
+    expected = sorted((r for r in await sessions.list_by_item(a)),
+                      key=lambda r: (r["session_date"], r["session_id"]))
+    assert streamed == expected
+
+    everything = [r async for r in sessions.iter_all(batch_size=3, page_size=4)]
+    assert len(everything) == 29
+    keys = [(r["session_date"], r["session_id"]) for r in everything]
+    assert keys == sorted(keys) and len(set(keys)) == 29
+
+    rows = list(await sessions.list_by_item(a))
+    assert await accumulate_hours_async(sessions.iter_by_item(a, page_size=7)) == accumulate_hours(rows)
+    assert (await streaks_from_sessions_async(sessions.iter_by_item(a), today="2025-08-09")
+            == streaks_from_sessions(rows, today="2025-08-09"))
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_sessions_load_into_schema_frames_in_chunks(tmp_path):
+    import pandas as pd
+    from core.dataframes.schemas import SESSIONS_SCHEMA, coerce_sessions_df
+
+    db = await open_db(tmp_path/"test.db")
+    try:
+        sessions = SQLiteSessionRepository(db)
+        assert (await sessions.load_frame()).empty
+        a, b = str(uuid4()), str(uuid4())
+        batch = [Session(str(uuid4()), a, date(2025,8,1 + i // 3), 0.5 + (i % 4)) for i in range(11)]
+        batch += [Session(str(uuid4()), b, date(2025,8,2), 1.0, language_code=None) for _ in range(3)]
+        await sessions.save_many(batch)
+
+        chunks = [f async for f in sessions.iter_frames(chunk_size=4)]
+        assert [len(f) for f in chunks] == [4, 4, 4, 2]
+        frame = await sessions.load_frame(chunk_size=4)
+        assert list(frame.index) == list(range(14))
+        assert {c: str(t) for c, t in frame.dtypes.items()} == {
+            c: str(pd.api.types.pandas_dtype(t)) for c, t in SESSIONS_SCHEMA.items()
+        }
+
+        # same content as going through the dict rows
+        rows = pd.DataFrame([r async for r in sessions.iter_all()])
+        expected = coerce_sessions_df(rows.rename(columns={"hours_spent": "hour_spent"}))
+        tracking = ["updated_at", "version"]
+        pd.testing.assert_frame_equal(frame.drop(columns=tracking), expected.drop(columns=tracking))
+        assert frame["version"].eq(1).all() and frame["updated_at"].notna().all()
+        assert frame["tags"].tolist() == [[]] * 14
+
+        only_a = await sessions.load_frame(a, chunk_size=5)
+        assert len(only_a) == 11 and set(only_a["item_id"]) == {a}
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_sql_streaks_match_python(tmp_path):
+    import random
+    from datetime import timedelta
+    from core.services.streaks import get_streak
+
+    db = await open_db(tmp_path/"test.db")
+    sessions = SQLiteSessionRepository(db)
+    rnd = random.Random(11)
+    base = date(2025, 1, 1)
+    by_item = {}
+    batch = []
+    for n in range(40):
+        item_id = f"item-{n}"
+        days = [base + timedelta(days=rnd.randrange(60)) for _ in range(rnd.randrange(1, 30))]
+        by_item[item_id] = days
+        batch += [Session(str(uuid4()), item_id, d, 1.0) for d in days]
+    await sessions.save_many(batch)
+
+    for today in (base + timedelta(days=k) for k in (10, 30, 59, 80)):
+        result = await sessions.streaks_by_item(today=today)
+        for item_id, days in by_item.items():
+            expected = get_streak(days, today=today)
+            assert result.get(item_id, {"current": 0, "longest": 0}) == expected
+        overall = await sessions.streak(today=today)
+        assert overall == get_streak([d for ds in by_item.values() for d in ds], today=today)
+
+    subset = await sessions.streaks_by_item(["item-1", "item-2", "missing"], today=base + timedelta(days=59))
+    assert set(subset) == {"item-1", "item-2"}
+    assert await sessions.streak("missing", today=base) == {"current": 0, "longest": 0}
+    assert await sessions.streaks_by_item([]) == {}
+    await db.close()
+
+@pytest.mark.asyncio
+async def test_gamification_state_sql_matches_dataframe(tmp_path):
+    import random
+    from datetime import timedelta
+    import pandas as pd
+    from core.services.gamification import gamification_from_df
+
+    db = await open_db(tmp_path/"test.db")
+    sessions = SQLiteSessionRepository(db)
+    rnd = random.Random(12)
+    base = date(2025, 1, 1)
+    batch = [
+        Session(str(uuid4()), f"item-{rnd.randrange(15)}", base + timedelta(days=rnd.randrange(60)),
+                rnd.choice([0.5, 1.0, 1.25, 2.0]), language_code=rnd.choice(["python", "go", "rust"]),
+                points_awarded=rnd.choice([3.5, 10.0, 12.25]))
+        for _ in range(300)
+    ]
+    await sessions.save_many(batch)
+    df = pd.DataFrame([vars(s) for s in batch])
+
+    for today in (base + timedelta(days=k) for k in (5, 30, 59, 90)):
+        sql = await sessions.gamification_state(today=today)
+        expected = gamification_from_df(df, today=today)
+        assert sql.weekly_hours == pytest.approx(expected.weekly_hours)
+        assert sql.total_hours == pytest.approx(expected.total_hours)
+        assert sql.model_copy(update={"weekly_hours": 0.0, "total_hours": 0.0}) == \
+            expected.model_copy(update={"weekly_hours": 0.0, "total_hours": 0.0})
+    await db.close()
+
+
+class MinimalSessions(SessionRepository):
+    """Implements only the required SessionRepository methods."""
+
+    def __init__(self):
+        self.rows = []
+
+    async def save(self, session):
+        self.rows.append(session)
+        return session
+
+    async def save_many(self, sessions):
+        return [await self.save(s) for s in sessions]
+
+    async def list_by_item(self, item_id):
+        return [s for s in self.rows if s.item_id == item_id]
+
+
+@pytest.mark.asyncio
+async def test_usecase_works_with_minimal_session_repository(tmp_path):
+    from ports.repositories import SessionAggregates, SessionExistence
+
+    db = await open_db(tmp_path/"test.db")
+    try:
+        items = SQLiteItemRepository(db)
+        sessions = MinimalSessions()
+        assert not isinstance(sessions, (SessionAggregates, SessionExistence))
+        use = LogSessionUseCase(sessions, items, Config({}))
+        item_id = str(uuid4())
+        await items.save(Item(item_id=item_id, target_hours=4.0))
+        for d in (15, 16):
+            await use.execute(Session(str(uuid4()), item_id, date(2025, 8, d), 1.0))
+        item = await items.get_by_id(item_id)
+        assert item["total_hours"] == 2.0
+        assert item["streak_longest"] == 2
+        assert isinstance(SQLiteSessionRepository(db), SessionAggregates)
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_sql_streaks_accept_datetime_anchor(tmp_path):
+    from datetime import datetime
+    from core.services.streaks import get_streak
+
+    db = await open_db(tmp_path/"test.db")
+    try:
+        sessions = SQLiteSessionRepository(db)
+        days = [date(2025, 1, d) for d in (1, 2, 3)]
+        await sessions.save_many([Session(str(uuid4()), "item", d, 1.0) for d in days])
+        for hour in (0, 11, 15, 23):
+            anchor = datetime(2025, 1, 3, hour)
+            expected = get_streak(days, today=anchor)
+            assert expected == {"current": 3, "longest": 3}
+            assert (await sessions.streaks_by_item(today=anchor))["item"] == expected
+            assert await sessions.streak(today=anchor) == expected
+            assert (await sessions.gamification_state(today=anchor)).streak_days == 3
+    finally:
+        await db.close()
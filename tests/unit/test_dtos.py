@@ -4,9 +4,11 @@
 # Description: Unit test verifying data transfer objects (DTOs). Enforces immutability and schema validation for shared data structures.
 # Role: Infrastructure/UI/Tests/Config
 
+import json
 from datetime import date
 from uuid import uuid4
 import pytest
+from pydantic import ValidationError
 
 from core.types.dtos import (
     SessionDTO,
@@ -15,6 +17,7 @@ from core.types.dtos import (
     PreferencesDTO,
     SnapshotDTO,
     GamificationStateDTO,
+    validate_sessions,
 )
 from core.types.enums import Difficulty, ItemType, SessionStatus, Theme, PublishStatus
 
@@ -115,3 +118,43 @@ def test_snapshot_defaults():
     assert snap.sessions == []
     assert isinstance(snap.gamification_state, GamificationStateDTO)
     assert snap.preferences.timezone == "America/Chicago"
+
+
+def test_validate_sessions_matches_per_session_validation():
+    item_id = str(uuid4())
+    rows = [
+        {
+            "session_id": str(uuid4()),
+            "item_id": item_id,
+            "language_code": "py",
+            "session_date": f"2025-08-{d:02d}",
+            "hour_spent": 1.37 * d,
+            "difficulty": "advanced",
+            "status": "cancelled" if d == 3 else "completed",
+            "tags": [" a ", ""],
+            "points_awarded": 2.0,
+        }
+        for d in range(1, 5)
+    ]
+    expected = [SessionDTO(**r) for r in rows]
+    strip = {"created_at", "updated_at"}
+    for batch in (validate_sessions(rows), validate_sessions(json.dumps(rows))):
+        assert [s.model_dump(exclude=strip) for s in batch] == [
+            s.model_dump(exclude=strip) for s in expected
+        ]
+    assert validate_sessions(b"[]") == []
+
+
+def test_validate_sessions_reports_every_bad_position():
+    good = {
+        "item_id": str(uuid4()),
+        "language_code": "py",
+        "session_date": "2025-08-01",
+        "hour_spent": 1.0,
+        "difficulty": "beginner",
+        "status": "completed",
+    }
+    bad = [good, {**good, "hour_spent": 30.0}, good, {**good, "points_awarded": -1}]
+    with pytest.raises(ValidationError) as exc:
+        validate_sessions(bad)
+    assert sorted({e["loc"][0] for e in exc.value.errors()}) == [1, 3]
@@ -0,0 +1,63 @@
+# tests/unit/test_gamification.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Unit test for the gamification rollup engine. Checks the one-pass DataFrame path against the incremental rollup.
+# Role: Infrastructure/UI/Tests/Config
+
+from datetime import date
+
+import pandas as pd
+
+from core.services.gamification import GamificationRollup, gamification_from_df
+from core.types.dtos import GamificationStateDTO
+
+TODAY = date(2025, 8, 20)
+
+ROWS = [
+    {"item_id": "a", "session_date": "2025-08-01", "hours_spent": 1.0, "points_awarded": 10.0, "language_code": "en"},
+    {"item_id": "a", "session_date": "2025-08-14", "hours_spent": 2.0, "points_awarded": 20.0, "language_code": "en"},
+    {"item_id": "b", "session_date": "2025-08-18", "hours_spent": 0.5, "points_awarded": 5.5, "language_code": "es"},
+    {"item_id": "b", "session_date": "2025-08-19", "hours_spent": None, "points_awarded": 1.0, "language_code": None},
+    {"item_id": "c", "session_date": "2025-08-20", "hours_spent": 1.5, "points_awarded": 7.25, "language_code": "es"},
+    {"item_id": "c", "session_date": "2025-08-21", "hours_spent": 4.0, "points_awarded": 1.0, "language_code": "fr"},
+]
+
+
+def test_empty_frame_is_default_state():
+    df = pd.DataFrame(columns=["item_id", "session_date", "hours_spent"])
+    assert gamification_from_df(df, today=TODAY) == GamificationStateDTO()
+
+
+def test_df_fills_every_field():
+    state = gamification_from_df(pd.DataFrame(ROWS), today=TODAY)
+    assert state.total_points == 44.75
+    assert state.total_sessions == 6
+    assert state.total_hours == 9.0
+    assert state.total_items == 3
+    assert state.total_languages == 3
+    # window 2025-08-14..2025-08-20; the 08-21 session is in the future
+    assert state.weekly_sessions == 4
+    assert state.weekly_hours == 4.0
+    assert state.streak_days == 3
+    assert state.last_session_date == date(2025, 8, 21)
+
+
+def test_schema_column_name_hour_spent_is_accepted():
+    df = pd.DataFrame(ROWS).rename(columns={"hours_spent": "hour_spent"})
+    assert gamification_from_df(df, today=TODAY).total_hours == 9.0
+
+
+def test_incremental_rollup_matches_df():
+    rollup = GamificationRollup()
+    for row in ROWS:
+        rollup.add(row)
+    expected = gamification_from_df(pd.DataFrame(ROWS), today=TODAY)
+    assert rollup.snapshot(today=TODAY) == expected
+
+
+def test_seeded_rollup_continues_incrementally():
+    seeded = GamificationRollup.from_df(pd.DataFrame(ROWS[:3]))
+    for row in ROWS[3:]:
+        seeded.add(row)
+    expected = gamification_from_df(pd.DataFrame(ROWS), today=TODAY)
+    assert seeded.snapshot(today=TODAY) == expected
@@ -4,8 +4,10 @@
 # Description: Unit test for core points calculation logic. Checks formulas involving hours × difficulty × status remain correct.
 # Role: Infrastructure/UI/Tests/Config
 
+import numpy as np
+import pandas as pd
 import pytest
-from core.services.points import compute_points, DEFAULT_WEIGHTS
+from core.services.points import compute_points, compute_points_batch, DEFAULT_WEIGHTS
 from core.types.enums import Difficulty, SessionStatus
 
 
@@ -78,3 +80,49 @@ def test_default_weights_immutable():
     
     # Verify DEFAULT_WEIGHTS remained unchanged
     assert DEFAULT_WEIGHTS == original_weights
+
+
+def _grid():
+    rng = np.random.default_rng(7)
+    n = 5000
+    hours = np.concatenate([np.arange(1, 97) / 4, rng.uniform(0, 24, n)])
+    diffs = rng.choice(list(Difficulty), len(hours))
+    stats = rng.choice(list(SessionStatus), len(hours))
+    return hours, diffs, stats
+
+
+@pytest.mark.parametrize("weights", [DEFAULT_WEIGHTS, {}, {Difficulty.expert: 3.3, Difficulty.beginner: 0.7}])
+def test_compute_points_batch_matches_scalar(weights):
+    """Batch results must be bit-identical to the scalar function."""
+    hours, diffs, stats = _grid()
+    expected = [compute_points(h, d, s, weights) for h, d, s in zip(hours, diffs, stats)]
+    got = compute_points_batch(hours, diffs, stats, weights)
+    assert got.tolist() == expected
+
+
+def test_compute_points_batch_tie_rounding():
+    """0.25 * 1.3 == 0.325 rounds like the builtin, not like np.round."""
+    got = compute_points_batch([0.25, 0.75], ["intermediate"] * 2, ["completed"] * 2)
+    assert got.tolist() == [compute_points(0.25, Difficulty.intermediate, SessionStatus.completed),
+                            compute_points(0.75, Difficulty.intermediate, SessionStatus.completed)]
+
+
+def test_compute_points_batch_from_sessions_df():
+    """DataFrame input uses the SESSIONS_SCHEMA columns and keeps the index."""
+    df = pd.DataFrame({
+        "hour_spent": pd.array([1.0, 2.5, 3.0, None], dtype="Float64"),
+        "difficulty": pd.array(["beginner", "intermediate", "expert", "advanced"], dtype="string"),
+        "status": pd.array(["completed", "completed", "cancelled", "completed"], dtype="string"),
+    }, index=[10, 11, 12, 13])
+    points = compute_points_batch(df)
+    assert list(points.index) == [10, 11, 12, 13]
+    assert points.name == "points_awarded"
+    assert points.iloc[:3].tolist() == [1.0, 3.25, 0.0]
+    assert np.isnan(points.iloc[3])
+
+
+def test_compute_points_batch_validates_input():
+    with pytest.raises(TypeError):
+        compute_points_batch([1.0])
+    with pytest.raises(ValueError):
+        compute_points_batch([1.0, 2.0], ["beginner"], ["completed"])
@@ -8,10 +8,13 @@ from dataclasses import dataclass
 import pytest
 from core.services.progress import (
     accumulate_hours,
+    accumulate_hours_async,
     compute_progress,
     progress_from_sessions,
+    progress_from_aggregate,
     ProgressReport,
 )
+from core.types.dtos import SessionAggregateDTO
 
 
 @dataclass
@@ -101,3 +104,20 @@ def test_progress_report_immutability():
     report = ProgressReport(total_hours=5.0, target_hours=10.0, percent_complete=50.0)
     with pytest.raises(AttributeError):
         report.total_hours = 6.0  # Should raise error due to frozen=True
+
+
+def test_progress_from_aggregate():
+    """Test progress computation from a SQL-side aggregate instead of rows."""
+    agg = SessionAggregateDTO(item_id="x", session_count=3, total_hours=7.5)
+    assert progress_from_aggregate(agg, target_hours=10.0) == ProgressReport(7.5, 10.0, 75.0)
+    assert progress_from_aggregate(SessionAggregateDTO(), 10.0) == ProgressReport(0.0, 10.0, 0.0)
+
+
+@pytest.mark.anyio
+async def test_accumulate_hours_async():
+    """Test accumulating hours from an async stream of dict rows."""
+    async def rows():
+        for h in (1.5, 2.0, 0.5):
+            yield {"hours_spent": h}
+
+    assert await accumulate_hours_async(rows()) == 4.0
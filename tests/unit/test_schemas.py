@@ -17,7 +17,9 @@ from core.dataframes.schemas import (
     append_session,
     append_item,
     append_language,
+    append_sessions,
     append_sessions_from_iterable,
+    sessions_df_from_dtos,
     empty_sessions_df,
     empty_items_df,
     empty_languages_df,
@@ -122,6 +124,47 @@ def test_append_sessions_from_iterable():
     assert df["hour_spent"].iloc[1] == 2.0
 
 
+def _mixed_sessions(n):
+    now = datetime.now(timezone.utc)
+    return [
+        SessionDTO(
+            item_id=uuid4(),
+            language_code=("py", "js")[i % 2],
+            session_date=date(2025, 1, 1 + i % 28),
+            hour_spent=0.5 * (i % 48 + 1),
+            difficulty=Difficulty.beginner,
+            status=SessionStatus.completed,
+            tags=["a", "b"] if i % 3 == 0 else [],
+            topic="t" if i % 2 else None,
+            session_number=i if i % 2 else None,
+            started_at=now if i % 2 else None,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+def test_bulk_builder_matches_row_by_row_append():
+    sessions = _mixed_sessions(7)
+    expected = empty_sessions_df()
+    for s in sessions:
+        expected = append_session(expected, s)
+    pd.testing.assert_frame_equal(sessions_df_from_dtos(iter(sessions)), expected)
+
+
+def test_bulk_builder_empty_input_keeps_schema():
+    pd.testing.assert_frame_equal(sessions_df_from_dtos([]), empty_sessions_df())
+
+
+def test_append_sessions_in_batches():
+    sessions = _mixed_sessions(6)
+    df = append_sessions(empty_sessions_df(), sessions[:4])
+    df = append_sessions(df, sessions[4:])
+    df = append_sessions(df, [])
+    pd.testing.assert_frame_equal(df, sessions_df_from_dtos(sessions))
+
+
 def test_coerce_sessions_df():
     # Test with a malformed dataframe
     df = pd.DataFrame({
@@ -178,3 +221,75 @@ def test_coerce_languages_df():
     df_coerced = coerce_languages_df(df)
     assert df_coerced["code"].dtype == "string"
     assert df_coerced["name"].dtype == "string"
+
+
+def test_coercion_plan_is_compiled_once_per_schema():
+    from core.dataframes.schemas import SESSIONS_SCHEMA, coercion_plan
+    assert coercion_plan(SESSIONS_SCHEMA) is coercion_plan(dict(SESSIONS_SCHEMA))
+
+
+def test_coerce_inplace_skips_matching_columns():
+    df = sessions_df_from_dtos(_mixed_sessions(5))
+    hours = df["hour_spent"].array
+    created = df["created_at"].array
+    out = coerce_sessions_df(df, inplace=True)
+    assert out is df
+    assert out["hour_spent"].array is hours
+    assert out["created_at"].array is created
+
+
+def test_coerce_default_leaves_input_untouched():
+    df = pd.DataFrame({
+        "hour_spent": ["1.5", "2"],
+        "created_at": [datetime(2025, 1, 1, 12, tzinfo=timezone.utc), "2025-01-02T00:00:00+02:00"],
+    })
+    out = coerce_sessions_df(df)
+    assert df["hour_spent"].dtype == object
+    assert out["hour_spent"].tolist() == [1.5, 2.0]
+    assert str(out["created_at"].dtype) == "datetime64[ns, UTC]"
+    assert out["created_at"].iloc[1] == pd.Timestamp("2025-01-01T22:00:00Z")
+    assert list(out.columns) == list(empty_sessions_df().columns)
+
+
+def test_coerce_inplace_converts_mismatched_columns():
+    df = sessions_df_from_dtos(_mixed_sessions(3))
+    df["version"] = df["version"].astype("float64")
+    df["started_at"] = df["started_at"].dt.tz_convert("Europe/Madrid")
+    out = coerce_sessions_df(df, inplace=True)
+    assert out is df
+    assert out["version"].dtype == "Int64"
+    assert str(out["started_at"].dtype) == "datetime64[ns, UTC]"
+
+
+def test_compact_sessions_round_trip_and_dtypes():
+    from core.dataframes.schemas import (
+        empty_compact_sessions_df,
+        from_compact_sessions_df,
+        to_compact_sessions_df,
+    )
+    df = sessions_df_from_dtos(_mixed_sessions(9))
+    compact = to_compact_sessions_df(df)
+    assert isinstance(compact["difficulty"].dtype, pd.CategoricalDtype)
+    assert list(compact["status"].cat.categories) == [s.value for s in SessionStatus]
+    assert isinstance(compact["item_id"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(from_compact_sessions_df(compact), df)
+    assert list(empty_compact_sessions_df().dtypes) == list(to_compact_sessions_df(empty_sessions_df()).dtypes)
+
+
+def test_sessions_memory_report_shows_savings():
+    from core.dataframes.schemas import sessions_memory_report
+    report = sessions_memory_report(sessions_df_from_dtos(_mixed_sessions(200)))
+    assert report.loc["total", "compact_bytes"] < report.loc["total", "standard_bytes"]
+    assert report.loc["difficulty", "saved_pct"] > 50
+    assert report.loc["hour_spent", "saved_pct"] == 0
+
+
+def test_compact_sessions_reject_values_outside_enums():
+    from core.dataframes.schemas import to_compact_sessions_df
+
+    df = sessions_df_from_dtos(_mixed_sessions(3))
+    df.loc[1, "difficulty"] = "Beginner"
+    with pytest.raises(ValueError, match="Beginner"):
+        to_compact_sessions_df(df)
+    df.loc[1, "difficulty"] = None  # missing stays missing
+    assert to_compact_sessions_df(df)["difficulty"].isna().sum() == 1
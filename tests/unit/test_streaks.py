@@ -6,11 +6,23 @@
 
 
 
-from datetime import date, datetime, timezone
+import random
+from datetime import date, datetime, timedelta, timezone
 from uuid import uuid4
+import numpy as np
 import pandas as pd
 import pytest
 
+from core.services.streaks import (
+    get_streak,
+    get_streak_vectorized,
+    streak_runs,
+    StreakState,
+    streak_states_by_item,
+    run_containing,
+    streaks_from_sessions,
+    streaks_from_sessions_async,
+)
 from core.types.dtos import SessionDTO, ItemDTO, LanguageDTO
 from core.types.enums import Difficulty, ItemType, SessionStatus
 from core.dataframes.schemas import (
@@ -179,3 +191,143 @@ def test_coerce_languages_df():
     assert df_coerced["code"].dtype == "string"
     assert df_coerced["name"].dtype == "string"
 
+
+
+# --- streak engine ---------------------------------------------------------
+
+async def _aiter(items):
+    for x in items:
+        yield x
+
+
+@pytest.mark.anyio
+async def test_streaks_from_sessions_async_matches_sync():
+    rows = [{"session_date": d} for d in (
+        "2025-08-01", "2025-08-02", "2025-08-02", "2025-08-03",
+        "2025-08-07", "2025-08-08", "2025-08-20",
+    )]
+    for today in ("2025-08-03", "2025-08-08", "2025-08-09", "2025-08-20", "2025-09-01"):
+        expected = streaks_from_sessions(rows, today=today)
+        assert await streaks_from_sessions_async(_aiter(rows), today=today) == expected
+
+
+@pytest.mark.anyio
+async def test_streaks_from_sessions_async_rejects_unordered():
+    rows = [{"session_date": "2025-08-02"}, {"session_date": "2025-08-01"}]
+    with pytest.raises(ValueError):
+        await streaks_from_sessions_async(_aiter(rows), today="2025-08-02")
+
+
+def test_vectorized_streaks_match_get_streak():
+    rng = np.random.default_rng(42)
+    base = date(2024, 1, 1)
+    for _ in range(200):
+        offsets = rng.integers(0, 60, rng.integers(0, 40))
+        dates = [base + timedelta(days=int(o)) for o in offsets]
+        today = base + timedelta(days=int(rng.integers(0, 70)))
+        assert get_streak_vectorized(dates, today=today) == get_streak(dates, today=today)
+
+
+def test_streak_runs_reports_every_run():
+    dates = ["2025-08-01", "2025-08-02", "2025-08-02", "2025-08-05", "2025-08-07", "2025-08-08", "2025-08-09"]
+    runs = streak_runs(dates, today="2025-08-09")
+    assert runs.runs == [(date(2025, 8, 1), 2), (date(2025, 8, 5), 1), (date(2025, 8, 7), 3)]
+    assert (runs.current, runs.longest) == (3, 3)
+    # future days are ignored, like get_streak
+    assert streak_runs(dates, today="2025-08-04").runs == [(date(2025, 8, 1), 2)]
+    assert streak_runs([], today="2025-08-04").runs == []
+
+
+def test_streak_runs_accepts_numpy_and_pandas_inputs():
+    arr = np.arange("2025-01-01", "2025-03-01", dtype="datetime64[D]")
+    assert get_streak_vectorized(arr, today="2025-02-28") == {"current": 59, "longest": 59}
+    ts = pd.Series(pd.to_datetime(["2025-01-01 23:30", "2025-01-02 01:00", None]))
+    assert get_streak_vectorized(ts, today="2025-01-02") == {"current": 2, "longest": 2}
+    aware = pd.Series(pd.to_datetime(["2025-01-01 23:30"]).tz_localize("America/Chicago"))
+    assert get_streak_vectorized(aware, today="2025-01-01")["current"] == 1
+    mixed = [date(2025, 1, 1), datetime(2025, 1, 2, 9, tzinfo=timezone.utc), "2025-01-03"]
+    assert get_streak_vectorized(mixed, today="2025-01-03") == get_streak(mixed, today="2025-01-03")
+
+
+def test_streak_runs_ignores_missing_values_in_object_inputs():
+    expected = {"current": 2, "longest": 2}
+    for gap in (None, pd.NaT, float("nan"), pd.NA):
+        dates = [date(2025, 1, 1), gap, date(2025, 1, 2)]
+        assert get_streak_vectorized(dates, today="2025-01-02") == expected
+        assert get_streak_vectorized(["2025-01-01", gap, "2025-01-02"], today="2025-01-02") == expected
+    assert get_streak_vectorized([None, pd.NaT], today="2025-01-02") == {"current": 0, "longest": 0}
+
+
+def test_streak_state_in_order_and_out_of_order_match_get_streak():
+    rng = np.random.default_rng(3)
+    base = date(2024, 1, 1)
+    for _ in range(100):
+        days = [base + timedelta(days=int(o)) for o in rng.integers(0, 50, 30)]
+        state = StreakState()
+        for i, d in enumerate(days, start=1):
+            seen = days[:i]
+            if not state.add(d):
+                # repair from a window that holds the whole run through d
+                state.merge_run(*run_containing(d, seen))
+            last = max(seen)
+            assert state.last_date == last
+            assert {"current": state.current, "longest": state.longest} == get_streak(seen, today=last)
+        assert state == StreakState.from_dates(days)
+
+
+def test_streak_state_add_reports_days_needing_repair():
+    state = StreakState.from_dates(["2025-08-05", "2025-08-06", "2025-08-07"])
+    assert state.add("2025-08-06") and state.add("2025-08-05")  # inside current run
+    assert state.add("2025-08-04") is False  # may join an older run
+    assert state == StreakState.from_dates(["2025-08-05", "2025-08-06", "2025-08-07"])
+
+
+def test_run_containing():
+    days = ["2025-08-01", "2025-08-02", "2025-08-04", "2025-08-05", "2025-08-06"]
+    assert run_containing("2025-08-05", days) == (date(2025, 8, 4), date(2025, 8, 6))
+    assert run_containing("2025-08-01", days) == (date(2025, 8, 1), date(2025, 8, 2))
+    assert run_containing("2025-08-03", days) is None
+    assert run_containing("2025-08-03", []) is None
+
+
+def test_streak_state_tracks_longest_anchor_and_serializes():
+    state = StreakState()
+    history = []
+    for d in ("2025-08-01", "2025-08-02", "2025-08-03", "2025-08-10", "2025-08-11"):
+        history.append(d)
+        assert state.add(d)
+    assert (state.current, state.longest, state.longest_end) == (2, 3, date(2025, 8, 3))
+    for d in ("2025-07-20", "2025-07-21", "2025-07-22", "2025-08-09", "2025-08-08"):
+        history.append(d)
+        if not state.add(d):
+            state.merge_run(*run_containing(d, history))
+        if d == "2025-07-22":  # ties an older run; anchor stays on the newest one
+            assert state.longest_end == date(2025, 8, 3)
+    assert (state.current, state.longest, state.longest_end) == (4, 4, date(2025, 8, 11))
+    assert StreakState.from_json(state.to_json()) == state
+    assert set(state.to_dict()) == {"last_date", "current", "longest", "longest_end"}
+    assert StreakState.from_dict({}) == StreakState()
+
+
+def test_streak_states_by_item_match_from_dates():
+    rng = random.Random(11)
+    keys, dates = [], []
+    for key in "abcdefgh":
+        for _ in range(rng.randrange(1, 40)):
+            keys.append(key)
+            dates.append(date(2025, 1, 1) + timedelta(days=rng.randrange(50)))
+    keys.append("z")
+    dates.append(None)  # no usable date: key is absent
+    out = streak_states_by_item(keys, dates)
+    assert "z" not in out.index
+    for key, row in out.iterrows():
+        state = StreakState.from_dates([d for k, d in zip(keys, dates) if k == key])
+        assert (row["last_date"].date(), row["current"]) == (
+            state.last_date,
+            state.current,
+        )
+        assert (row["longest"], row["longest_end"].date()) == (
+            state.longest,
+            state.longest_end,
+        )
+    assert streak_states_by_item([], []).empty
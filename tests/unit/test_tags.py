@@ -0,0 +1,128 @@
+# tests/unit/test_tags.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Unit test for the list-typed tags column and the exploded tag index.
+# Role: Infrastructure/UI/Tests/Config
+
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+from uuid import uuid4
+
+import pandas as pd
+
+from core.dataframes.schemas import (
+    coerce_sessions_df,
+    empty_sessions_df,
+    sessions_df_from_dtos,
+)
+from core.dataframes.tags import TagIndex, tag_index
+from core.types.dtos import SessionDTO
+from core.types.enums import Difficulty, SessionStatus
+
+
+def _session(hours, tags):
+    return SessionDTO(
+        item_id=uuid4(),
+        language_code="py",
+        session_date=date(2025, 8, 1),
+        hour_spent=hours,
+        difficulty=Difficulty.beginner,
+        status=SessionStatus.completed,
+        tags=tags,
+    )
+
+
+def _frame():
+    return sessions_df_from_dtos(
+        [
+            _session(1.0, ["sql", "focus"]),
+            _session(2.0, []),
+            _session(0.5, ["focus"]),
+            _session(3.0, ["graphs", "sql"]),
+        ]
+    )
+
+
+def test_tags_column_holds_lists():
+    df = _frame()
+    assert df["tags"].tolist()[:2] == [["sql", "focus"], []]
+
+
+def test_legacy_comma_strings_are_coerced_to_lists():
+    df = pd.DataFrame({"tags": ["a, b", "", None]})
+    assert coerce_sessions_df(df)["tags"].tolist() == [["a", "b"], [], []]
+
+
+def test_missing_tags_column_is_filled_with_empty_lists():
+    df = coerce_sessions_df(pd.DataFrame({"hour_spent": [1.0, 2.0]}))
+    assert df["tags"].tolist() == [[], []]
+
+
+def test_sessions_with_tag_and_hours_per_tag():
+    df = _frame()
+    ix = TagIndex(df)
+    assert ix.tags == ["focus", "graphs", "sql"]
+    assert ix.positions("sql").tolist() == [0, 3]
+    assert ix.count("focus") == 2 and ix.count("missing") == 0
+    assert ix.sessions_with("focus")["hour_spent"].tolist() == [1.0, 0.5]
+    assert ix.sessions_with("missing").empty
+    assert ix.hours_per_tag().to_dict() == {"focus": 1.5, "graphs": 3.0, "sql": 4.0}
+    assert ix.exploded.groupby("tag").size().to_dict() == {
+        "focus": 2,
+        "graphs": 1,
+        "sql": 2,
+    }
+
+
+def test_tag_index_is_cached_until_columns_change():
+    df = _frame()
+    ix = tag_index(df)
+    assert tag_index(df) is ix
+    df["hour_spent"] = df["hour_spent"] * 2
+    rebuilt = tag_index(df)
+    assert rebuilt is not ix
+    assert rebuilt.hours_per_tag()["sql"] == 8.0
+
+
+def test_empty_frame_has_no_tags():
+    ix = TagIndex(empty_sessions_df())
+    assert ix.tags == []
+    assert ix.hours_per_tag().empty
+    assert ix.positions("x").size == 0
+
+
+# Run in a fresh interpreter: the tags dtype is fixed when schemas is imported
+_WITHOUT_PYARROW = """
+import sys
+import pandas as pd
+sys.modules["pyarrow"] = None  # schemas' optional import now fails
+from core.dataframes.schemas import TAGS_DTYPE, SESSIONS_SCHEMA, coerce_sessions_df
+from core.dataframes.schemas import from_compact_sessions_df, to_compact_sessions_df
+from core.dataframes.tags import TagIndex, tag_index
+assert str(TAGS_DTYPE) == "object" and SESSIONS_SCHEMA["session_id"] == "string"
+df = coerce_sessions_df(
+    pd.DataFrame({"tags": [["a", "b"], "a, c", None], "hour_spent": [1.0, 2.0, 4.0]})
+)
+assert df["tags"].dtype == object
+assert df["tags"].tolist() == [["a", "b"], ["a", "c"], []]
+assert TagIndex(df).hours_per_tag().to_dict() == {"a": 3.0, "b": 1.0, "c": 2.0}
+assert tag_index(df) is tag_index(df)
+cached = tag_index(df)
+df["tags"] = [["z"], [], []]
+assert tag_index(df) is not cached and tag_index(df).tags == ["z"]
+back = from_compact_sessions_df(to_compact_sessions_df(df))
+assert back["tags"].tolist() == df["tags"].tolist()
+"""
+
+
+def test_tags_fall_back_to_object_lists_without_pyarrow():
+    src = Path(__file__).resolve().parents[2] / "src"
+    result = subprocess.run(
+        [sys.executable, "-c", _WITHOUT_PYARROW],
+        cwd=src,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
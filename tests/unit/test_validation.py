@@ -0,0 +1,86 @@
+# tests/unit/test_validation.py
+# Author: Miguel Gonzalez Almonte
+# Created: 2025-08-17
+# Description: Unit test for the columnar sessions validator. Checks each SessionDTO rule flags exactly the offending rows.
+# Role: Infrastructure/UI/Tests/Config
+
+from datetime import date
+from uuid import uuid4
+
+import pandas as pd
+
+from core.dataframes.schemas import coerce_sessions_df, sessions_df_from_dtos
+from core.dataframes.validation import (
+    CANCELLED_NOT_ZEROED,
+    HOURS_NOT_QUARTER,
+    HOURS_OUT_OF_RANGE,
+    NEGATIVE_POINTS,
+    NEGATIVE_PROGRESS,
+    invalid_session_rows,
+    session_violations,
+)
+from core.types.dtos import SessionDTO
+from core.types.enums import Difficulty, SessionStatus
+
+
+def _frame(rows, index):
+    return coerce_sessions_df(pd.DataFrame(rows, index=index))
+
+
+def test_validated_dtos_pass():
+    dtos = [
+        SessionDTO(
+            item_id=uuid4(),
+            language_code="py",
+            session_date=date(2025, 8, 1),
+            hour_spent=hours,
+            difficulty=Difficulty.beginner,
+            status=status,
+            points_awarded=1.5,
+        )
+        for hours in (0.2, 1.37, 24.0)
+        for status in SessionStatus
+    ]
+    df = sessions_df_from_dtos(dtos)
+    assert session_violations(df) == {}
+    assert invalid_session_rows(df).empty
+
+
+def test_each_rule_reports_offending_labels():
+    rows = [
+        {"hour_spent": 1.25, "status": "completed", "points_awarded": 1.0},
+        {"hour_spent": 0.0, "status": "completed"},
+        {"hour_spent": 24.5, "status": "in_progress"},
+        {"hour_spent": None, "status": "completed"},
+        {"hour_spent": 1.3, "status": "completed"},
+        {"hour_spent": 1.0, "status": "completed", "points_awarded": -2.0},
+        {"hour_spent": 1.0, "status": "completed", "progress_pct": -1.0},
+        {"hour_spent": 0.0, "status": "cancelled"},
+        {"hour_spent": 2.0, "status": "cancelled"},
+        {"hour_spent": 0.0, "status": "cancelled", "points_awarded": 1.0},
+    ]
+    df = _frame(rows, [f"r{i}" for i in range(len(rows))])
+
+    found = {rule: list(labels) for rule, labels in session_violations(df).items()}
+    assert found == {
+        HOURS_OUT_OF_RANGE: ["r1", "r2", "r3"],
+        HOURS_NOT_QUARTER: ["r4"],
+        NEGATIVE_POINTS: ["r5"],
+        NEGATIVE_PROGRESS: ["r6"],
+        CANCELLED_NOT_ZEROED: ["r8", "r9"],
+    }
+    assert list(invalid_session_rows(df)) == [
+        "r1",
+        "r2",
+        "r3",
+        "r4",
+        "r5",
+        "r6",
+        "r8",
+        "r9",
+    ]
+
+
+def test_sqlite_shaped_frames_use_hours_spent():
+    df = pd.DataFrame({"hours_spent": [1.0, 0.1], "status": ["completed", "completed"]})
+    assert list(invalid_session_rows(df)) == [1]